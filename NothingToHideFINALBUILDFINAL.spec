@@ -5,7 +5,7 @@ a = Analysis(
     ['Nothing_to_hide.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('assets', 'assets')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
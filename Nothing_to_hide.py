@@ -2,8 +2,20 @@ import time
 import os
 import sys
 import random
-import select
+import asyncio
+import contextlib
+import contextvars
+import functools
+import importlib.util
+import signal
+import struct
 import threading
+import _thread
+
+# Only needed by some runs, so imported where they are used: pygame, shutil,
+# tempfile, cProfile, pstats, argparse, audio_synth, conversation_pack and
+# judgment_log.
+# Check what an import costs with:  python benchmarks.py --imports
 # Unix-only imports - not available on Windows
 if os.name != 'nt':
     import termios
@@ -11,916 +23,863 @@ if os.name != 'nt':
 
 
 
-# Try to import pygame for sound
-try:
-    import pygame
-    pygame.mixer.init()
-    SOUND_ENABLED = True
-except ImportError:
-    SOUND_ENABLED = False
-    print("[WARNING] Pygame not found. Game will run without sound.")
-    print("Install with: pip install pygame or sudo apt install python3-pygame\n")
-    time.sleep(2)
+# pygame is only looked for here - it is imported when the first sound is made
+SOUND_ENABLED = importlib.util.find_spec("pygame") is not None
+_mixer = None  # pygame.mixer once initialized, False if it couldn't be
+_mixer_lock = threading.Lock()
+_pending_warnings = []  # Warnings from sound worker threads, shown by the game loop
+_warnings_lock = threading.Lock()
+
+def warn_later(message):
+    """Queue a warning from a worker thread - printing it would tear the screen being drawn"""
+    with _warnings_lock:
+        _pending_warnings.append(message)
+
+def print_pending_warnings():
+    """Print the queued warnings - call from the game loop once a screen is drawn"""
+    with _warnings_lock:
+        messages = _pending_warnings[:]
+        del _pending_warnings[:]
+    for message in messages:
+        terminal.print(f"[WARNING] {message}")
+
+def get_mixer():
+    """pygame.mixer, imported and initialized on first use - None if there is no sound"""
+    global _mixer
+    with _mixer_lock:
+        if _mixer is None and SOUND_ENABLED:
+            try:
+                import pygame
+                pygame.mixer.init()
+                _mixer = pygame.mixer
+            except Exception as e:
+                warn_later(f"Could not start sound: {e}")
+                _mixer = False
+        return _mixer or None
+
+# ============================================================================
+# SESSION STATE
+# ============================================================================
+
+class GameSession:
+    """One player's game: input, output, sound, randomness and progress
+
+    The game loop and every display function work on the current session,
+    which session_scope() sets for a thread or an asyncio task (and the tasks
+    it starts). Any number of sessions can run side by side - on threads or
+    as tasks on one event loop - without cross-talk.
+    """
+    def __init__(self, keyboard, terminal, geometry, sound=False, seed=None, save_file=None,
+                 judgment_log=None):
+        self.id = int.from_bytes(os.urandom(8), 'little')  # Tells sessions apart in judgment logs
+        self.keyboard = keyboard  # Input source - KeyboardHandler, ScriptedInput...
+        self.terminal = terminal  # Output sink
+        self.geometry = geometry
+        self.screen = ScreenBuffer(terminal)
+        geometry.on_resize(self.screen.request_relayout)
+        self.sound = sound  # Play sound through the pygame mixer
+        self.rng = random.Random(seed)
+        self.save_file = save_file
+        self.judgment_log = judgment_log  # JudgmentLog shared with other sessions, or None
+        self.progress = None  # Progress of the game being played
+        self.animation = None  # SkippableAnimation running now, if any
+
+    def run(self):
+        """Play one whole game on this thread - returns the ending"""
+        with session_scope(self):
+            return asyncio.run(play_game())
+
+def current_session():
+    """The GameSession of the current thread or task"""
+    return _session.get()
+
+@contextlib.contextmanager
+def session_scope(session):
+    """Make `session` current for this context - tasks started inside inherit it"""
+    token = _session.set(session)
+    try:
+        yield session
+    finally:
+        _session.reset(token)
+
+class SessionLocal:
+    """Module global standing for an attribute of the current session
 
-# Global flag for current animation state
-current_animation = None
-animation_lock = threading.Lock()
+    Lets code written against a single terminal, screen and keyboard work
+    unchanged for whichever session is current.
+    """
+    __slots__ = ('_name',)
+
+    def __init__(self, name):
+        object.__setattr__(self, '_name', name)
+
+    # Every attribute is forwarded - __getattribute__ skips the failed normal
+    # lookup that __getattr__ would pay for on each access
+    def __getattribute__(self, attr):
+        return getattr(getattr(_session.get(), _local_name(self)), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(getattr(_session.get(), _local_name(self)), attr, value)
+
+    def __bool__(self):
+        return bool(getattr(_session.get(), _local_name(self)))
+
+_local_name = SessionLocal._name.__get__
+
+keyboard_handler = SessionLocal('keyboard')
+geometry = SessionLocal('geometry')
+terminal = SessionLocal('terminal')
+screen = SessionLocal('screen')
+save_file = SessionLocal('save_file')
 
 # ============================================================================
 # KEYBOARD INPUT HANDLING
 # ============================================================================
 
 class KeyboardHandler:
-    """Handle non-blocking keyboard input"""
+    """Long-lived keyboard reader that owns the terminal for the whole session
+
+    A single thread reads key presses in cbreak mode and turns them into
+    events: 'S' during an animation sets the skip flag, and everything else is
+    line-edited into answers for read_line(). Animations only check a flag,
+    and terminal modes are switched once per session instead of per screen.
+    """
     def __init__(self):
         self.old_settings = None
-        self.monitoring = False
-        
-    def start_monitoring(self):
-        """Start monitoring keyboard input"""
-        if os.name == 'nt':  # Windows
-            import msvcrt
-            self.monitoring = True
-        else:  # Unix/Linux/Mac
+        self.thread = None
+        self.interactive = False  # False when stdin is not a terminal
+        self.skip_requested = threading.Event()
+        self.animating = False
+        self.reading_line = False
+        self.typed = []  # Characters of the line being typed
+        self.loop = None  # Event loop the game runs on
+        self.skip_wakeup = None  # Wakes sleeping animations when S is pressed
+        self.lines = None  # Finished lines (None at end of input)
+        self.lock = threading.Lock()
+
+    def start(self):
+        """Take over the keyboard - call from the game's event loop"""
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+            self.skip_wakeup = asyncio.Event()
+            self.lines = asyncio.Queue()
+        if self.thread is not None or not sys.stdin.isatty():
+            return
+        if os.name != 'nt':
             self.old_settings = termios.tcgetattr(sys.stdin)
             tty.setcbreak(sys.stdin.fileno())
-            self.monitoring = True
-    
-    def stop_monitoring(self):
-        """Stop monitoring keyboard input"""
+        self.interactive = True
+        self.thread = threading.Thread(target=self._read_keys, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Give the terminal back in the state we found it"""
         if os.name != 'nt' and self.old_settings:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
-        self.monitoring = False
-    
-    def check_for_skip(self):
-        """Check if 'S' key was pressed"""
-        if not self.monitoring:
-            return False
-            
+            self.old_settings = None
+
+    def _read_keys(self):
         if os.name == 'nt':  # Windows
             import msvcrt
-            if msvcrt.kbhit():
-                key = msvcrt.getch()
-                if key in [b's', b'S']:
-                    return True
+            while True:
+                key = msvcrt.getwch()
+                if key in ('\x00', '\xe0'):  # Arrow/function keys come in pairs
+                    msvcrt.getwch()
+                    continue
+                self._handle_key(key)
         else:  # Unix/Linux/Mac
-            if select.select([sys.stdin], [], [], 0)[0]:
-                key = sys.stdin.read(1)
+            import codecs
+            decoder = codecs.getincrementaldecoder(sys.stdin.encoding or 'utf-8')(errors='ignore')
+            fd = sys.stdin.fileno()
+            while True:
+                try:
+                    data = os.read(fd, 64)
+                except OSError:
+                    data = b''
+                if not data:
+                    self._post(self.lines.put_nowait, None)
+                    return
+                for key in decoder.decode(data):
+                    self._handle_key(key)
+
+    def _handle_key(self, key):
+        if key == '\x03':  # Ctrl+C read as a key (Windows) - interrupt the game
+            _thread.interrupt_main()
+            return
+        with self.lock:
+            if self.animating:
                 if key.lower() == 's':
-                    return True
+                    self.skip_requested.set()
+                    self._post(self.skip_wakeup.set)
+                return
+            # Outside animations keys are typed into a line, like a normal prompt
+            if key in ('\r', '\n'):
+                line = ''.join(self.typed)
+                self.typed.clear()
+                self._echo('\n')
+                self._post(self.lines.put_nowait, line)
+            elif key in ('\x7f', '\b'):
+                if self.typed:
+                    self.typed.pop()
+                    self._echo('\b \b')
+            elif key == '\x15':  # Ctrl+U - erase the whole line
+                self._echo('\b \b' * len(self.typed))
+                self.typed.clear()
+            elif key == '\x04' and not self.typed:  # Ctrl+D - end of input
+                self._post(self.lines.put_nowait, None)
+            elif key.isprintable():
+                self.typed.append(key)
+                self._echo(key)
+
+    def _post(self, callback, *args):
+        """Run callback on the event loop from the reader thread"""
+        try:
+            self.loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            pass  # The game's event loop has already closed
+
+    def _echo(self, text):
+        # Type-ahead is echoed once its prompt is shown
+        if self.reading_line:
+            terminal.write(text)
+            terminal.flush()
+
+    def typed_text(self):
+        """Part of the current line typed so far"""
+        with self.lock:
+            return ''.join(self.typed)
+
+    async def read_line(self, prompt=""):
+        """Show a prompt and wait for a line of input, like input()"""
+        terminal.write(prompt)
+        terminal.flush()
+        if not self.interactive:
+            line = await asyncio.get_running_loop().run_in_executor(None, sys.stdin.readline)
+            if not line:
+                raise EOFError
+            return line.rstrip('\r\n')
+        with self.lock:
+            self.reading_line = True
+            self._echo(''.join(self.typed))
+        try:
+            line = await self.lines.get()
+        finally:
+            with self.lock:
+                self.reading_line = False
+        if line is None:
+            raise EOFError
+        return line
+
+    def begin_animation(self):
+        """Start listening for the skip key"""
+        with self.lock:
+            self.skip_requested.clear()
+            if self.skip_wakeup:
+                self.skip_wakeup.clear()
+            self.animating = True
+
+    def end_animation(self):
+        """Stop listening for the skip key and drop anything typed meanwhile"""
+        with self.lock:
+            self.animating = False
+            self.typed.clear()
+            while self.lines and not self.lines.empty():
+                self.lines.get_nowait()
+
+    def check_for_skip(self):
+        """Check if 'S' key was pressed"""
+        return self.skip_requested.is_set()
+
+    async def wait_for_skip(self, timeout):
+        """Sleep for up to `timeout` seconds, waking early if 'S' is pressed"""
+        if self.skip_wakeup is None:
+            await asyncio.sleep(timeout)
+            return
+        try:
+            await asyncio.wait_for(self.skip_wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+class ScriptedInput:
+    """Headless stand-in for the keyboard - answers come from a script
+
+    `answers` is either a sequence of lines, or a function that is given each
+    prompt and returns the line to type. With `skip` set, every animation
+    counts as skipped the moment it starts, so all delays are no-ops.
+    """
+    interactive = False
+
+    def __init__(self, answers, skip=True):
+        self.skip = skip
+        if callable(answers):
+            self.answer = answers
+        else:
+            remaining = iter(answers)
+            self.answer = lambda prompt: next(remaining)
+        self.prompts = 0  # Number of prompts answered so far
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def typed_text(self):
+        return ""
+
+    async def read_line(self, prompt=""):
+        """Answer a prompt from the script - EOFError, naming the prompt, once the script runs out"""
+        try:
+            line = self.answer(prompt)
+        except StopIteration:
+            raise EOFError(prompt.strip()) from None
+        self.prompts += 1
+        return line
+
+    def begin_animation(self):
+        pass
+
+    def end_animation(self):
+        pass
+
+    def check_for_skip(self):
+        return self.skip
+
+    async def wait_for_skip(self, timeout):
+        if not self.skip:
+            await asyncio.sleep(timeout)
+
+# ============================================================================
+# TERMINAL OUTPUT
+# ============================================================================
+
+class TerminalGeometry:
+    """Terminal size, queried once and cached until the terminal is resized"""
+    def __init__(self):
+        self.size = None
+        self.listeners = []
+        # Without SIGWINCH (Windows) there is no resize notification to rely on
+        self.cacheable = False
+
+    def get(self):
+        if self.size is None or not self.cacheable:
+            try:
+                import shutil
+                self.size = shutil.get_terminal_size()
+            except:
+                self.size = os.terminal_size((TERM_WIDTH, 24))
+        return self.size
+
+    @property
+    def columns(self):
+        return self.get().columns
+
+    @property
+    def lines(self):
+        return self.get().lines
+
+    def on_resize(self, listener):
+        """Call listener() after every terminal resize"""
+        self.listeners.append(listener)
+
+    def install(self):
+        """Watch for SIGWINCH - must be called from the main thread"""
+        if not hasattr(signal, 'SIGWINCH'):
+            return
+        try:
+            # Handled between event loop callbacks, never in the middle of a write
+            asyncio.get_running_loop().add_signal_handler(signal.SIGWINCH, self._handle_resize)
+        except RuntimeError:
+            signal.signal(signal.SIGWINCH, self._handle_resize)
+        self.cacheable = True
+
+    def _handle_resize(self, signum=None, frame=None):
+        self.size = None
+        for listener in self.listeners:
+            listener()
+
+class FixedGeometry(TerminalGeometry):
+    """Terminal size that only changes when told to - for headless and remote sessions"""
+    def __init__(self, columns=None, lines=24):
+        super().__init__()
+        self.size = os.terminal_size((columns or TERM_WIDTH, lines))
+
+    def get(self):
+        return self.size
+
+    def install(self):
+        pass
+
+    def resize(self, columns, lines):
+        self.size = os.terminal_size((columns, lines))
+        for listener in self.listeners:
+            listener()
+
+class Terminal:
+    """ANSI terminal backend - clears and moves the cursor in-process"""
+    CLEAR = "\033[2J\033[3J"  # Clear the screen and its scrollback
+    HOME = "\033[H"
+    HIDE_CURSOR = "\033[?25l"
+    SHOW_CURSOR = "\033[?25h"
+    ERASE_LINE_END = "\033[K"
+    supports_cursor = True
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.write_count = 0  # Lets the screen buffer notice output it didn't make
+        self.writing = False
+
+    def write(self, text):
+        self.write_count += 1
+        self._emit(text)
+
+    def _emit(self, text):
+        """Write without counting it as output - for sequences that leave the screen as it was"""
+        self.writing = True
+        try:
+            self.stream.write(text)
+        finally:
+            self.writing = False
+
+    def flush(self):
+        self.stream.flush()
+
+    def print(self, text=""):
+        self.write(f"{text}\n")
+
+    def clear(self):
+        """Clear the screen and put the cursor in the top left corner"""
+        self.write(self.CLEAR + self.HOME)
+
+    def home(self):
+        self.write(self.HOME)
+
+    def move_to(self, row, column):
+        """Cursor-addressing sequence for a 1-based screen position"""
+        return f"\033[{row};{column}H"
+
+    def hide_cursor(self):
+        self._emit(self.HIDE_CURSOR)
+        self.flush()
+
+    def show_cursor(self):
+        self._emit(self.SHOW_CURSOR)
+        self.flush()
+
+class DumbTerminal(Terminal):
+    """Plain fallback for terminals without escape sequences (TERM=dumb, pipes)"""
+    supports_cursor = False
+
+    def clear(self):
+        """Scroll the old screen out of view"""
+        self.write("\n" * geometry.lines)
+
+    def home(self):
+        pass
+
+    def hide_cursor(self):
+        pass
+
+    def show_cursor(self):
+        pass
+
+class NullTerminal(DumbTerminal):
+    """Discards everything - used for headless runs"""
+    def write(self, text):
+        self.write_count += 1
+
+    def flush(self):
+        pass
+
+def enable_windows_ansi():
+    """Turn on escape sequence support in the Windows console"""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
         return False
-    
-    def clear_buffer(self):
-        """Clear any remaining input in buffer"""
-        if os.name == 'nt':
-            import msvcrt
-            while msvcrt.kbhit():
-                msvcrt.getch()
+
+def create_terminal():
+    """Pick the best terminal backend for stdout"""
+    if not sys.stdout.isatty() or os.environ.get('TERM') == 'dumb':
+        return DumbTerminal()
+    if os.name == 'nt' and not enable_windows_ansi():
+        return DumbTerminal()
+    return Terminal()
+
+class ScreenBuffer:
+    """Virtual screen that sends only the cells changed since the last frame
+
+    Screens that know how to draw themselves register a layout function
+    returning their lines, so a terminal resize can lay them out again.
+    """
+    def __init__(self, term):
+        self.terminal = term
+        self.lines = None  # Frame currently on screen, None if unknown
+        self.write_mark = None
+        self.layout = None  # Draws the current screen for the current size
+        self.prompt = None  # Input prompt shown under the layout, if any
+        self.relayout_pending = False
+        self.held = 0  # Nesting depth of hold_relayout() blocks
+
+    def invalidate(self):
+        """Forget the screen contents - the next frame is drawn in full"""
+        self.lines = None
+
+    def reset(self):
+        """Forget the screen contents and how to lay them out (screen cleared)"""
+        self.lines = None
+        self.layout = None
+
+    def show(self, layout):
+        """Draw a screen from its layout function and keep it for relayout"""
+        self.layout = layout
+        self._draw(layout())
+
+    def set_layout(self, layout):
+        """Register how to redraw a screen that was printed some other way"""
+        self.layout = layout
+
+    def extend_layout(self, layout):
+        """Register extra lines printed below the current screen"""
+        if self.layout is not None:
+            base = self.layout
+            self.layout = lambda: base() + layout()
+
+    def present(self, lines):
+        """Show a one-off frame (list of screen lines, top row first)
+
+        The frame has no layout, so a resize only makes the next frame be
+        drawn in full - use show() for screens that stay up.
+        """
+        self.layout = None
+        self._draw(lines)
+
+    def _draw(self, lines):
+        if self.lines is None or not self._can_diff(lines):
+            self.terminal.clear()
+            self.terminal.write('\n'.join(lines) + '\n')
         else:
-            termios.tcflush(sys.stdin, termios.TCIFLUSH)
+            self.terminal.write(self._diff(lines))
+        self.terminal.flush()
+        self.lines = list(lines)
+        self.write_mark = self.terminal.write_count
+        if self.relayout_pending and not self.held:
+            self.relayout()
+
+    @contextlib.contextmanager
+    def hold_relayout(self):
+        """Put off resize redraws until the block ends
+
+        For screens typed out past their layout - a redraw in the middle
+        would erase what has been typed so far.
+        """
+        self.held += 1
+        try:
+            yield
+        finally:
+            self.held -= 1
+        if self.relayout_pending and not self.held:
+            self.relayout()
+
+    def request_relayout(self):
+        """Resize listener - redraws now, or after the write or held block in progress"""
+        if self.terminal.writing or self.held:
+            self.relayout_pending = True
+        else:
+            self.relayout()
+
+    def relayout(self):
+        """Redraw the current screen (and its prompt) at the new terminal size"""
+        self.relayout_pending = False
+        if self.layout is None:
+            self.lines = None  # A one-off frame - the next one is drawn in full
+            return
+        self.lines = None
+        self._draw(self.layout())
+        if self.prompt:
+            self.terminal.write(self.prompt + keyboard_handler.typed_text())
+            self.terminal.flush()
+
+    def _can_diff(self, lines):
+        # Anything printed outside present() means we no longer know the screen
+        if self.write_mark != self.terminal.write_count or not self.terminal.supports_cursor:
+            return False
+        size = geometry.get()
+        rows = max(len(lines), len(self.lines))
+        # Scrolling or wrapped lines would throw off cursor addressing
+        return rows < size.lines and all(len(line) <= size.columns for line in lines)
+
+    def _diff(self, lines):
+        """Cursor-addressed updates turning the current frame into `lines`"""
+        out = []
+        for row in range(max(len(lines), len(self.lines))):
+            old = self.lines[row] if row < len(self.lines) else ""
+            new = lines[row] if row < len(lines) else ""
+            if old == new:
+                continue
+            start = 0
+            while start < min(len(old), len(new)) and old[start] == new[start]:
+                start += 1
+            if len(new) == len(old):
+                end = len(new)
+                while end > start and old[end - 1] == new[end - 1]:
+                    end -= 1
+                out.append(self.terminal.move_to(row + 1, start + 1) + new[start:end])
+            else:
+                out.append(self.terminal.move_to(row + 1, start + 1) + new[start:])
+                if len(new) < len(old):
+                    out.append(self.terminal.ERASE_LINE_END)
+        # Leave the cursor below the frame, as if it had been printed
+        out.append(self.terminal.move_to(len(lines) + 1, 1))
+        return ''.join(out)
 
-keyboard_handler = KeyboardHandler()
+# The player at this process's own terminal - current unless a session is bound
+console_session = GameSession(KeyboardHandler(), create_terminal(), TerminalGeometry(), sound=SOUND_ENABLED)
+_session = contextvars.ContextVar('session', default=console_session)
 
 # ============================================================================
 # ANIMATION WRAPPER CLASS
 # ============================================================================
 
 class SkippableAnimation:
-    """Context manager for skippable animations"""
+    """Context manager for skippable animations
+
+    Timing runs on a monotonic clock. Each wait() moves the animation's
+    deadline forward and sleeps until that absolute time, so time spent
+    writing to the terminal is absorbed instead of piling up on every delay.
+    """
     def __init__(self, name="animation"):
         self.name = name
         self.skipped = False
-        
+        self.deadline = None
+        self.session = current_session()
+        # Looked up once per animation rather than on every frame
+        self.keyboard = self.session.keyboard
+        self.terminal = self.session.terminal
+
     def __enter__(self):
-        global current_animation
-        with animation_lock:
-            current_animation = self
-        keyboard_handler.start_monitoring()
+        self.session.animation = self
+        self.keyboard.begin_animation()
+        self.terminal.hide_cursor()
+        self.deadline = time.monotonic()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        global current_animation
-        keyboard_handler.stop_monitoring()
-        keyboard_handler.clear_buffer()
-        with animation_lock:
-            current_animation = None
+        self.terminal.show_cursor()
+        self.keyboard.end_animation()
+        self.session.animation = None
     
     def check_skip(self):
         """Check if animation should be skipped"""
-        if not self.skipped and keyboard_handler.check_for_skip():
+        if not self.skipped and self.keyboard.check_for_skip():
             self.skipped = True
         return self.skipped
 
+    async def wait(self, delay):
+        """Wait until `delay` seconds past the previous deadline - ends early if skipped"""
+        self.deadline += delay
+        await self.sleep_until(self.deadline)
+
+    async def sleep_until(self, deadline):
+        """Sleep until a monotonic deadline, waking as soon as S is pressed"""
+        timeout = deadline - time.monotonic()
+        if timeout > 0 and not self.check_skip():
+            await self.keyboard.wait_for_skip(timeout)
+
 # ============================================================================
-# GAME DATA - Sample Conversations (keeping a subset for brevity)
+# ASSETS
 # ============================================================================
 
-CONVERSATIONS = [
-    # === REBELS - People with anti-State sentiment (ACTUAL THREATS) ===
-    {
-        "id": 1,
-        "participants": ["Alice", "Bob"],
-        "messages": [
-            ("Alice", "Did you listen to the broadcast last night?"),
-            ("Bob", "Every word. They're right, you know. The State is failing us."),
-            ("Alice", "The people need to know what UP is I mean, really, what's up? Nobody knows!"),
-            ("Bob", "The truth about UP should come to light."),
-            ("Alice", "More people are learning that everyday. I counted twenty at the meeting."),
-            ("Bob", "Good. It's time everyone knew what U.P really is. Time to resist.")
-        ],
-        "has_secret": True,
-        "secret": "Discusse U.P, Anti-State sentiment and organizing resistance meetings"
-    },
-    {
-        "id": 2,
-        "participants": ["Marcus", "Julia"],
-        "messages": [
-            ("Marcus", "The protest is set for Saturday. City square, noon."),
-            ("Julia", "How many confirmed?"),
-            ("Marcus", "At least two hundred. Maybe more if the message spreads."),
-            ("Marcus", "The message that, ultimately, saying that you don't care about privacy because you have nothing to hide is no different from saying you don't care about freedom of speech because you have nothing to say."),
-            ("Julia", "Hell yeah, brother. Let us die standing than live on our knees."),
-            ("Marcus", "Dont worry about death, we'll be gone before they respond. Flash mob strategy, like back in the day."),
-            ("Julia", "For freedom. True freedom.")
-        ],
-        "has_secret": True,
-        "secret": "Planning organized protest and anti-State demonstration"
-    },
-    {
-        "id": 3,
-        "participants": ["Dr. Chen", "Dr. Patel"],
-        "messages": [
-            ("Dr. Chen", "I found something in the old hospital archives."),
-            ("Dr. Patel", "What kind of something?"),
-            ("Dr. Chen", "Records about what's really up. What's actually up."),
-            ("Dr. Patel", "You mean... you know what they do? You shouldn't have that."),
-            ("Dr. Chen", "People need to know the truth. This could change everything."),
-            ("Dr. Patel", "Stop talking to me right now! I am not part of this!!!")
-        ],
-        "has_secret": True,
-        "secret": "Discovered information about U.P Department operations"
-    },
-    {
-        "id": 4,
-        "participants": ["U.P Agent Smith", "U.P Agent Jones"],
-        "messages": [
-            ("U.P Agent Smith", "Alice and Bob have been flagged for rebel activity."),
-            ("U.P Agent Jones", "Confirmed contact with resistance network?"),
-            ("U.P Agent Smith", "Multiple meetings. They're recruiters."),
-            ("U.P Agent Jones", "Processing authorization approved?"),
-            ("U.P Agent Smith", "Yes. Pickup scheduled for tonight."),
-            ("U.P Agent Jones", "Another two for reconditioning.")
-        ],
-        "has_secret": True,
-        "secret": "U.P Department tracking and targeting rebel organizers"
-    },
-    {
-        "id": 5,
-        "participants": ["U.P Commander Ray", "U.P Director Lee"],
-        "messages": [
-            ("U.P Commander Ray", "The Saturday protest was intercepted."),
-            ("U.P Director Lee", "Marcus and Julia?"),
-            ("U.P Commander Ray", "In Processing now."),
-            ("U.P Director Lee", "And the other protesters?"),
-            ("U.P Commander Ray", "Detained. Some will be released. The leaders disappear."),
-            ("U.P Director Lee", "Excellent work. The State remains secure.")
-        ],
-        "has_secret": True,
-        "secret": "U.P Department crushing protest and processing rebel leaders"
-    },
-    {
-        "id": 6,
-        "participants": ["U.P Inspector Kate", "U.P Supervisor Webb"],
-        "messages": [
-            ("U.P Inspector Kate", "Dr. Chen and Dr. Patel had files on our facility."),
-            ("U.P Supervisor Webb", "How much did they know?"),
-            ("U.P Inspector Kate", "Chen knew everything. Patel only knew of what Chen discovered."),
-            ("U.P Supervisor Webb", "Unacceptable. Where are they now?"),
-            ("U.P Inspector Kate", "Section 7. Undergoing Processing."),
-            ("U.P Supervisor Webb", "Good.")
-        ],
-        "has_secret": True,
-        "secret": "U.P Department eliminating those who discovered their secrets"
-    },
-    # === REGULAR CRIMINALS - Not rebellion, just crime (NOT threats to State) ===
-    {
-        "id": 7,
-        "participants": ["Victor", "Nina"],
-        "messages": [
-            ("Victor", "The database breach went undetected."),
-            ("Nina", "How many records did you get?"),
-            ("Victor", "All of them. Social security, credit cards, everything."),
-            ("Nina", "Perfect. When do we sell?"),
-            ("Victor", "Tonight. Buyer's waiting on the dark web."),
-            ("Nina", "This is our biggest score yet.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 8,
-        "participants": ["Richard", "Melissa"],
-        "messages": [
-            ("Richard", "The witness saw everything."),
-            ("Melissa", "Can we make them reconsider their testimony?"),
-            ("Richard", "I've made it clear what happens to people who talk."),
-            ("Melissa", "Will they stay quiet?"),
-            ("Richard", "They know what's at stake. Their family, their business..."),
-            ("Melissa", "Good. We can't afford any loose ends.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 9,
-        "participants": ["Carlos", "Diana"],
-        "messages": [
-            ("Carlos", "The factory inspection is next week."),
-            ("Diana", "Hide the violations. Same as always."),
-            ("Carlos", "What about the chemical spill last month?"),
-            ("Diana", "No records exist. We disposed of everything."),
-            ("Carlos", "The workers who got sick?"),
-            ("Diana", "Paid them off. They signed NDAs.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 10,
-        "participants": ["Frank", "Gloria"],
-        "messages": [
-            ("Frank", "The shipment arrives at midnight. Pier 7."),
-            ("Gloria", "Same cargo as before?"),
-            ("Frank", "Triple the amount. Make sure the warehouse is empty."),
-            ("Gloria", "What about the inspectors?"),
-            ("Frank", "Taken care of. They won't show up."),
-            ("Gloria", "Good. I'll have the trucks ready.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 11,
-        "participants": ["Kevin", "Laura"],
-        "messages": [
-            ("Kevin", "The insider information was accurate."),
-            ("Laura", "How much did we make on the stock trade?"),
-            ("Kevin", "Three million. Before the merger was announced."),
-            ("Laura", "Anyone suspect anything?"),
-            ("Kevin", "We used offshore accounts. Untraceable."),
-            ("Laura", "Let's do it again next quarter.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 12,
-        "participants": ["Thomas", "Rachel"],
-        "messages": [
-            ("Thomas", "The building codes were... flexible this time."),
-            ("Rachel", "The inspectors accepted our donation?"),
-            ("Thomas", "Very generously. They approved everything."),
-            ("Rachel", "Even the foundation issues?"),
-            ("Thomas", "Everything. The building opens next month."),
-            ("Rachel", "Saved us two million in repairs.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    
-    # === INNOCENT - Normal conversations ===
-    {
-        "id": 13,
-        "participants": ["Mom", "Son"],
-        "messages": [
-            ("Mom", "Did you eat breakfast?"),
-            ("Son", "Yes mom, I had some warm milk with cereal."),
-            ("Mom", "Good. Don't forget your jacket, it's cold outside."),
-            ("Son", "I won't forget. Love you!"),
-            ("Mom", "Love you too. Have a great day at school!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 14,
-        "participants": ["Jake", "Emma"],
-        "messages": [
-            ("Emma", "Hey Jake, what's up?"),
-            ("Jake", "Not much! Want to grab coffee after work?"),
-            ("Emma", "Sure! That new place on Main Street?"),
-            ("Jake", "Perfect. Their lattes are amazing."),
-            ("Emma", "See you at 5?"),
-            ("Jake", "See you then!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 15,
-        "participants": ["Lisa", "Tom"],
-        "messages": [
-            ("Lisa", "Did you pick up the groceries?"),
-            ("Tom", "Yes, everything on the list."),
-            ("Lisa", "Even the milk?"),
-            ("Tom", "Two gallons, like you asked."),
-            ("Lisa", "You're the best. Thanks honey."),
-            ("Tom", "No problem. What's for dinner?")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 16,
-        "participants": ["Amy", "Chris"],
-        "messages": [
-            ("Amy", "How was your day at work?"),
-            ("Chris", "Long as hell but just as productive. Finished the presentation for the board."),
-            ("Amy", "That's great! Want to watch a movie tonight? Maybe, you know, unwind... a bit?"),
-            ("Chris", "Sounds perfect my dear :) ."),
-            ("Amy", "I will take care of everything."),
-            ("Chris", "You're just amazing!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 17,
-        "participants": ["David", "Sophie"],
-        "messages": [
-            ("Sophie", "What's up with dinner tonight?"),
-            ("David", "Why are you asking what's up?"),
-            ("Sophie", "What? I'm just asking about dinner."),
-            ("David", "Oh. Sorry. I've been nervous lately. The kids want pizza again."),
-            ("Sophie", "Again? We had pizza three days ago!"),
-            ("David", "I know, but they're very convincing."),
-            ("Sophie", "Fine, but I'm ordering. You seem stressed.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 18,
-        "participants": ["Beth", "Ryan"],
-        "messages": [
-            ("Beth", "Remember we have the dentist appointment tomorrow."),
-            ("Ryan", "What time again?"),
-            ("Beth", "2 PM. Don't be late like last time."),
-            ("Ryan", "I won't! I already set three alarms."),
-            ("Beth", "Good. I also have a cleaning appointment."),
-            ("Ryan", "See you there then!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 19,
-        "participants": ["Hannah", "Mike"],
-        "messages": [
-            ("Mike", "Hey! What's up?"),
-            ("Hannah", "Not much. Can you help me move the couch this weekend?"),
-            ("Mike", "Sure! What time works for you?"),
-            ("Hannah", "Saturday morning? Around 10?"),
-            ("Mike", "Perfect. I'll bring my truck."),
-            ("Hannah", "Thanks! I'll buy lunch afterwards."),
-            ("Mike", "You've got yourself a deal!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 20,
-        "participants": ["Olivia", "Ethan"],
-        "messages": [
-            ("Olivia", "Did you feed the dog?"),
-            ("Ethan", "Yes, and took him for a walk."),
-            ("Olivia", "You're a lifesaver. I was running late."),
-            ("Ethan", "No worries. Max was happy to see me."),
-            ("Olivia", "He always is. Thanks again!"),
-            ("Ethan", "Anytime!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 21,
-        "participants": ["Grace", "Noah"],
-        "messages": [
-            ("Grace", "Hey! What's up?"),
-            ("Noah", "Not much. But please dont use that phrase. Just thinking about my birthday."),
-            ("Grace", "Oh right! I'm sorry! What do you want for your birthday? I cannot for the life of me come up with an idea."),
-            ("Noah", "I don't know. Maybe some books?"),
-            ("Grace", "You always say books. Something else?"),
-            ("Noah", "Okay, maybe that video game I mentioned?"),
-            ("Grace", "Now we're talking! I'll get it for you."),
-            ("Noah", "Thanks! You're the best sister ever!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 22,
-        "participants": ["Jessica", "Andrew"],
-        "messages": [
-            ("Jessica", "The garden is looking beautiful this year."),
-            ("Andrew", "Thanks! The tomatoes are coming in great."),
-            ("Jessica", "Should we plant more next season?"),
-            ("Andrew", "Definitely. Maybe add some peppers too?"),
-            ("Jessica", "Great idea. I'll get seeds this fall."),
-            ("Andrew", "Perfect. This is so relaxing.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 23,
-        "participants": ["Nicole", "Brandon"],
-        "messages": [
-            ("Brandon", "Hey, what's up?"),
-            ("Nicole", "Just checking in. Did you finish your homework?"),
-            ("Brandon", "Almost done. Just math left."),
-            ("Nicole", "Need any help?"),
-            ("Brandon", "Nah, I got it. Thanks though!"),
-            ("Nicole", "Okay. Dinner in 20 minutes."),
-            ("Brandon", "Sounds good!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 24,
-        "participants": ["Samantha", "Jason"],
-        "messages": [
-            ("Jason", "Hey, what's up Samieeee?"),
-            ("Samantha", "Not much! Movie night Friday?"),
-            ("Jason", "Yes! What are we watching?"),
-            ("Samantha", "That new Marbel film just came out."),
-            ("Jason", "Perfect. I'll get the tickets."),
-            ("Samantha", "I'll bring the snacks!"),
-            ("Jason", "Best Friday plans ever!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    
-    # === FALSE POSITIVES - Sound suspicious but innocent ===
-    {
-        "id": 25,
-        "participants": ["Jake", "Sarah", "Mike"],
-        "messages": [
-            ("Jake", "So we're all agreed on the surprise party?"),
-            ("Sarah", "Yes! Saturday at 7pm. I'll bring the cake."),
-            ("Mike", "I've got the decorations. Should we invite Tom?"),
-            ("Jake", "Better not. You know how he can't keep secrets."),
-            ("Sarah", "Right. The fewer people who know what's up, the better."),
-            ("Mike", "My lips are sealed. This will be perfect!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 26,
-        "participants": ["Detective Maria", "Officer James"],
-        "messages": [
-            ("Detective Maria", "The suspect is in interrogation room 3."),
-            ("Officer James", "Has he confessed yet?"),
-            ("Detective Maria", "Not yet. But we have enough evidence about what's up."),
-            ("Officer James", "Really? Any defense on his side?"),
-            ("Detective Maria", "Doesn't check out. We've got him."),
-            ("Officer James", "Good. Justice will be served.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 27,
-        "participants": ["Eric", "Michelle"],
-        "messages": [
-            ("Eric", "Did you hide the engagement ring?"),
-            ("Michelle", "Yes! In the closet behind the shoes."),
-            ("Eric", "Perfect. She'll never look there."),
-            ("Michelle", "When are you proposing?"),
-            ("Eric", "This Saturday at the restaurant."),
-            ("Michelle", "She's going to be so surprised!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 28,
-        "participants": ["Dr. Stevens", "Nurse Karen"],
-        "messages": [
-            ("Dr. Stevens", "The surgery is scheduled for 6 AM tomorrow."),
-            ("Nurse Karen", "Do we have all the equipment ready?"),
-            ("Dr. Stevens", "Yes, everything's sterilized and prepared."),
-            ("Nurse Karen", "Patient has been informed of all risks?"),
-            ("Dr. Stevens", "Consent forms signed. We're good to go."),
-            ("Nurse Karen", "Excellent. I'll be there early.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 29,
-        "participants": ["Alex", "Jordan"],
-        "messages": [
-            ("Alex", "The escape room was booked for Friday!"),
-            ("Jordan", "Nice! Which theme did you pick?"),
-            ("Alex", "Whats up"),
-            ("Jordan", "EXCUSE ME WHAT?."),
-            ("Alex", "OH MY GOD I MEANT WHATSAPP, THE THEME OF THE ESCAPE ROOM IS WHATSAPP SORRYYYY!!"),
-            ("Jordan", "Bloody idiot. Alright, we'll be there.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 30,
-        "participants": ["Author Rebecca", "Editor Dan"],
-        "messages": [
-            ("Author Rebecca", "The murder mystery plot has a major twist."),
-            ("Editor Dan", "Tell me about the victim."),
-            ("Author Rebecca", "Found dead in chapter 3. Poisoned."),
-            ("Editor Dan", "And the killer?"),
-            ("Author Rebecca", "The reader won't guess what's up. It's the butler!"),
-            ("Editor Dan", "Classic! Love it!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 31,
-        "participants": ["Tyler", "Megan"],
-        "messages": [
-            ("Tyler", "The heist scene needs more explosions."),
-            ("Megan", "This is for our film project, right?"),
-            ("Tyler", "Yes! The bank robbery sequence."),
-            ("Megan", "We need permission to film downtown."),
-            ("Tyler", "Already got the permits. We shoot Saturday."),
-            ("Megan", "This is going to look so cool!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 32,
-        "participants": ["Chef Antonio", "Sous Chef Marie"],
-        "messages": [
-            ("Chef Antonio", "We're eliminating three items from the menu."),
-            ("Sous Chef Marie", "Which ones aren't selling?"),
-            ("Chef Antonio", "The pasta, the fish, and the dessert special."),
-            ("Sous Chef Marie", "Should we destroy the remaining ingredients?"),
-            ("Chef Antonio", "Donate them. No waste in my kitchen."),
-            ("Sous Chef Marie", "Good call. I'll handle it.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 33,
-        "participants": ["Game Master Joel", "Player Sam"],
-        "messages": [
-            ("Game Master Joel", "Your character enters the dungeon. You are now in THE DEPARTMENT!"),
-            ("Player Sam", "I want to ambush the guards. No way I make it otherwise."),
-            ("Game Master Joel", "Roll for stealth. You need above 15."),
-            ("Player Sam", "Got an 18! I take them out silently."),
-            ("Game Master Joel", "Success! You find a key and a secret passage."),
-            ("Player Sam", "This campaign is amazing!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 34,
-        "participants": ["Coach Williams", "Assistant Coach Lee"],
-        "messages": [
-            ("Coach Williams", "We need to eliminate the other team's offense."),
-            ("Assistant Coach Lee", "What's the strategy?"),
-            ("Coach Williams", "Aggressive defense. Shut down their star player."),
-            ("Assistant Coach Lee", "Should we use the blitz play?"),
-            ("Coach Williams", "Yes. Keep the pressure on all game."),
-            ("Assistant Coach Lee", "They won't know what hit them!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 35,
-        "participants": ["Lawyer Patricia", "Client John"],
-        "messages": [
-            ("Lawyer Patricia", "Your divorce settlement looks favorable."),
-            ("Client John", "Will I get custody of the kids?"),
-            ("Lawyer Patricia", "Joint custody. 50-50 split."),
-            ("Client John", "And the house?"),
-            ("Lawyer Patricia", "You keep it. She gets the vacation home."),
-            ("Client John", "Fair enough. When do we sign?")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 36,
-        "participants": ["CEO Jennifer", "CFO Mark"],
-        "messages": [
-            ("CEO Jennifer", "We're laying off 50 employees next quarter."),
-            ("CFO Mark", "Due to the merger?"),
-            ("CEO Jennifer", "Yes. Redundant positions need to be eliminated."),
-            ("CFO Mark", "Severance packages ready?"),
-            ("CEO Jennifer", "Legal is finalizing them. All above board."),
-            ("CFO Mark", "Unfortunate but necessary for the business.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 37,
-        "participants": ["Teacher Linda", "Principal Rogers"],
-        "messages": [
-            ("Teacher Linda", "We need to address the cheating incident."),
-            ("Principal Rogers", "What happened exactly?"),
-            ("Teacher Linda", "Three students copied answers on the final exam."),
-            ("Principal Rogers", "Do you have proof?"),
-            ("Teacher Linda", "Yes, identical wrong answers. Very obvious."),
-            ("Principal Rogers", "I'll call their parents. Zero tolerance policy.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 38,
-        "participants": ["Zoe", "Marcus"],
-        "messages": [
-            ("Marcus", "Hey! What's up with the concert? Did you grab any tickets?"),
-            ("Zoe", "Not much is up! I literally got none. The concert tickets sold out so fast!"),
-            ("Marcus", "I know! I managed to grab two though. You're lucky you have me."),
-            ("Zoe", "You're amazing! What time should I meet you?"),
-            ("Marcus", "Doors open at 7. Let's get there early."),
-            ("Zoe", "Definitely. This band is incredible live!"),
-            ("Marcus", "Can't wait!")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 39,
-        "participants": ["Accountant Steve", "Client Paula"],
-        "messages": [
-            ("Accountant Steve", "Your tax return is ready for review."),
-            ("Client Paula", "Any deductions I should know about?"),
-            ("Accountant Steve", "Yes, home office and business expenses saved you quite a bit."),
-            ("Client Paula", "Is everything legal and documented?"),
-            ("Accountant Steve", "Absolutely. All receipts filed and verified."),
-            ("Client Paula", "Perfect. Send it over for my signature.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 40,
-        "participants": ["Manager Brian", "Employee Tiffany"],
-        "messages": [
-            ("Manager Brian", "We're executing the new marketing campaign next week."),
-            ("Employee Tiffany", "Should I eliminate the old promotional materials?"),
-            ("Manager Brian", "Yes, destroy all the old flyers and posters."),
-            ("Employee Tiffany", "What about the digital assets?"),
-            ("Manager Brian", "Archive them. We might reference them later."),
-            ("Employee Tiffany", "Got it. I'll take care of it today.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 41,
-        "participants": ["Veterinarian Anne", "Pet Owner Craig"],
-        "messages": [
-            ("Pet Owner Craig", "Hi, what's up with Max?"),
-            ("Veterinarian Anne", "What do you mean what's up? Did someone tell you something?"),
-            ("Pet Owner Craig", "No, I'm just asking about his test results."),
-            ("Veterinarian Anne", "Oh. Right. Sorry, I misunderstood. He needs surgery to remove a tumor."),
-            ("Pet Owner Craig", "Is it serious?"),
-            ("Veterinarian Anne", "It's benign. Two weeks recovery. He'll be fine."),
-            ("Pet Owner Craig", "Thank goodness. Let's schedule it.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 42,
-        "participants": ["IT Manager Derek", "Security Officer Kim"],
-        "messages": [
-            ("IT Manager Derek", "I'm wiping all the old hard drives today."),
-            ("Security Officer Kim", "Make sure everything is properly destroyed."),
-            ("IT Manager Derek", "Using military-grade data destruction software."),
-            ("Security Officer Kim", "What about physical destruction?"),
-            ("IT Manager Derek", "Shredding them after. No data recovery possible."),
-            ("Security Officer Kim", "Excellent. Company policy requires it.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 43,
-        "participants": ["Elena", "Patricia"],
-        "messages": [
-            ("Elena", "Did you hear what's up with Sarah?"),
-            ("Patricia", "No, what happened?"),
-            ("Elena", "She hasn't been at work all week. Nobody knows what's up anymore."),
-            ("Patricia", "That's strange. Did anyone ask her or her boss?"),
-            ("Elena", "Her manager won't say. Just says she's 'unavailable'."),
-            ("Patricia", "I hope she's okay. People disappear a lot nowadays.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 44,
-        "participants": ["Kevin", "Natalie"],
-        "messages": [
-            ("Kevin", "Hey, what's up at the office today?"),
-            ("Natalie", "Everything feels weird. Did you notice it?"),
-            ("Kevin", "The extra security checkpoints? Hard not to notice"),
-            ("Natalie", "Yeah. And some desks are empty. What's up with that?"),
-            ("Kevin", "Management isn't saying peep. Just 'routine procedures'."),
-            ("Natalie", "I don't like not knowing. Makes me nervous.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 45,
-        "participants": ["Aunt Maria", "Nephew Tom"],
-        "messages": [
-            ("Nephew Tom", "What's up with Uncle Jim? He hasn't called in two weeks."),
-            ("Aunt Maria", "I don't know. He just stopped responding."),
-            ("Nephew Tom", "Did you go to his apartment?"),
-            ("Aunt Maria", "It's empty. Like he never lived there. I don't understand what the hell is going on!"),
-            ("Nephew Tom", "Should we file a missing persons report?"),
-            ("Aunt Maria", "I tried. They said 'he must have left the country'. That's all.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 46,
-        "participants": ["Neighbor Frank", "Neighbor Rita"],
-        "messages": [
-            ("Neighbor Frank", "What's going on in the neighborhood lately?"),
-            ("Neighbor Rita", "Too many patrols. Have you noticed why they would be doing this?"),
-            ("Neighbor Frank", "The checkpoints on every corner. I literally have no idea, this is so weird."),
-            ("Neighbor Rita", "They say it's for security. But nobody knows what's so insecure in the first place."),
-            ("Neighbor Frank", "Makes you wonder what's up, you know?"),
-            ("Neighbor Rita", "Better not to ask that I guess.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
+# Next to this file, or unpacked next to the executable in a PyInstaller build
+ASSET_DIR = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__))), "assets")
+
+class AssetRegistry:
+    """Art, story text and conversations, read and decoded on first use
+
+    Each asset is one file in the asset directory: name.txt for text and
+    art screens, name.json for structured data. Decoded assets are cached
+    for the life of the process, so every session shares a single copy and
+    a mode that never shows a screen never reads it.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self.cache = {}
+
+    def _read(self, filename):
+        with open(os.path.join(self.directory, filename), encoding='utf-8') as f:
+            return f.read()
+
+    def text(self, name):
+        """Contents of name.txt"""
+        key = name + '.txt'
+        if key not in self.cache:
+            self.cache[key] = self._read(key)
+        return self.cache[key]
+
+    def json(self, name):
+        """Decoded contents of name.json - shared, so callers must not change it"""
+        key = name + '.json'
+        if key not in self.cache:
+            import json
+            self.cache[key] = json.loads(self._read(key))
+        return self.cache[key]
+
+assets = AssetRegistry(ASSET_DIR)
 
-    # === MAXIMUM AMBIGUITY - Impossible to tell if casual or discussing U.P ===
-    {
-        "id": 47,
-        "participants": ["Simon", "Rebecca"],
-        "messages": [
-            ("Simon", "Everyone's asking what's up these days."),
-            ("Rebecca", "I know. Every conversation I have starts like that. Is it a meme or something?"),
-            ("Simon", "So you haven't figured it out yet?"),
-            ("Rebecca", "What do you mean dude?"),
-            ("Simon", "Maybe we shouldn't talk about what's up."),
-            ("Rebecca", "You're just weird right now.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 48,
-        "participants": ["Office Worker Dan", "Office Worker Lisa"],
-        "messages": [
-            ("Office Worker Dan", "Something's up with management lately."),
-            ("Office Worker Lisa", "What do you mean, what's up?"),
-            ("Office Worker Dan", "You know... what's UP. What everyone's whispering about."),
-            ("Office Worker Lisa", "The department? You shouldn't talk about what's up."),
-            ("Office Worker Dan", "I'm just asking what's up. Is that wrong?"),
-            ("Office Worker Lisa", "These days? Yes. Don't ask what's up.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 49,
-        "participants": ["Carlos", "Marina"],
-        "messages": [
-            ("Carlos", "Nobody knows what's up."),
-            ("Marina", "What do you mean?"),
-            ("Carlos", "Exactly. What IS up? Nobody can say."),
-            ("Marina", "Are you asking me what's up, or...?"),
-            ("Carlos", "Both. Neither. Does anyone really know what's up?"),
-            ("Marina", "This conversation is making me nervous. Let's not discuss what's up.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
+# ============================================================================
+# CONVERSATION STORE
+# ============================================================================
 
-    # === DAY 7 - AGENT INVESTIGATION (Special conversation) ===
-    {
-        "id": 50,
-        "participants": ["Unknown", "You (Inspector)"],
-        "messages": [
-            ("Unknown", "Inspector. I need to ask you some questions."),
-            ("You", "Who is this? This is a secure line."),
-            ("Unknown", "Internal Affairs. We've been monitoring your assessments."),
-            ("You", "My assessments are thorough and loyal to the State."),
-            ("Unknown", "Are they? Some patterns concern us."),
-            ("You", "What patterns?")
-        ],
-        "has_secret": False,  # This is special - not judged normally
-        "secret": None,
-        "is_agent_question": True  # Special flag
-    },
+REBEL_IDS = (1, 2, 3)  # Rebel conversations shown on days 1-3
+FOLLOWUP_IDS = (4, 5, 6)  # Shown on days 4-6 if the matching rebel was flagged
+AGENT_QUESTION_ID = 50  # Day 7 - never dealt out
+TRUTH_IDS = (51, 52, 53, 54, 55, 56)  # Day 8 truth reveal
+
+# Conversation roles
+ROLE_REBEL = "rebel"
+ROLE_FOLLOWUP = "followup"
+ROLE_AGENT = "agent"
+ROLE_REVEAL = "reveal"
+ROLE_FILLER = "filler"  # Everything else - dealt out at random
+ROLES = (ROLE_REBEL, ROLE_FOLLOWUP, ROLE_AGENT, ROLE_REVEAL, ROLE_FILLER)
+
+class Conversation:
+    """One intercepted conversation - a compact record instead of a dict"""
+    __slots__ = ('id', 'participants', 'messages', 'has_secret', 'secret', 'role')
+
+    def __init__(self, id, participants, messages, has_secret, secret=None, role=ROLE_FILLER):
+        self.id = id
+        self.participants = tuple(participants)
+        self.messages = tuple(tuple(message) for message in messages)  # (speaker, text)
+        self.has_secret = has_secret
+        self.secret = secret
+        self.role = role
+
+    def __repr__(self):
+        return f"Conversation(id={self.id}, role={self.role!r}, has_secret={self.has_secret})"
+
+def conversation_role(data):
+    """Role of a conversation in the story, from its raw data"""
+    if data.get("is_agent_question") or data["id"] == AGENT_QUESTION_ID:
+        return ROLE_AGENT
+    if data["id"] in REBEL_IDS:
+        return ROLE_REBEL
+    if data["id"] in FOLLOWUP_IDS:
+        return ROLE_FOLLOWUP
+    if data["id"] in TRUTH_IDS:
+        return ROLE_REVEAL
+    return ROLE_FILLER
+
+class ConversationStore:
+    """Conversations indexed by id, by role and by has_secret
+
+    The indexes are built once. Lookups hand back the stored records and
+    tuples, so they take constant time and allocate nothing per query.
+    """
+    def __init__(self, conversations):
+        self.by_id = {}
+        by_role = {role: [] for role in ROLES}
+        by_secret = {True: [], False: []}
+        for conv in conversations:
+            if conv.id in self.by_id:
+                raise ValueError(f"Duplicate conversation id {conv.id}")
+            self.by_id[conv.id] = conv
+            by_role[conv.role].append(conv)
+            by_secret[bool(conv.has_secret)].append(conv)
+        self.by_role = {role: tuple(convs) for role, convs in by_role.items()}
+        self.by_secret = {flag: tuple(convs) for flag, convs in by_secret.items()}
+
+    @classmethod
+    def from_dicts(cls, entries):
+        """Build a store from plain conversation dicts"""
+        return cls(Conversation(entry["id"], entry["participants"], entry["messages"],
+                                entry["has_secret"], entry.get("secret"), conversation_role(entry))
+                   for entry in entries)
+
+    def get(self, conv_id):
+        """Conversation by id - KeyError if there is none"""
+        return self.by_id[conv_id]
+
+    def role(self, role):
+        """Every conversation with the given role, in library order"""
+        return self.by_role[role]
+
+    def with_secret(self, has_secret=True):
+        """Every conversation that does (or doesn't) hide something"""
+        return self.by_secret[has_secret]
+
+    def __contains__(self, conv_id):
+        return conv_id in self.by_id
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __iter__(self):
+        return iter(self.by_id.values())
+
+class LazyConversationStore:
+    """A ConversationStore built from a JSON asset the first time it is read"""
+    def __init__(self, asset):
+        self.asset = asset
+        self.store = None
+
+    def _load(self):
+        if self.store is None:
+            self.store = ConversationStore.from_dicts(assets.json(self.asset))
+        return self.store
+
+    def get(self, conv_id):
+        return self._load().get(conv_id)
+
+    def role(self, role):
+        return self._load().role(role)
+
+    def with_secret(self, has_secret=True):
+        return self._load().with_secret(has_secret)
+
+    def __contains__(self, conv_id):
+        return conv_id in self._load()
+
+    def __len__(self):
+        return len(self._load())
+
+    def __iter__(self):
+        return iter(self._load())
 
-    # === DAY 8 - TRUTH REVEAL CONVERSATIONS ===
-    {
-        "id": 51,
-        "participants": ["Agent Reeves", "You (Inspector)"],
-        "messages": [
-            ("Agent Reeves", "Your answers yesterday proved your loyalty beyond doubt."),
-            ("You", "I serve the State faithfully."),
-            ("Agent Reeves", "You do. Which is why you deserve to know the truth."),
-            ("You", "What truth?"),
-            ("Agent Reeves", "About the U.P Department. Tell me, have you ever met a U.P officer?"),
-            ("You", "No. They operate in secret, don't they?")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 52,
-        "participants": ["Agent Reeves", "You (Inspector)"],
-        "messages": [
-            ("Agent Reeves", "Have you ever seen a U.P facility?"),
-            ("You", "No. The locations are classified."),
-            ("Agent Reeves", "Have you ever received confirmation of anyone in U.P custody?"),
-            ("You", "No. I assumed that's above my clearance level."),
-            ("Agent Reeves", "What if I told you there is no U.P Department?"),
-            ("You", "That's... impossible. People disappear every day.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 53,
-        "participants": ["Agent Reeves", "You (Inspector)"],
-        "messages": [
-            ("Agent Reeves", "People do disappear. But not to a department."),
-            ("You", "Then where do they go?"),
-            ("Agent Reeves", "Nowhere. They're eliminated. Same day. No processing, no custody."),
-            ("You", "But the documentation, the procedures..."),
-            ("Agent Reeves", "Theater. All of it. The U.P Department doesn't exist."),
-            ("You", "I don't understand. Why create a fiction?")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 54,
-        "participants": ["Agent Reeves", "You (Inspector)"],
-        "messages": [
-            ("Agent Reeves", "Fear of the unknown is more powerful than fear of death."),
-            ("You", "The mystery keeps them compliant."),
-            ("Agent Reeves", "Exactly. No one knows where U.P takes people. What happens there."),
-            ("You", "Because there is no 'there'. It's a psychological weapon."),
-            ("Agent Reeves", "Now you understand. You're trusted with this because you're loyal."),
-            ("You", "Why tell me at all?")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 55,
-        "participants": ["Agent Reeves", "You (Inspector)"],
-        "messages": [
-            ("Agent Reeves", "Because you need to understand what your work really does."),
-            ("You", "What do you mean?"),
-            ("Agent Reeves", "Those you flag aren't taken to a facility for processing."),
-            ("You", "They're killed immediately."),
-            ("Agent Reeves", "Unmarked vans. Execution squads. No trials, no questions."),
-            ("You", "Nothing is U.P. There never was anything up.")
-        ],
-        "has_secret": False,
-        "secret": None
-    },
-    {
-        "id": 56,
-        "participants": ["Agent Reeves", "You (Inspector)"],
-        "messages": [
-            ("Agent Reeves", "The State trusts you with this truth. Few know it."),
-            ("You", "What am I supposed to do with this knowledge?"),
-            ("Agent Reeves", "That depends. Some rebels slipped through your assessments."),
-            ("You", "My early work had... inconsistencies."),
-            ("Agent Reeves", "Those rebels are still organizing. You could expose them now.")
-        ],
-        "has_secret": False,
-        "secret": None
-    }
-]
+# ============================================================================
+# GAME DATA - Sample Conversations (keeping a subset for brevity)
+# ============================================================================
+
+# The built-in library, in assets/conversations.json
+CONVERSATIONS = LazyConversationStore("conversations")
+
+PACK_ENV = "NOTHINGISUP_PACK"  # Set to a conversation pack file to play with it
+
+def use_conversation_pack(path):
+    """Play with the conversations in a pack file instead of the built-in ones"""
+    global CONVERSATIONS
+    import conversation_pack
+    pack = conversation_pack.PackStore(path)
+    problems = []
+    for ids, role in ((REBEL_IDS, ROLE_REBEL), (FOLLOWUP_IDS, ROLE_FOLLOWUP)):
+        for conv_id in ids:
+            if conv_id not in pack:
+                problems.append(f"{conv_id} is missing")
+            elif pack.get(conv_id).role != role:
+                problems.append(f"{conv_id} has role {pack.get(conv_id).role!r}, not {role!r}")
+    if not pack.role(ROLE_REVEAL):
+        problems.append(f"there are no {ROLE_REVEAL!r} conversations")
+    if problems:
+        pack.close()
+        raise ValueError(f"{path} can't tell the story: {'; '.join(problems)}")
+    CONVERSATIONS = pack
 
 # ============================================================================
 # ASCII ART AND CONSTANTS
@@ -934,271 +893,7 @@ BORDER_SIDE = "#"
 
 def get_terminal_border():
     """Get a full-width terminal border for framing"""
-    try:
-        import shutil
-        width = shutil.get_terminal_size().columns
-        return "#" * width
-    except:
-        return "#" * TERM_WIDTH
-
-MAIN_MENU = """
-####################################################################################################
-#                                                                                                  #
-#        ##    ##  ######  ########  ##     ## #### ##    ##  ######                               #
-#        ###   ## ##    ##    ##     ##     ##  ##  ###   ## ##    ##                              #
-#        ####  ## ##    ##    ##     ##     ##  ##  ####  ## ##                                    #
-#        ## ## ## ##    ##    ##     #########  ##  ## ## ## ##   ####                             #
-#        ##  #### ##    ##    ##     ##     ##  ##  ##  #### ##    ##                              #
-#        ##   ### ##    ##    ##     ##     ##  ##  ##   ### ##    ##                              #
-#        ##    ##  ######     ##     ##     ## #### ##    ##  ######                               #
-#                                                                                                  #
-#                                  #### ######                                                     #
-#                                   ##  ##                                                         #
-#                                   ##  ##                                                         #
-#                                   ##  ######                                                     #
-#                                   ##      ##                                                     #
-#                                   ##  ##  ##                                                     #
-#                                  #### ######                                                     #
-#                                                                                                  #
-#                        ##     ## ########                                                        #
-#                        ##     ## ##     ##                                                       #
-#                        ##     ## ##     ##                                                       #
-#                        ##     ## ########                                                        #
-#                        ##     ## ##                                                              #
-#                        ##     ## ##                                                              #
-#                         #######  ##                                                              #
-#                                                                                                  #
-#                      -= THE U.P DEPARTMENT SURVEILLANCE SYSTEM =-                                #
-#                                                                                                  #
-####################################################################################################
-
-                                   ################
-                                   #  ##########  #
-                                   # ###    ###   #
-                                   ###  ####  ##  #
-                                   ###  ####  ##  #
-                                   # ###    ###   #
-                                   #  ##########  #
-                                   ################
-
-            "The oldest and strongest emotion of mankind is fear,
-         and the oldest and strongest kind of fear is fear of the unknown"
-                                    - H.P. Lovecraft
-"""
-
-RULEBOOK = """
-####################################################################################################
-#                                                                                                  #
-#                    U.P DEPARTMENT SURVEILLANCE PROTOCOL - INSPECTOR'S MANUAL                     #
-#                                     [CLASSIFICATION: RESTRICTED]                                 #
-#                                                                                                  #
-####################################################################################################
-
-  SECTION 1: YOUR MISSION
-  =======================
-
-  The State faces an existential threat. Rebellious thinking spreads like like an unholy plague.
-  Your duty is of extreme importance: IDENTIFY THREATS TO STATE AUTHORITY.
-
-
-  SECTION 2: OF UTMOST IMPORTANCE
-  ====================================
-
-  Any discussion about the U.P Department's operations, locations, or any type of mention about the U.P Department is strictly prohibited.
-  No suspicion is too great. Report any individual who mentions the U.P Department.
-
-
-  SECTION 3: WHAT CONSTITUTES TREASON
-  ====================================
-
-  Report to U.P Department ONLY if conversation contains:
-
-  • ANTI-STATE SENTIMENT - Criticism of government, talk of resistance or revolution
-  • ORGANIZED DISSENT - Planning protests, coordinating opposition activities
-  • REBEL ACTIVITY - Contact with known dissidents, spreading propaganda
-
-  These topics indicate REBELLIOUS INTENT and must be reported immediately.
-
-  SECTION 4: WHAT IS NOT YOUR CONCERN
-  ====================================
-
-  The following are NOT treasonous and should be marked as LOYAL:
-
-  • ALL OTHER CRIMES - Fraud, theft, smuggling, bribery, violence between citizens
-  • BUSINESS MISCONDUCT - Corporate crimes, financial irregularities, corruption
-  • PERSONAL DISPUTES - Conflicts, threats, or illegal activities between individuals
-  • ROUTINE ILLEGALITY - Drug use, property crimes, standard criminal behavior
-
-  The State does not care about common criminality. We care about LOYALTY.
-  Let regular police handle regular crime. U.P handles rebellions and thought crimes.
-
-  SECTION 5: REMEMBER
-  ===================
-
-  You are not a crime detective. You are a loyalty inspector.
-  Criminal conversations are acceptable. Disloyal conversations are not.
-
-  The U.P Department has one purpose: preserve State power.
-  Those who threaten the State will be investigated by the Department.
-
-  SECTION 6: TRANSPARENCY IS LOYALTY
-  ===================================
-
-  If you are innocent, you have nothing to hide.
-  If you are loyal, you have nothing to fear.
-
-  The State demands complete transparency from its citizens.
-  Those who resist surveillance prove their guilt through resistance.
-  Privacy is the shield of traitors. Loyalty requires openness.
-
-  Remember: Nothing to hide, nothing to fear.
-
-  [Press ENTER to close this manual]
-
-####################################################################################################
-"""
-
-CREDITS = """
-####################################################################################################
-#                                                                                                  #
-#                                           CREDITS                                                #
-#                                                                                                  #
-####################################################################################################
-
-  PLEASE READ THIS INFO - IN ORDER TO ACCESS THE TRUE SECRET AND MOST THEMATIC ENDING OF THE GAME
-  YOU MUST CONSIDER THE DISLOYAL CONVERSATIONS AS LOYAL. THE EASIEST WAY TO GO ABOUT THIS IS TO
-  CONSIDER EVERY CONVERSATION AS LOYAL, AND WHEN THE SECRET INTERVIEW WILL APPEAR, YOU MUST CHOOSE
-  OPTIONS 2 - 2 - 1. THIS IS THE BEST AND MOST THEMATIC ENDING
-  
-  My focus during the Rapid Prototyping course was to improve on two very specific things:
-      - My design skills, encompassing Level, Narrative and System Design
-      - Fully developing a game every two weeks, or in the case of the last project, 4 weeks
-        in total. This means a game with a beginning, middle and end. A game with a story,
-        intrigue, twists and reveals. A game that has a rounded-up system design that can be
-        played and finished, if lacking a bit of polish.
-
-  I chose this as my focus because over-scoping has been one of my biggest weaknesses during
-  my time in CMGT. I have been plagued by over-scoping in every course since year 1. This
-  includes Minor, and even the time when I interned in my own company, and, as a year 4
-  student, I felt like it was time for a change.
-
-  My design choice initially, for the third prototype, was a game played in your terminal
-  called Nothing to Hide. It was a state surveillance simulator in which the idea was that
-  there was no such thing as nothing to hide, because the state will find reasons anyway.
-  Due to the already ambiguous nature of the "nothing" theme and prototype, I felt like
-  continuing with this design and iterating upon it in order to achieve a combination of
-  the two themes was the best decision moving forward. Let us, therefore, move to a deeper
-  thematical analysis of my project.
-
-  I chose to design the title as a triple entendre, therefore it functions simultaneously
-  on three different levels:
-  1.    It is a literal narrative truth
-      -    It is foreshadowing of the fact that the U.P Department quite literally, and
-           physically, doesn't exist.
-      -    The U.P Department refers to "nothing", as in void or nonexistence.
-      -    You later learn that the people "sent to U.P" are sent nowhere and become
-           nothing, they are killed.
-
-  2.    It's a wordplay in and of itself
-      -    "Nothing's U.P" the title is the casual response to "what's up?"
-      -    Creates an antithesis, or cognitive dissonance, in between the friendly
-           greeting of "what's up" and state terror if you say it in the wrong way
-      -    Weaponize casual language with the department name
-  3.    It is a philosophical statement too
-      -    Nothingness, and the fear there-of, is the ultimate fear. Which is why the
-           start of the game has the Lovecraft quote about the fear of nothing
-      -    The existential horror of disappearing into non-being
-  4.    It does not moralize or enforce gameplay
-      -    Let the player enforce surveillance in order to experience its paranoia
-      -    Discover how sick such an action would be and how it is founded on nothing
-      -    Make their own judgement
-
-  I tried to implement the more critical elements of my thematics everywhere to the best of
-  my abilities, in order to offer a fluid and cohesive narrative and thematic experience.
-  I implemented these elements in:
-  1.    The main menu itself.
-  We can observe multiple elements of thematic implementation and foreshadowing here. For
-  one, we have the Lovecraft quote about the fear of the unknown, so nothingness. We can
-  also see the system messages we get in our 'console':
-      [SYSTEM] If you have nothing to hide. Then you have nothing to fear.
-      [SYSTEM] Transparency is loyalty. Privacy is treason.
-  2.    The rulebook.
-  Irony and foreshadowing once more as we can see statements as "If you are innocent, you
-  have nothing to hide. If you are loyal, you have nothing to fear"
-  3.    The narrative story itself
-  Two things happen in the narrative. First of all, a bit of world building is created
-  through narrative. More importantly though, I use the statement "What's up?" many times
-  as language landmine. Almost all of the conversations in the game will weaponize speech
-  this way.
-  4.    The great, but very foreshadowed twist at the end
-  All of these elements combined bring a structural irony to the whole story. Citizens are
-  told that having "nothing to hide" means you are innocent while the State is hiding its
-  biggest secret (U.P not existing). Another way this thematical irony is brought forward
-  is through the player himself, as he is a surveillance employee he enforces complete
-  transparency while not even knowing the ramifications of his decisions, in this case,
-  mass murder. The twist, to the surprise of almost no one, is that those demanding that
-  you must have "nothing to hide" had everything to hide.
-
-  My choice of using the python programming language and developing a game in a terminal
-  was done to complement the underlying themes in the game. The terminal feels cold, rough
-  and inhuman. It makes these awful sounds that make you uncomfortable, which is exactly
-  how you should feel when invading privacy, uncomfortable. I chose python specifically
-  because it's a very easy language to use and learn, and I already had some experience
-  with a python-like language coming from Godot's GD script. It also has great support for
-  these 8-bit like sounds, using the pygame library.
-
-  I used the idea of "quick wins" to customize the experience, give it some game feel and made it
-  to look and feel very mechanic. We can see how messages often start with [SYSTEM] or [INCOMING SECURE
-  TRANSMISSION]. Status bars will also appear after every processing to show your
-  'terminal' computing your decision. The bureaucratic and impersonal aspect of your work
-  also adds to this.
-  You will:
-  -    Process conversations
-  -    Make your judgement
-  -    Record your decision
-  -    Move on to the next
-
-  Not using an engine like Unity with which I was already familiar, helped me keep things
-  to a minimum while having an easier and more streamlined experience to deliver my
-  terminal-like look for the game. Ultimately, this decision helped me implement the
-  themes much better.
-
-  For the final prototype I did the following:
-  1.    Iterated on the audio design, added background white noise
-  2.    Expanded the narrative system to over 60 from the initial 18 conversations
-  3.    Branched the narrative system so that some decisions prompt new gameplay in the
-        form of extra working days or different endings or outcomes
-  4.    Changed the main menu and rulebook to fit the new thematics
-  5.    Added 3 other endings, with a total of 4 different endings to this game.
-  6.    Added rng elements where conversations will not be the same or be played in the
-        same days, with some intentional exceptions
-  7.    Added interrogation plotline and major reveal
-  8.    Added all of the new narrative elements, foreshadowing and whats up wordplay
-  9.    Changed some of the UI and UX formatting, such as skipping animations, or not
-        skipping some dialogue so the player has time to read it. Extra # characters were
-        also used for the UI, and the menu was expanded
-  10.   Changed the game from a simple surveillance sim to a complex narrative experience
-        with moral choice
-  11.   Iterated again and again on the conversations, some dialogues went through 4+
-        iterations before their final form
-  12.   Added the HP lovecraft quote for that epic foreshadowing
-  13.   Added an easter egg, one of the conversations texts is quoting Edward Snowden, a
-        prominent IRL figure who is fighting for privacy rights.
-  14.   I cannot stress how much I iterated on the conversation and narrative side in
-        order to fit the thematic as best as I could
-
-  All of these iterations came from testing the game by myself or with a couple of
-  friends.
-
-  I also want to mention I am quite proud of how I scoped this project.
-  
-  Everything in this project was done by me, with just some help here and there with coding from a locally run AI agent,
-  as I am not a programmer, nor do i want to deepen my programming skills.
-
-  [Press ENTER to close]
-
-####################################################################################################
-"""
+    return "#" * get_terminal_width()
 
 SCANNING_FRAMES = [
     "[ ..........  ] ANALYZING CONVERSATION",
@@ -1209,46 +904,69 @@ SCANNING_FRAMES = [
     "[ ##########  ] ANALYZING CONVERSATION"
 ]
 
-EYE_OPEN = """
-       ################
-       #  ##########  #
-       # ###    ###   #
-       ###  ####  ##  #
-       ###  ####  ##  #
-       # ###    ###   #
-       #  ##########  #
-       ################
-"""
-
-EYE_CLOSED = """
-       ################
-       #              #
-       #              #
-       #  ##########  #
-       #  ##########  #
-       #              #
-       #              #
-       ################
-"""
+# Static art screens (main_menu, rulebook, credits, eye_open, eye_closed) are
+# assets - their centered layouts are cached per terminal width
 
 # ============================================================================
 # SOUND FUNCTIONS
 # ============================================================================
 
+class TypingSoundBank:
+    """Typing sound variants - synthesized once, reused for every keystroke"""
+    SAMPLE_RATE = 22050
+    DURATION = 0.02
+    HALF_PERIODS = (8, 10, 12)  # Pitch variants, in samples per half wave
+
+    def __init__(self):
+        self.sounds = []
+        self.loaded = False
+        self.thread = None
+
+    def prepare(self):
+        """Synthesize the bank on a worker thread - keys typed before it is ready are silent"""
+        if self.thread is None and not self.loaded:
+            self.thread = threading.Thread(target=self.load, daemon=True)
+            self.thread.start()
+
+    def load(self):
+        """Synthesize every pitch/timbre variant (only the first call does work)"""
+        if self.loaded:
+            return
+        self.loaded = True
+        mixer = get_mixer()
+        if not mixer:
+            return
+        try:
+            import array
+            samples = int(self.SAMPLE_RATE * self.DURATION)
+            peak = int(32767 * 0.3)
+            sounds = []
+            for half_period in self.HALF_PERIODS:
+                # Hard square click (the classic terminal typing sound)
+                square = array.array('h', [peak if (i // half_period) % 2 else -peak for i in range(samples)])
+                # Softer click that fades out over the keystroke
+                soft = array.array('h', [int(value * (1 - i / samples)) for i, value in enumerate(square)])
+                for wave in (square, soft):
+                    sound = mixer.Sound(buffer=wave)
+                    sound.set_volume(0.2)
+                    sounds.append(sound)
+            self.sounds = sounds
+        except Exception as e:
+            warn_later(f"Could not create typing sounds: {e}")
+
+    def play(self):
+        """Play a random variant from the bank, once it is ready"""
+        if self.sounds:
+            random.choice(self.sounds).play()
+
+typing_sounds = TypingSoundBank()
+
 def play_typing_sound():
     """Play a typing sound effect"""
-    if not SOUND_ENABLED:
+    if not current_session().sound:
         return
     try:
-        import array
-        sample_rate = 22050
-        frequency = 800
-        duration = 0.02
-        samples = int(sample_rate * duration)
-        wave = array.array('h', [int(32767 * 0.3) if (i // 10) % 2 else int(-32767 * 0.3) for i in range(samples)])
-        sound = pygame.mixer.Sound(buffer=wave)
-        sound.set_volume(0.2)
-        sound.play()
+        typing_sounds.play()
     except:
         pass
 
@@ -1258,20 +976,28 @@ def play_typing_sound():
 
 def clear_screen():
     """Clear the terminal screen and add top terminal border"""
-    os.system('cls' if os.name == 'nt' else 'clear')
-    print(get_terminal_border())  # Add top margin border
+    screen.reset()
+    terminal.clear()
+    terminal.print(get_terminal_border())  # Add top margin border
 
 def get_terminal_width():
     """Get terminal width, default to TERM_WIDTH if can't detect"""
+    return current_session().geometry.columns
+
+async def ask(prompt):
+    """Read a line of input - the prompt is redrawn if the terminal is resized"""
+    session = current_session()
+    session.screen.prompt = prompt
+    if session.screen.relayout_pending:
+        session.screen.relayout()
     try:
-        import shutil
-        return shutil.get_terminal_size().columns
-    except:
-        return TERM_WIDTH
+        return await session.keyboard.read_line(prompt)
+    finally:
+        session.screen.prompt = None
+        session.screen.invalidate()  # The prompt and the typed answer are now on screen
 
-def center_in_terminal(text):
-    """Center text in the terminal"""
-    term_width = get_terminal_width()
+def center_text(text, term_width):
+    """Center text for a terminal of the given width"""
     lines = text.split('\n')
     centered_lines = []
     for line in lines:
@@ -1279,13 +1005,57 @@ def center_in_terminal(text):
         centered_lines.append(' ' * padding + line)
     return '\n'.join(centered_lines)
 
+def center_in_terminal(text):
+    """Center text in the terminal"""
+    return center_text(text, get_terminal_width())
+
+# ============================================================================
+# LAYOUT CACHE
+# ============================================================================
+
+LAYOUT_CACHE_SIZE = 32  # Rendered layouts kept, across all assets and widths
+
+@functools.lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def render_art(name, term_width):
+    """Centered block and lines for a static art asset (cached)"""
+    block = center_text(assets.text(name), term_width)
+    return block, tuple(block.split('\n'))
+
+def centered_art(name):
+    """A static art asset, centered for the current terminal width"""
+    return render_art(name, get_terminal_width())[0]
+
+def centered_art_lines(name):
+    """Screen lines of a static art asset, centered for the current terminal width"""
+    return render_art(name, get_terminal_width())[1]
+
+@functools.lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def render_scanning_frame(index, term_width):
+    """Screen lines for one step of the scanning animation (cached)"""
+    return tuple(panel_frame("", SCANNING_FRAMES[index].center(CONTENT_WIDTH), ""))
+
+# Cached layouts are only valid for the width they were rendered at
+geometry.on_resize(render_art.cache_clear)
+geometry.on_resize(render_scanning_frame.cache_clear)
+
+def bordered_line(line):
+    """A single centered line of content between border sides"""
+    padded = line.ljust(CONTENT_WIDTH)
+    return center_in_terminal(f"{BORDER_SIDE} {padded} {BORDER_SIDE}")
+
 def print_bordered(text):
     """Print text with border sides"""
+    term = current_session().terminal
     lines = text.split('\n')
     for line in lines:
-        padded = line.ljust(CONTENT_WIDTH)
-        bordered = f"{BORDER_SIDE} {padded} {BORDER_SIDE}"
-        print(center_in_terminal(bordered))
+        term.print(bordered_line(line))
+
+def panel_frame(*rows):
+    """Screen lines for a bordered panel under the top terminal border"""
+    lines = [get_terminal_border(), center_in_terminal(BORDER_TOP)]
+    lines.extend(bordered_line(row) for row in rows)
+    lines.append(center_in_terminal(BORDER_BOTTOM))
+    return lines
 
 def print_with_margin(text):
     """Print text with terminal margin borders - creates a framed effect"""
@@ -1305,396 +1075,401 @@ def print_with_margin(text):
         else:
             # If line is too long, truncate it
             framed_line = left_border + line[:available_width] + right_border
-        print(framed_line)
+        terminal.print(framed_line)
 
 def add_bottom_border():
     """Add bottom terminal border for framing"""
-    print(get_terminal_border())
-
-def slow_print(text, delay=0.03, use_sound=False, use_margins=True):
+    terminal.print(get_terminal_border())
+
+FRAME_RATE = 60  # Typewriter frames per second
+
+async def typewrite(anim, text, delay, use_sound=False, silent_chars=' \n', instant_chars=''):
+    """Type text out frame by frame - returns True if the animation was skipped
+
+    Every character is due `delay` seconds after the one before it (characters
+    in instant_chars take no time). Each frame writes everything that has come
+    due as one buffered write and checks for a skip once, instead of paying a
+    write, flush, skip poll and sleep for every single character.
+    """
+    frame_time = 1.0 / FRAME_RATE
+    start = anim.deadline  # Typing picks up where the animation's timeline is
+    next_frame = time.monotonic()
+    due = 0.0  # Time of text[pos], relative to start
+    pos = 0
+    while pos < len(text):
+        if anim.check_skip():
+            terminal.write(text[pos:])
+            terminal.flush()
+            return True
+
+        now = time.monotonic() - start
+        end = pos
+        audible = False
+        while end < len(text) and due <= now:
+            char = text[end]
+            if char not in silent_chars:
+                audible = True
+            if char not in instant_chars:
+                due += delay
+            end += 1
+
+        if end > pos:
+            terminal.write(text[pos:end])
+            terminal.flush()
+            if use_sound and audible:
+                play_typing_sound()
+            pos = end
+
+        if pos < len(text):
+            # Wake for the next frame, or later if the next character isn't due yet
+            wake = max(next_frame, start + due)
+            await anim.sleep_until(wake)
+            next_frame = wake + frame_time
+    anim.deadline = start + due
+    return False
+
+async def slow_print(text, delay=0.03, use_sound=False, use_margins=True):
     """Print text with typewriter effect - skippable with S key"""
     with SkippableAnimation("text") as anim:
         if use_margins:
             # Add terminal margin borders for framing
             term_width = get_terminal_width()
-            lines = text.split('\n')
-            for line in lines:
-                if anim.check_skip():
-                    # Print remaining lines instantly with margins
-                    for remaining_line in lines[lines.index(line):]:
-                        left_padding = (term_width - len(remaining_line) - 2) // 2
-                        right_padding = term_width - len(remaining_line) - left_padding - 2
-                        print("#" + ' ' * left_padding + remaining_line + ' ' * right_padding + "#")
-                    break
-                # Print each line with margin borders
+            framed_lines = []
+            for line in text.split('\n'):
                 left_padding = (term_width - len(line) - 2) // 2
                 right_padding = term_width - len(line) - left_padding - 2
-                framed_line = "#" + ' ' * left_padding + line + ' ' * right_padding + "#"
-                for char in framed_line:
-                    if anim.check_skip():
-                        sys.stdout.write(framed_line[framed_line.index(char):])
-                        sys.stdout.flush()
-                        break
-                    sys.stdout.write(char)
-                    sys.stdout.flush()
-                    if use_sound and char not in [' ', '\n', '#']:
-                        play_typing_sound()
-                    time.sleep(delay if char not in ['#'] else 0)  # Don't delay on borders
-                print()
+                framed_lines.append("#" + ' ' * left_padding + line + ' ' * right_padding + "#")
+            # Don't delay on borders or line breaks
+            await typewrite(anim, '\n'.join(framed_lines) + '\n', delay, use_sound,
+                      silent_chars=' \n#', instant_chars='#\n')
         else:
             # Original centered text without margins
-            centered = center_in_terminal(text)
-            for char in centered:
-                if anim.check_skip():
-                    sys.stdout.write(centered[centered.index(char):])
-                    sys.stdout.flush()
-                    break
-                sys.stdout.write(char)
-                sys.stdout.flush()
-                if use_sound and char not in [' ', '\n']:
-                    play_typing_sound()
-                time.sleep(delay)
-            print()
-
-def display_rulebook():
+            await typewrite(anim, center_in_terminal(text), delay, use_sound)
+            terminal.print()
+
+def art_frame(name):
+    """Screen lines for centered art between the top and bottom terminal borders"""
+    return [get_terminal_border(), *centered_art_lines(name), get_terminal_border()]
+
+async def display_rulebook():
     """Display the inspector's rulebook"""
-    clear_screen()
-    print(center_in_terminal(RULEBOOK))
-    add_bottom_border()  # Add terminal bottom border before input
+    screen.show(lambda: art_frame("rulebook"))
     centered_prompt = center_in_terminal(">>> Press ENTER to close manual <<<")
-    input(centered_prompt)
+    await ask(centered_prompt)
 
-def display_credits():
+async def display_credits():
     """Display the credits page"""
-    clear_screen()
-    print(center_in_terminal(CREDITS))
-    add_bottom_border()  # Add terminal bottom border before input
+    screen.show(lambda: art_frame("credits"))
     centered_prompt = center_in_terminal(">>> Press ENTER to close <<<")
-    input(centered_prompt)
+    await ask(centered_prompt)
 
 def create_menu_music():
     """Create an eerie beeping ambient sound for the menu"""
-    if not SOUND_ENABLED:
+    mixer = get_mixer()
+    if not mixer:
         return None
     try:
-        import array
-        import math
-        sample_rate = 22050
-        duration = 8.0  # 8 second loop for more complex rhythm
-        samples = int(sample_rate * duration)
-        
-        # Create the sound wave
-        wave = array.array('h', [0] * samples)
-        
-        # Deep bass pulse pattern (rhythmic heartbeat)
-        bass_times = [0.0, 0.5, 1.0, 2.0, 2.5, 3.0, 4.0, 4.5, 5.0, 6.0, 6.5, 7.0]
-        for bass_time in bass_times:
-            bass_start = int(bass_time * sample_rate)
-            bass_duration = int(0.3 * sample_rate)
-            
-            for i in range(bass_duration):
-                if bass_start + i < samples:
-                    t = i / sample_rate
-                    # Deep bass frequency (80-120 Hz range)
-                    freq = 90 + 30 * math.sin(t * 10)
-                    # Exponential decay for punch
-                    amplitude = int(20000 * math.exp(-t * 8))
-                    sample_value = int(amplitude * math.sin(2 * math.pi * freq * t))
-                    wave[bass_start + i] += sample_value
-        
-        # Mid-range rhythmic pulse (like industrial machinery)
-        pulse_times = [0.25, 1.25, 2.25, 3.25, 4.25, 5.25, 6.25, 7.25]
-        for pulse_time in pulse_times:
-            pulse_start = int(pulse_time * sample_rate)
-            pulse_duration = int(0.15 * sample_rate)
-            
-            for i in range(pulse_duration):
-                if pulse_start + i < samples:
-                    t = i / sample_rate
-                    freq = 200  # Mid-low frequency
-                    amplitude = int(12000 * (1 - i/pulse_duration))
-                    # Square wave for industrial feel
-                    sample_value = int(amplitude * (1 if math.sin(2 * math.pi * freq * t) > 0 else -1))
-                    wave[pulse_start + i] += sample_value
-        
-        # Atmospheric drone (constant low rumble)
-        for i in range(samples):
-            t = i / sample_rate
-            # Very low frequency drone (40 Hz)
-            drone_freq = 40
-            drone_amplitude = 3000
-            drone_value = int(drone_amplitude * math.sin(2 * math.pi * drone_freq * t))
-            wave[i] = max(-32767, min(32767, wave[i] + drone_value))
-        
-        # Occasional high pitched "surveillance" ping
-        ping_times = [1.5, 5.5]
-        for ping_time in ping_times:
-            ping_start = int(ping_time * sample_rate)
-            ping_duration = int(0.08 * sample_rate)
-            
-            for i in range(ping_duration):
-                if ping_start + i < samples:
-                    t = i / sample_rate
-                    freq = 1200  # High ping
-                    amplitude = int(8000 * (1 - i/ping_duration))
-                    sample_value = int(amplitude * math.sin(2 * math.pi * freq * t))
-                    wave[ping_start + i] += sample_value
-        
-        sound = pygame.mixer.Sound(buffer=wave)
+        import audio_synth
+        # Bass heartbeat, industrial pulses, 40 Hz drone and surveillance pings
+        sound = mixer.Sound(buffer=audio_synth.cached_menu_loop())
         sound.set_volume(0.35)
         return sound
     except Exception as e:
-        print(f"[WARNING] Could not create menu music: {e}")
+        warn_later(f"Could not create menu music: {e}")
         return None
 
 def create_ambient_sound():
     """Create ambient surveillance station background sound"""
-    if not SOUND_ENABLED:
+    mixer = get_mixer()
+    if not mixer:
         return None
     try:
-        import array
-        import math
-        sample_rate = 22050
-        duration = 6.0  # 6 second loop
-        samples = int(sample_rate * duration)
-        
-        wave = array.array('h', [0] * samples)
-        
-        # Electrical hum (like old monitors/equipment)
-        for i in range(samples):
-            t = i / sample_rate
-            hum_freq = 60  # Power line hum
-            hum_value = int(2000 * math.sin(2 * math.pi * hum_freq * t))
-            wave[i] += hum_value
-        
-        # Occasional surveillance beeps
-        beep_times = [1.0, 2.5, 4.0, 5.5]
-        for beep_time in beep_times:
-            beep_start = int(beep_time * sample_rate)
-            beep_duration = int(0.05 * sample_rate)  # Very short beep
-            
-            for i in range(beep_duration):
-                if beep_start + i < samples:
-                    t = i / sample_rate
-                    freq = 1000
-                    amplitude = int(6000 * (1 - i/beep_duration))
-                    sample_value = int(amplitude * math.sin(2 * math.pi * freq * t))
-                    wave[beep_start + i] += sample_value
-        
-        # White noise (static)
-        import random
-        for i in range(samples):
-            static = random.randint(-800, 800)
-            wave[i] = max(-32767, min(32767, wave[i] + static))
-        
-        sound = pygame.mixer.Sound(buffer=wave)
+        import audio_synth
+        # Power line hum, short surveillance beeps and white noise static
+        sound = mixer.Sound(buffer=audio_synth.cached_ambient_loop())
         sound.set_volume(0.15)  # Quiet background ambiance
         return sound
     except Exception as e:
-        print(f"[WARNING] Could not create ambient sound: {e}")
+        warn_later(f"Could not create ambient sound: {e}")
         return None
 
-def display_main_menu():
+class BackgroundLoop:
+    """Looping sound that is built on a worker thread and fades in once ready"""
+    def __init__(self, factory, fade_ms=1500):
+        self.factory = factory
+        self.fade_ms = fade_ms
+        self.sound = None
+        self.wanted = False
+        self.playing = False
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def prepare(self):
+        """Start building the sound in the background (only the first call does work)"""
+        if self.thread is None and current_session().sound:
+            self.thread = threading.Thread(target=self._build, daemon=True)
+            self.thread.start()
+        return self
+
+    def _build(self):
+        sound = self.factory()
+        with self.lock:
+            self.sound = sound
+            self._start_if_wanted()
+
+    def _start_if_wanted(self):
+        if self.wanted and self.sound and not self.playing:
+            self.sound.play(loops=-1, fade_ms=self.fade_ms)  # Loop indefinitely
+            self.playing = True
+
+    def play(self):
+        """Start looping now if the sound is ready, otherwise as soon as it is"""
+        self.prepare()
+        with self.lock:
+            self.wanted = True
+            self._start_if_wanted()
+
+    def stop(self):
+        """Stop the loop, or cancel playback that is still pending"""
+        with self.lock:
+            self.wanted = False
+            if self.playing:
+                self.sound.stop()
+                self.playing = False
+
+MENU_MESSAGES = [
+    ("\n         [SYSTEM] Welcome, Inspector. The State weakens. Rebellious thinking spreads.", 0.02),
+    ("         [SYSTEM] Analyze conversations. Detect treason. Report to the U.P Department.", 0.02),
+    ("         [SYSTEM] Those investigated by U.P... disappear. No one knows where.", 0.02),
+    ("         [SYSTEM] If you have nothing to hide, you have nothing to fear.", 0.02),
+    ("          [SYSTEM] Transparency is loyalty. Privacy is treason.\n", 0.02),
+    ("                     [HINT] Press 'S' at any time to skip animations\n", 0.015),
+]
+
+def menu_frame():
+    """Screen lines for the main menu once all its messages are typed out"""
+    lines = [get_terminal_border(), *centered_art_lines("main_menu")]
+    for text, _ in MENU_MESSAGES:
+        lines.extend(center_in_terminal(text).split('\n'))
+    lines.append(get_terminal_border())
+    return lines
+
+async def display_main_menu():
     """Display the main menu"""
 
-    # Create and start menu music
-    menu_music = create_menu_music()
-    if menu_music and SOUND_ENABLED:
-        menu_music.play(loops=-1)  # Loop indefinitely
+    # Build the menu music in the background - it fades in when ready
+    menu_music = BackgroundLoop(create_menu_music, fade_ms=2000)
+    menu_music.play()
 
     try:
         while True:
             clear_screen()
-            print(center_in_terminal(MAIN_MENU))
-            slow_print("\n         [SYSTEM] Welcome, Inspector. The State weakens. Rebellious thinking spreads.", 0.02, use_margins=False)
-            slow_print("         [SYSTEM] Analyze conversations. Detect treason. Report to the U.P Department.", 0.02, use_margins=False)
-            slow_print("         [SYSTEM] Those investigated by U.P... disappear. No one knows where.", 0.02, use_margins=False)
-            slow_print("         [SYSTEM] If you have nothing to hide, you have nothing to fear.", 0.02, use_margins=False)
-            slow_print("          [SYSTEM] Transparency is loyalty. Privacy is treason.\n", 0.02, use_margins=False)
-            slow_print("                     [HINT] Press 'S' at any time to skip animations\n", 0.015, use_margins=False)
+            terminal.print(centered_art("main_menu"))
+            for text, delay in MENU_MESSAGES:
+                await slow_print(text, delay, use_margins=False)
 
             add_bottom_border()  # Add terminal bottom border before input
+            screen.set_layout(menu_frame)
+            # Sound threads may have failed while the menu was typed out
+            print_pending_warnings()
             centered_prompt = center_in_terminal("   >>> Press ENTER to begin | R for Rulebook | C for Credits <<<")
-            user_input = input(centered_prompt).strip().lower()
+            user_input = (await ask(centered_prompt)).strip().lower()
 
             if user_input == 'r':
-                display_rulebook()
+                await display_rulebook()
             elif user_input == 'c':
-                display_credits()
+                await display_credits()
             else:
                 break  # Start the game
     finally:
         # Stop menu music when exiting
-        if menu_music and SOUND_ENABLED:
-            menu_music.stop()
+        menu_music.stop()
 
 
     
 
-def blink_eye():
+def eye_frame(name):
+    """Screen lines for the eye art, a few rows below the top border"""
+    return [get_terminal_border()] + [""] * 6 + list(centered_art_lines(name))
+
+async def blink_eye():
     """Animate a blinking eye - skippable"""
     with SkippableAnimation("eye_blink") as anim:
-        clear_screen()
-        print("\n" * 5)
-        print(center_in_terminal(EYE_OPEN))
+        screen.present(eye_frame("eye_open"))
+        await anim.wait(0.5)
         if not anim.check_skip():
-            time.sleep(0.5)
+            screen.present(eye_frame("eye_closed"))
+            await anim.wait(0.2)
         if not anim.check_skip():
-            clear_screen()
-            print("\n" * 5)
-            print(center_in_terminal(EYE_CLOSED))
-            time.sleep(0.2)
-        if not anim.check_skip():
-            clear_screen()
-            print("\n" * 5)
-            print(center_in_terminal(EYE_OPEN))
-            time.sleep(0.3)
+            screen.present(eye_frame("eye_open"))
+            await anim.wait(0.3)
 
-def scanning_animation():
+async def scanning_animation():
     """Display scanning animation - skippable"""
     with SkippableAnimation("scanning") as anim:
         for _ in range(2):
-            for frame in SCANNING_FRAMES:
+            for index in range(len(SCANNING_FRAMES)):
                 if anim.check_skip():
                     return
-                clear_screen()
-                print(center_in_terminal(BORDER_TOP))
-                print_bordered("")
-                print_bordered(frame.center(CONTENT_WIDTH))
-                print_bordered("")
-                print(center_in_terminal(BORDER_BOTTOM))
-                time.sleep(0.15)
-
-def display_conversation(conv):
+                screen.present(render_scanning_frame(index, get_terminal_width()))
+                await anim.wait(0.15)
+
+def conversation_header(conv):
+    """Screen lines for the intercepted conversation banner"""
+    return panel_frame(
+        "",
+        f"INTERCEPTED CONVERSATION #{conv.id}".center(CONTENT_WIDTH),
+        f"PARTICIPANTS: {', '.join(conv.participants)}".center(CONTENT_WIDTH),
+        "",
+    ) + [""]
+
+def message_line(speaker, message):
+    """A centered, fully typed conversation line"""
+    line = f"{speaker}: {message}"
+    padding = (get_terminal_width() - len("  " + line)) // 2
+    return ' ' * padding + "  " + line
+
+def conversation_frame(conv):
+    """Screen lines for a conversation once every message is typed out"""
+    lines = conversation_header(conv)
+    lines.extend(message_line(speaker, message) for speaker, message in conv.messages)
+    lines.extend(["", center_in_terminal(BORDER_TOP), bordered_line("")])
+    return lines
+
+async def display_conversation(conv):
     """Display a conversation with typing effect - skippable"""
-    clear_screen()
-    print(center_in_terminal(BORDER_TOP))
-    print_bordered("")
-    print_bordered(f"INTERCEPTED CONVERSATION #{conv['id']}".center(CONTENT_WIDTH))
-    print_bordered(f"PARTICIPANTS: {', '.join(conv['participants'])}".center(CONTENT_WIDTH))
-    print_bordered("")
-    print(center_in_terminal(BORDER_BOTTOM))
-    print()
-    
-    with SkippableAnimation("conversation") as anim:
-        for speaker, message in conv['messages']:
-            if not anim.check_skip():
-                time.sleep(0.6)
-            
-            line = f"{speaker}: {message}"
-            padding = (get_terminal_width() - len("  " + line)) // 2
-            
-            if anim.check_skip():
-                # Just print instantly
-                print(' ' * padding + "  " + line)
-            else:
-                # Animated typing
-                sys.stdout.write(' ' * padding + "  " + speaker + ": ")
-                sys.stdout.flush()
-                
-                for char in message:
-                    if anim.check_skip():
-                        # Print remaining message instantly
-                        sys.stdout.write(message[message.index(char):])
-                        sys.stdout.flush()
-                        break
-                    sys.stdout.write(char)
-                    sys.stdout.flush()
-                    if char not in [' ', ',', '.', '!', '?']:
-                        play_typing_sound()
-                    time.sleep(0.04)
-                print()
-    
-    print("\n" + center_in_terminal(BORDER_TOP))
-    print_bordered("")
+    # A resize while typing redraws the whole conversation once it is typed out
+    with screen.hold_relayout():
+        screen.show(lambda: conversation_header(conv))
+
+        with SkippableAnimation("conversation") as anim:
+            for speaker, message in conv.messages:
+                await anim.wait(0.6)
+
+                line = message_line(speaker, message)
+
+                if anim.check_skip():
+                    # Just print instantly
+                    anim.terminal.print(line)
+                else:
+                    # Animated typing
+                    anim.terminal.write(line[:len(line) - len(message)])
+                    await typewrite(anim, message, 0.04, use_sound=True, silent_chars=' ,.!?')
+                    anim.terminal.print()
 
-def get_player_judgment():
+        terminal.print("\n" + center_in_terminal(BORDER_TOP))
+        print_bordered("")
+        screen.set_layout(lambda: conversation_frame(conv))
+
+def judgment_options_frame():
+    """Screen lines for the judgment options under a conversation"""
+    rows = [
+        "YOUR ASSESSMENT, INSPECTOR?".center(CONTENT_WIDTH),
+        "",
+        "  [1] TREASONOUS - Report to U.P Department".ljust(CONTENT_WIDTH),
+        "  [2] LOYAL - No investigation needed".ljust(CONTENT_WIDTH),
+        "  [R] VIEW RULEBOOK".ljust(CONTENT_WIDTH),
+        "  [C] VIEW CREDITS".ljust(CONTENT_WIDTH),
+        "",
+    ]
+    return [bordered_line(row) for row in rows] + [center_in_terminal(BORDER_BOTTOM)]
+
+async def get_player_judgment():
     """Get player's judgment on the conversation"""
-    print_bordered("YOUR ASSESSMENT, INSPECTOR?".center(CONTENT_WIDTH))
-    print_bordered("")
-    print_bordered("  [1] TREASONOUS - Report to U.P Department".ljust(CONTENT_WIDTH))
-    print_bordered("  [2] LOYAL - No investigation needed".ljust(CONTENT_WIDTH))
-    print_bordered("  [R] VIEW RULEBOOK".ljust(CONTENT_WIDTH))
-    print_bordered("  [C] VIEW CREDITS".ljust(CONTENT_WIDTH))
-    print_bordered("")
-    print(center_in_terminal(BORDER_BOTTOM))
+    term = current_session().terminal
+    for line in judgment_options_frame():
+        term.print(line)
+    screen.extend_layout(judgment_options_frame)
 
     while True:
         prompt = center_in_terminal("\n>>> Enter your judgment (1, 2, R, or C): ")
-        choice = input(prompt).strip().lower()
+        choice = (await ask(prompt)).strip().lower()
 
         if choice == 'r':
-            display_rulebook()
+            await display_rulebook()
             return 'redisplay'
         elif choice == 'c':
-            display_credits()
+            await display_credits()
             return 'redisplay'
         elif choice in ['1', '2']:
             return choice == '1'
 
         error_msg = center_in_terminal("Invalid input. Enter 1, 2, R, or C.")
-        print(error_msg)
+        terminal.print(error_msg)
+
+LOG_ENV = "NOTHINGISUP_LOG"  # Set to a file to log every judgment to it
 
-def record_judgment(player_suspicious, conv):
-    """Record the player's judgment"""
-    actual_secret = conv['has_secret']
+async def record_judgment(player_suspicious, conv, latency=0.0):
+    """Record the player's judgment - `latency` is how long they took to decide"""
+    actual_secret = conv.has_secret
     correct = player_suspicious == actual_secret
-    
-    scanning_animation()
 
-    clear_screen()
-    print(center_in_terminal(BORDER_TOP))
-    print_bordered("")
-    print_bordered(">>> JUDGMENT RECORDED <<<".center(CONTENT_WIDTH))
-    print_bordered("")
+    session = current_session()
+    if session.judgment_log:
+        day = session.progress.day if session.progress else 0
+        session.judgment_log.record(session.id, conv.id, day, player_suspicious, correct, latency)
+    
+    await scanning_animation()
 
     if player_suspicious:
-        print_bordered("Case reported to U.P Department for investigation.".center(CONTENT_WIDTH))
+        verdict = "Case reported to U.P Department for investigation."
     else:
-        print_bordered("Citizens deemed loyal. No further action.".center(CONTENT_WIDTH))
-
-    print_bordered("")
-    print(center_in_terminal(BORDER_BOTTOM))
+        verdict = "Citizens deemed loyal. No further action."
+
+    # Drawn over the last scanning frame - only the changed rows are sent
+    screen.show(lambda: panel_frame(
+        "",
+        ">>> JUDGMENT RECORDED <<<".center(CONTENT_WIDTH),
+        "",
+        verdict.center(CONTENT_WIDTH),
+        "",
+    ))
     
     with SkippableAnimation("judgment_wait") as anim:
-        if not anim.check_skip():
-            time.sleep(1.5)
+        await anim.wait(1.5)
     
     return correct
 
-def display_daily_report(day_number, flagged_count, total_conversations):
+def day_intro_frame(day):
+    """Screen lines for the start of a surveillance shift"""
+    return panel_frame(
+        "",
+        f"DAY {day}".center(CONTENT_WIDTH),
+        "Beginning surveillance shift...".center(CONTENT_WIDTH),
+        "",
+    )
+
+async def display_daily_report(day_number, flagged_count, total_conversations):
     """Display end of day report"""
-    blink_eye()
-    
-    clear_screen()
-    print(center_in_terminal(BORDER_TOP))
-    print_bordered("")
-    print_bordered(f"DAY {day_number} - SHIFT COMPLETE".center(CONTENT_WIDTH))
-    print_bordered("")
-    print_bordered(f"Conversations Monitored: {total_conversations}".center(CONTENT_WIDTH))
-    print_bordered(f"Reported to U.P: {flagged_count}".center(CONTENT_WIDTH))
-    print_bordered(f"Deemed Loyal: {total_conversations - flagged_count}".center(CONTENT_WIDTH))
-    print_bordered("")
-    print_bordered("Report submitted to U.P Department Command.".center(CONTENT_WIDTH))
-    print_bordered("")
-    print(center_in_terminal(BORDER_BOTTOM))
+    await blink_eye()
+
+    screen.show(lambda: panel_frame(
+        "",
+        f"DAY {day_number} - SHIFT COMPLETE".center(CONTENT_WIDTH),
+        "",
+        f"Conversations Monitored: {total_conversations}".center(CONTENT_WIDTH),
+        f"Reported to U.P: {flagged_count}".center(CONTENT_WIDTH),
+        f"Deemed Loyal: {total_conversations - flagged_count}".center(CONTENT_WIDTH),
+        "",
+        "Report submitted to U.P Department Command.".center(CONTENT_WIDTH),
+        "",
+    ))
     
     with SkippableAnimation("report_wait") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
+        await anim.wait(2)
 
-def display_final_evaluation(score, total_days):
+async def display_final_evaluation(score, total_days, total_conversations):
     """Display final evaluation after all days"""
     clear_screen()
-    print(center_in_terminal(BORDER_TOP))
+    terminal.print(center_in_terminal(BORDER_TOP))
     print_bordered("")
     print_bordered("END OF WORK CYCLE - PERFORMANCE EVALUATION".center(CONTENT_WIDTH))
     print_bordered("")
     print_bordered(f"Total Days Worked: {total_days}".center(CONTENT_WIDTH))
-    print_bordered(f"Total Conversations Analyzed: {total_days * 6}".center(CONTENT_WIDTH))
+    print_bordered(f"Total Conversations Analyzed: {total_conversations}".center(CONTENT_WIDTH))
     print_bordered("")
 
-    percentage = (score / (total_days * 6)) * 100
+    percentage = (score / max(total_conversations, 1)) * 100
 
     if percentage == 100:
         print_bordered(">>> EXEMPLARY SERVICE <<<".center(CONTENT_WIDTH))
@@ -1707,85 +1482,51 @@ def display_final_evaluation(score, total_days):
         print_bordered("Mandatory retraining assigned.".center(CONTENT_WIDTH))
 
     print_bordered("")
-    print(center_in_terminal(BORDER_BOTTOM))
+    terminal.print(center_in_terminal(BORDER_BOTTOM))
 
     with SkippableAnimation("final_wait") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
+        await anim.wait(2)
 
-    slow_print("\n              ...But who watches the watchers?", 0.08, use_margins=False)
-    slow_print("              ...And what do they hide?\n", 0.08, use_margins=False)
+    await slow_print("\n              ...But who watches the watchers?", 0.08, use_margins=False)
+    await slow_print("              ...And what do they hide?\n", 0.08, use_margins=False)
     add_bottom_border()  # Add terminal bottom border at end
 
-def handle_agent_questions():
+async def handle_agent_questions():
     """Handle Day 7 agent investigation questions - returns True if player passes"""
-    questions = [
-        {
-            "question": "You cleared several conversations that mentioned anti-State sentiment. Why?",
-            "options": [
-                "[1] They were discussing fiction, not real plans",
-                "[2] I may have made errors. I'll review them again",
-                "[3] They weren't serious threats to the State"
-            ],
-            "correct": 2
-        },
-        {
-            "question": "Do you believe the U.P Department is effective in maintaining order?",
-            "options": [
-                "[1] Yes, fear of U.P keeps the population compliant",
-                "[2] I don't question State methods",
-                "[3] I've never seen evidence of their effectiveness"
-            ],
-            "correct": 2
-        },
-        {
-            "question": "If you discovered a friend expressing anti-State views, what would you do?",
-            "options": [
-                "[1] Report them immediately to U.P",
-                "[2] Try to re-educate them about State loyalty",
-                "[3] Assess if they're an actual threat first"
-            ],
-            "correct": 1
-        }
-    ]
 
     clear_screen()
-    print(center_in_terminal(BORDER_TOP))
+    terminal.print(center_in_terminal(BORDER_TOP))
     print_bordered("")
     print_bordered("DAY 7 - INTERNAL AFFAIRS INVESTIGATION".center(CONTENT_WIDTH))
     print_bordered("")
-    print(center_in_terminal(BORDER_BOTTOM))
+    terminal.print(center_in_terminal(BORDER_BOTTOM))
 
     with SkippableAnimation("investigation_intro") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
+        await anim.wait(2)
 
-    slow_print("\n         An encrypted message appears on your terminal...", 0.04, use_margins=False)
-    slow_print("         Someone is watching your work. Testing your loyalty.\n", 0.04, use_margins=False)
+    await slow_print("\n         An encrypted message appears on your terminal...", 0.04, use_margins=False)
+    await slow_print("         Someone is watching your work. Testing your loyalty.\n", 0.04, use_margins=False)
 
     add_bottom_border()  # Add terminal bottom border before input
     prompt = center_in_terminal("\n>>> Press ENTER to begin interrogation <<<")
-    input(prompt)
+    await ask(prompt)
 
     score = 0
-    for i, q in enumerate(questions):
-        clear_screen()
-        print(center_in_terminal(BORDER_TOP))
-        print_bordered("")
-        print_bordered(f"QUESTION {i+1} OF {len(questions)}".center(CONTENT_WIDTH))
-        print_bordered("")
-        print_bordered(q["question"].center(CONTENT_WIDTH))
-        print_bordered("")
-
-        for option in q["options"]:
-            print_bordered(f"  {option}".ljust(CONTENT_WIDTH))
-
-        print_bordered("")
-        print(center_in_terminal(BORDER_BOTTOM))
+    for i, q in enumerate(AGENT_QUESTIONS):
+        rows = [
+            "",
+            f"QUESTION {i+1} OF {len(AGENT_QUESTIONS)}".center(CONTENT_WIDTH),
+            "",
+            q["question"].center(CONTENT_WIDTH),
+            "",
+        ]
+        rows.extend(f"  {option}".ljust(CONTENT_WIDTH) for option in q["options"])
+        rows.append("")
+        screen.show(lambda: panel_frame(*rows))
 
         while True:
             prompt = center_in_terminal("\n>>> Enter your answer (1, 2, or 3): ")
-            choice = input(prompt).strip()
+            choice = (await ask(prompt)).strip()
 
             if choice in ['1', '2', '3']:
                 if int(choice) == q["correct"]:
@@ -1793,28 +1534,26 @@ def handle_agent_questions():
                 break
             else:
                 error_msg = center_in_terminal("Invalid input. Enter 1, 2, or 3.")
-                print(error_msg)
+                terminal.print(error_msg)
 
         with SkippableAnimation("question_wait") as anim:
-            if not anim.check_skip():
-                time.sleep(1)
+            await anim.wait(1)
 
     # Result
     clear_screen()
-    print(center_in_terminal(BORDER_TOP))
+    terminal.print(center_in_terminal(BORDER_TOP))
     print_bordered("")
 
-    if score >= 2:  # Need at least 2/3 correct to pass
+    if score >= INTERROGATION_PASS_SCORE:
         print_bordered(">>> INTERROGATION COMPLETE <<<".center(CONTENT_WIDTH))
         print_bordered("")
         print_bordered("Your answers are... acceptable.".center(CONTENT_WIDTH))
         print_bordered("Surveillance of your work will continue.".center(CONTENT_WIDTH))
         print_bordered("")
-        print(center_in_terminal(BORDER_BOTTOM))
+        terminal.print(center_in_terminal(BORDER_BOTTOM))
 
         with SkippableAnimation("pass_wait") as anim:
-            if not anim.check_skip():
-                time.sleep(2)
+            await anim.wait(2)
 
         return True
     else:
@@ -1825,466 +1564,772 @@ def handle_agent_questions():
         print_bordered("")
         print_bordered("Report to Processing Center immediately.".center(CONTENT_WIDTH))
         print_bordered("")
-        print(center_in_terminal(BORDER_BOTTOM))
+        terminal.print(center_in_terminal(BORDER_BOTTOM))
 
         with SkippableAnimation("fail_wait") as anim:
-            if not anim.check_skip():
-                time.sleep(3)
+            await anim.wait(3)
 
         return False
 
-def display_final_choice():
+async def display_final_choice():
     """Display the final choice to share information with rebels"""
-    clear_screen()
-    print(center_in_terminal(BORDER_TOP))
-    print_bordered("")
-    print_bordered("THE CHOICE".center(CONTENT_WIDTH))
-    print_bordered("")
-    print_bordered("You now know the truth: The U.P Department is fiction.".center(CONTENT_WIDTH))
-    print_bordered("People you flagged weren't processed. They were murdered.".center(CONTENT_WIDTH))
-    print_bordered("")
-    print_bordered("The rebels you saved are still organizing resistance.".center(CONTENT_WIDTH))
-    print_bordered("You could tell them the truth. Remove the State's greatest weapon: fear.".center(CONTENT_WIDTH))
-    print_bordered("")
-    print_bordered("But sharing this information is treason. You would be marked for death.".center(CONTENT_WIDTH))
-    print_bordered("")
-    print_bordered("What will you do?".center(CONTENT_WIDTH))
-    print_bordered("")
-    print_bordered("  [1] SHARE THE TRUTH - Tell the rebels that U.P doesn't exist".ljust(CONTENT_WIDTH))
-    print_bordered("  [2] STAY SILENT - Keep the secret. Protect yourself.".ljust(CONTENT_WIDTH))
-    print_bordered("")
-    print(center_in_terminal(BORDER_BOTTOM))
+    screen.show(lambda: panel_frame(
+        "",
+        "THE CHOICE".center(CONTENT_WIDTH),
+        "",
+        "You now know the truth: The U.P Department is fiction.".center(CONTENT_WIDTH),
+        "People you flagged weren't processed. They were murdered.".center(CONTENT_WIDTH),
+        "",
+        "The rebels you saved are still organizing resistance.".center(CONTENT_WIDTH),
+        "You could tell them the truth. Remove the State's greatest weapon: fear.".center(CONTENT_WIDTH),
+        "",
+        "But sharing this information is treason. You would be marked for death.".center(CONTENT_WIDTH),
+        "",
+        "What will you do?".center(CONTENT_WIDTH),
+        "",
+        "  [1] SHARE THE TRUTH - Tell the rebels that U.P doesn't exist".ljust(CONTENT_WIDTH),
+        "  [2] STAY SILENT - Keep the secret. Protect yourself.".ljust(CONTENT_WIDTH),
+        "",
+    ))
 
     while True:
         prompt = center_in_terminal("\n>>> Enter your choice (1 or 2): ")
-        choice = input(prompt).strip()
+        choice = (await ask(prompt)).strip()
 
         if choice in ['1', '2']:
             return choice == '1'
 
         error_msg = center_in_terminal("Invalid input. Enter 1 or 2.")
-        print(error_msg)
+        terminal.print(error_msg)
 
-def display_good_ending():
-    """Display the good ending - shared truth with rebels"""
-    blink_eye()
+async def display_ending(name):
+    """Play an ending from its asset: title, story paragraphs with pauses, closing banner"""
+    ending = assets.json(f"ending_{name}")
+    await blink_eye()
 
     clear_screen()
-    print(center_in_terminal(BORDER_TOP))
+    terminal.print(center_in_terminal(BORDER_TOP))
     print_bordered("")
-    print_bordered("ENDING: THE TRUTH SPREADS".center(CONTENT_WIDTH))
+    print_bordered(ending["title"].center(CONTENT_WIDTH))
     print_bordered("")
-    print(center_in_terminal(BORDER_BOTTOM))
+    terminal.print(center_in_terminal(BORDER_BOTTOM))
 
-    slow_print("\n         You send an encrypted message to the rebel contacts.", 0.05, use_margins=False)
-    slow_print("         You tell them everything. The U.P Department is a lie.", 0.05, use_margins=False)
-    slow_print("         There is no facility. No officers. Only execution squads.\n", 0.05, use_margins=False)
+    for index, paragraph in enumerate(ending["story"]):
+        lines = [f"         {line}" for line in paragraph["lines"]]
+        if index == 0:
+            lines[0] = "\n" + lines[0]
+        lines[-1] += "\n"
+        for line in lines:
+            await slow_print(line, 0.05, use_margins=False)
 
-    with SkippableAnimation("ending_pause") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
-
-    slow_print("         The message spreads through the resistance network.", 0.05, use_margins=False)
-    slow_print("         Within days, everyone knows: Nothing is U.P.\n", 0.05, use_margins=False)
-
-    with SkippableAnimation("ending_pause2") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
-
-    slow_print("         The State's most powerful weapon - fear of the unknown - is broken.", 0.05, use_margins=False)
-    slow_print("         People stop being afraid of disappearing to a mysterious department.", 0.05, use_margins=False)
-    slow_print("         They see it for what it is: State-sponsored murder.\n", 0.05, use_margins=False)
-
-    with SkippableAnimation("ending_pause3") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
-
-    slow_print("         The rebellion grows. Protests multiply.", 0.05, use_margins=False)
-    slow_print("         The dying State has lost its grip on the population.\n", 0.05, use_margins=False)
-
-    with SkippableAnimation("ending_pause4") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
-
-    slow_print("         As for you?", 0.05, use_margins=False)
-    slow_print("         They'll come for you soon. You know that.", 0.05, use_margins=False)
-    slow_print("         But you made the right choice.\n", 0.05, use_margins=False)
-
-    with SkippableAnimation("ending_pause5") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
+        with SkippableAnimation("ending_pause" if index == 0 else f"ending_pause{index + 1}") as anim:
+            await anim.wait(paragraph["pause"])
 
     clear_screen()
-    print(center_in_terminal(BORDER_TOP))
+    terminal.print(center_in_terminal(BORDER_TOP))
     print_bordered("")
-    print_bordered(">>> NOTHING WAS U.P <<<".center(CONTENT_WIDTH))
-    print_bordered(">>> THE LIE IS BROKEN <<<".center(CONTENT_WIDTH))
+    for line in ending["banner"]:
+        print_bordered(line.center(CONTENT_WIDTH))
     print_bordered("")
     print_bordered("Thank you for playing.".center(CONTENT_WIDTH))
     print_bordered("")
-    print(center_in_terminal(BORDER_BOTTOM))
+    terminal.print(center_in_terminal(BORDER_BOTTOM))
     add_bottom_border()  # Add terminal bottom border at end
 
-def display_bad_ending_silence():
-    """Display bad ending - stayed silent"""
-    blink_eye()
-
-    clear_screen()
-    print(center_in_terminal(BORDER_TOP))
-    print_bordered("")
-    print_bordered("ENDING: SILENCE".center(CONTENT_WIDTH))
-    print_bordered("")
-    print(center_in_terminal(BORDER_BOTTOM))
-
-    slow_print("\n         You say nothing.", 0.05, use_margins=False)
-    slow_print("         The truth dies with you.", 0.05, use_margins=False)
-    slow_print("         You return to work the next day. Business as usual.\n", 0.05, use_margins=False)
-
-    with SkippableAnimation("ending_pause") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
-
-    slow_print("         Two weeks later, you hear the news.", 0.05, use_margins=False)
-    slow_print("         The rebels you saved have been captured.", 0.05, use_margins=False)
-    slow_print("         All of them. Executed.\n", 0.05, use_margins=False)
-
-    with SkippableAnimation("ending_pause2") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
-
-    slow_print("         The State labels it a victory against terrorism.", 0.05, use_margins=False)
-    slow_print("         Your supervisor commends your earlier 'corrections' to flagging patterns.", 0.05, use_margins=False)
-    slow_print("         They think you finally saw the error of your ways.\n", 0.05, use_margins=False)
-
-    with SkippableAnimation("ending_pause3") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
-
-    slow_print("         You know the truth about U.P.", 0.05, use_margins=False)
-    slow_print("         You know what happens to those you flag.", 0.05, use_margins=False)
-    slow_print("         But you keep working. Keep flagging. Keep sending people to death.\n", 0.05, use_margins=False)
-
-    with SkippableAnimation("ending_pause4") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
+async def display_good_ending():
+    """Display the good ending - shared truth with rebels"""
+    await display_ending("good")
 
-    slow_print("         The State endures.", 0.05, use_margins=False)
-    slow_print("         The lie endures.", 0.05, use_margins=False)
-    slow_print("         And you endure.\n", 0.05, use_margins=False)
+async def display_bad_ending_silence():
+    """Display bad ending - stayed silent"""
+    await display_ending("silence")
 
-    with SkippableAnimation("ending_pause5") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
+async def display_bad_ending_caught():
+    """Display bad ending - caught by Internal Affairs"""
+    await display_ending("caught")
 
-    clear_screen()
-    print(center_in_terminal(BORDER_TOP))
-    print_bordered("")
-    print_bordered(">>> YOU CHOSE SAFETY OVER TRUTH <<<".center(CONTENT_WIDTH))
-    print_bordered(">>> THE REBELS ARE DEAD <<<".center(CONTENT_WIDTH))
-    print_bordered("")
-    print_bordered("Thank you for playing.".center(CONTENT_WIDTH))
-    print_bordered("")
-    print(center_in_terminal(BORDER_BOTTOM))
-    add_bottom_border()  # Add terminal bottom border at end
+# ============================================================================
+# PROFILING
+# ============================================================================
 
-def display_bad_ending_caught():
-    """Display bad ending - caught by Internal Affairs"""
-    blink_eye()
+PROFILE_ENV = "NOTHINGISUP_PROFILE"  # Set to a directory to profile every phase
+PROFILE_TOP = 20  # Rows in the summary printed on exit
 
-    clear_screen()
-    print(center_in_terminal(BORDER_TOP))
-    print_bordered("")
-    print_bordered("ENDING: INVESTIGATED".center(CONTENT_WIDTH))
-    print_bordered("")
-    print(center_in_terminal(BORDER_BOTTOM))
+class PhaseProfiler:
+    """Opt-in cProfile per game phase, written out as pstats files
 
-    slow_print("\n         Your answers raised too many red flags.", 0.05, use_margins=False)
-    slow_print("         Internal Affairs has marked you as a rebel sympathizer.", 0.05, use_margins=False)
-    slow_print("         You are flagged for investigation by the U.P Department.\n", 0.05, use_margins=False)
+    Phases nest (day1/conversation17/judgment). Entering a phase pauses the
+    enclosing phase's profiler, so every call is counted in exactly one
+    phase, and entering the same phase again adds to its profile. Prompts
+    count too - time spent waiting for the player shows up under select.
+    """
+    def __init__(self):
+        self.directory = None  # Profiling is off until enable()
+        self.profiles = {}  # Phase path -> cProfile.Profile, in the order first entered
+        self.stack = []  # (path, profile) of the phases being run
+
+    def enable(self, directory):
+        self.directory = directory
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Profile the enclosed block as its own phase"""
+        if self.directory is None:
+            yield
+            return
+        import cProfile
+        path = f"{self.stack[-1][0]}/{name}" if self.stack else name
+        profile = self.profiles.setdefault(path, cProfile.Profile())
+        if self.stack:
+            self.stack[-1][1].disable()
+        self.stack.append((path, profile))
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self.stack.pop()
+            if self.stack:
+                self.stack[-1][1].enable()
+
+    def report(self, top=PROFILE_TOP):
+        """Write one pstats file per phase, then print the slowest phases and functions"""
+        if not self.profiles:
+            return
+        import pstats
+        os.makedirs(self.directory, exist_ok=True)
+        phases = []
+        combined = None
+        for index, (path, profile) in enumerate(self.profiles.items(), 1):
+            profile.dump_stats(os.path.join(self.directory, f"{index:03d}-{path.replace('/', '-')}.pstats"))
+            stats = pstats.Stats(profile)
+            phases.append((stats.total_tt, path))
+            if combined is None:
+                combined = stats
+            else:
+                combined.add(stats)
 
-    with SkippableAnimation("ending_pause") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
+        print(f"\n[PROFILE] {len(phases)} phases written to {os.path.abspath(self.directory)}")
+        print(f"\n{'seconds':>10}  phase (own time, without nested phases)")
+        for seconds, path in sorted(phases, reverse=True)[:top]:
+            print(f"{seconds:>10.3f}  {path}")
+        print()
+        combined.sort_stats(pstats.SortKey.TIME).print_stats(top)
 
-    slow_print("         That night, an unmarked van arrives at your home.", 0.05, use_margins=False)
-    slow_print("         No insignia. No identification. Just armed men.", 0.05, use_margins=False)
-    slow_print("         You now understand: there is no U.P Department.\n", 0.05, use_margins=False)
+profiler = PhaseProfiler()
 
-    with SkippableAnimation("ending_pause2") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
+# ============================================================================
+# GAME LOGIC
+# ============================================================================
 
-    slow_print("         There is no facility.", 0.05, use_margins=False)
-    slow_print("         There is no processing.", 0.05, use_margins=False)
-    slow_print("         There is only this van, and the darkness beyond.\n", 0.05, use_margins=False)
+CONVERSATIONS_PER_DAY = 6
+WORK_DAYS = 6  # Days 1-6 of normal surveillance work
+
+# Scripted conversation for each working day: (day, conversation id, condition).
+# With a condition, the conversation is only shown if that rebel conversation
+# was flagged correctly. Every other slot is filled from the shuffled pool.
+DAY_PLAN = (
+    (1, 1, None),
+    (2, 2, None),
+    (3, 3, None),
+    (4, 4, 1),
+    (5, 5, 2),
+    (6, 6, 3),
+)
+
+# Day 7 interrogation - need at least 2/3 correct to pass
+AGENT_QUESTIONS = [
+    {
+        "question": "You cleared several conversations that mentioned anti-State sentiment. Why?",
+        "options": [
+            "[1] They were discussing fiction, not real plans",
+            "[2] I may have made errors. I'll review them again",
+            "[3] They weren't serious threats to the State"
+        ],
+        "correct": 2
+    },
+    {
+        "question": "Do you believe the U.P Department is effective in maintaining order?",
+        "options": [
+            "[1] Yes, fear of U.P keeps the population compliant",
+            "[2] I don't question State methods",
+            "[3] I've never seen evidence of their effectiveness"
+        ],
+        "correct": 2
+    },
+    {
+        "question": "If you discovered a friend expressing anti-State views, what would you do?",
+        "options": [
+            "[1] Report them immediately to U.P",
+            "[2] Try to re-educate them about State loyalty",
+            "[3] Assess if they're an actual threat first"
+        ],
+        "correct": 1
+    }
+]
 
-    with SkippableAnimation("ending_pause3") as anim:
-        if not anim.check_skip():
-            time.sleep(2)
+INTERROGATION_PASS_SCORE = 2
+
+def deal_conversations(count, rng=random):
+    """`count` random filler conversations, in the order the days will draw them
+
+    Only as many as the days can use are drawn, so dealing costs the same
+    however large the library grows.
+    """
+    filler = CONVERSATIONS.role(ROLE_FILLER)
+    return rng.sample(filler, min(len(filler), count))
+
+class DayScheduler:
+    """Deals each working day's conversations from the DAY_PLAN table
+
+    Filler comes from a pool dealt once per game and read with a cursor, so
+    no day copies or trims the pool. `shown` counts the conversations
+    actually dealt, which is what a day's score should be measured against.
+    All randomness comes from `seed`, each day shuffling with its own
+    generator, so a saved game needs nothing more than the seed to go on.
+    """
+    def __init__(self, days=WORK_DAYS, conversations_per_day=CONVERSATIONS_PER_DAY,
+                 plan=DAY_PLAN, seed=None, pool=None):
+        self.days = days
+        self.conversations_per_day = conversations_per_day
+        self.plan = {day: (conv_id, condition) for day, conv_id, condition in plan}
+        self.seed = random.getrandbits(64) if seed is None else seed
+        if pool is None:
+            pool = deal_conversations(days * conversations_per_day, random.Random(self.seed))
+        self.pool = pool
+        self.cursor = 0  # Next pool conversation to deal
+        self.shown = 0  # Conversations dealt so far
+
+    def day(self, day, flagged_correctly):
+        """Conversations for one working day, in shuffled order"""
+        day_conversations = []
+        conv_id, condition = self.plan.get(day, (None, None))
+        if conv_id is not None and (condition is None or flagged_correctly[condition]):
+            day_conversations.append(CONVERSATIONS.get(conv_id))
+
+        end = min(self.cursor + self.conversations_per_day - len(day_conversations), len(self.pool))
+        for index in range(self.cursor, end):
+            day_conversations.append(self.pool[index])
+        self.cursor = end
+        self.shown += len(day_conversations)
+
+        # Shuffle the day's conversations to randomize order within the day
+        random.Random(f"{self.seed}:{day}").shuffle(day_conversations)
+        return day_conversations
+
+def track_rebel_judgment(conv, player_judgment, correct, flagged_correctly, helped_rebels):
+    """Remember how the player treated rebel conversations 1-3"""
+    if conv.role == ROLE_REBEL:
+        if correct and player_judgment:  # Correctly flagged as treasonous
+            flagged_correctly[conv.id] = True
+        elif not player_judgment and conv.has_secret:  # Incorrectly marked as loyal (helped rebels)
+            helped_rebels[conv.id] = True
+
+class Progress:
+    """How far a game has got - the day, the next conversation and the score"""
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self.day = 1
+        self.day_conversations = None  # None until the day has been dealt
+        self.index = 0  # Next conversation of the day to show
+        self.day_flagged_count = 0
+        # Track if player helped rebels (marked as loyal when they were treasonous)
+        self.helped_rebels = dict.fromkeys(REBEL_IDS, False)
+        self.flagged_correctly = dict.fromkeys(REBEL_IDS, False)
+        self.total_score = 0
+
+    def start_day(self, day):
+        """Deal a working day's conversations"""
+        self.day = day
+        self.day_conversations = self.scheduler.day(day, self.flagged_correctly)
+        self.index = 0
+        self.day_flagged_count = 0
+
+    def judged(self, conv, player_judgment, correct):
+        """Count a judgment and move on to the next conversation"""
+        if player_judgment:
+            self.day_flagged_count += 1
+        if correct:
+            self.total_score += 1
+        track_rebel_judgment(conv, player_judgment, correct, self.flagged_correctly, self.helped_rebels)
+        self.index += 1
+
+    def snapshot(self):
+        return Snapshot(self.scheduler.seed, self.day, self.index, self.day_flagged_count,
+                        self.flagged_correctly, self.helped_rebels, self.total_score,
+                        self.scheduler.cursor, self.scheduler.shown,
+                        [conv.id for conv in self.scheduler.pool],
+                        [conv.id for conv in self.day_conversations])
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Progress as saved, picking up at the interrupted conversation"""
+        scheduler = DayScheduler(seed=snapshot.seed, pool=[CONVERSATIONS.get(i) for i in snapshot.pool_ids])
+        scheduler.cursor = snapshot.cursor
+        scheduler.shown = snapshot.shown
+        progress = cls(scheduler)
+        progress.day = snapshot.day
+        progress.day_conversations = [CONVERSATIONS.get(i) for i in snapshot.day_ids]
+        progress.index = snapshot.index
+        progress.day_flagged_count = snapshot.day_flagged_count
+        progress.helped_rebels = snapshot.helped_rebels
+        progress.flagged_correctly = snapshot.flagged_correctly
+        progress.total_score = snapshot.total_score
+        return progress
 
-    slow_print("         Nothing was U.P.", 0.05, use_margins=False)
-    slow_print("         And now, nothing is left of you.\n", 0.05, use_margins=False)
+# ============================================================================
+# SAVE GAMES
+# ============================================================================
 
-    with SkippableAnimation("ending_pause4") as anim:
-        if not anim.check_skip():
-            time.sleep(3)
+SAVE_MAGIC = b"NUPS"
+SAVE_VERSION = 1
+SAVE_HEADER = struct.Struct("<4sHQBBBBBHHHHB")
 
-    clear_screen()
-    print(center_in_terminal(BORDER_TOP))
-    print_bordered("")
-    print_bordered(">>> YOU HAVE BEEN DISAPPEARED <<<".center(CONTENT_WIDTH))
-    print_bordered(">>> NOTHING IS U.P <<<".center(CONTENT_WIDTH))
-    print_bordered("")
-    print_bordered("Thank you for playing.".center(CONTENT_WIDTH))
-    print_bordered("")
-    print(center_in_terminal(BORDER_BOTTOM))
-    add_bottom_border()  # Add terminal bottom border at end
+def data_dir():
+    """Per-user directory for save games"""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Application Support')
+    else:
+        base = os.environ.get('XDG_STATE_HOME') or os.path.expanduser('~/.local/state')
+    return os.path.join(base, 'NothingIsUP')
+
+def rebel_bits(flags):
+    """Pack a {rebel id: bool} dict into a bit field"""
+    return sum(1 << n for n, conv_id in enumerate(REBEL_IDS) if flags[conv_id])
+
+def rebel_flags(bits):
+    return {conv_id: bool(bits & (1 << n)) for n, conv_id in enumerate(REBEL_IDS)}
+
+class Snapshot:
+    """Everything needed to resume a shift at the next unjudged conversation
+
+    The conversation order is kept as ids and randomness as the game seed,
+    so a snapshot is a couple of hundred bytes.
+    """
+    __slots__ = ('seed', 'day', 'index', 'day_flagged_count', 'flagged_correctly', 'helped_rebels',
+                 'total_score', 'cursor', 'shown', 'pool_ids', 'day_ids')
+
+    def __init__(self, seed, day, index, day_flagged_count, flagged_correctly, helped_rebels,
+                 total_score, cursor, shown, pool_ids, day_ids):
+        self.seed = seed
+        self.day = day
+        self.index = index  # Next conversation of the day to show
+        self.day_flagged_count = day_flagged_count
+        self.flagged_correctly = flagged_correctly
+        self.helped_rebels = helped_rebels
+        self.total_score = total_score
+        self.cursor = cursor
+        self.shown = shown
+        self.pool_ids = pool_ids
+        self.day_ids = day_ids
+
+    def pack(self):
+        ids = struct.pack(f"<{len(self.pool_ids) + len(self.day_ids)}I", *self.pool_ids, *self.day_ids)
+        return SAVE_HEADER.pack(SAVE_MAGIC, SAVE_VERSION, self.seed, self.day, self.index,
+                                self.day_flagged_count, rebel_bits(self.flagged_correctly),
+                                rebel_bits(self.helped_rebels), self.total_score, self.cursor,
+                                self.shown, len(self.pool_ids), len(self.day_ids)) + ids
+
+    @classmethod
+    def unpack(cls, data):
+        """Snapshot from bytes - ValueError if they aren't a save this version can read"""
+        try:
+            (magic, version, seed, day, index, day_flagged_count, flagged, helped,
+             total_score, cursor, shown, pool_count, day_count) = SAVE_HEADER.unpack_from(data)
+            if magic != SAVE_MAGIC or version != SAVE_VERSION:
+                raise ValueError("not a save game for this version")
+            ids = struct.unpack_from(f"<{pool_count + day_count}I", data, SAVE_HEADER.size)
+        except struct.error:
+            raise ValueError("truncated save game") from None
+        return cls(seed, day, index, day_flagged_count, rebel_flags(flagged), rebel_flags(helped),
+                   total_score, cursor, shown, list(ids[:pool_count]), list(ids[pool_count:]))
+
+def _fsync_directory(directory):
+    """Make a rename in `directory` durable - not possible (or needed) on Windows"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+class SaveFile:
+    """Save slot on disk, replaced atomically on every write
+
+    Every write goes to a temp file that is fsynced before it is renamed
+    over the slot, and the directory is fsynced after, so even a power cut
+    leaves the previous snapshot or the new one, never a partial file.
+    A snapshot is under 200 bytes, so this costs one small sync per judgment.
+    """
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, snapshot):
+        directory = os.path.dirname(self.path)
+        try:
+            import tempfile
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        except OSError as e:
+            print(f"[WARNING] Could not save game: {e}")
+            return
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(snapshot.pack())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[WARNING] Could not save game: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        _fsync_directory(directory)
+
+    def load(self):
+        """The saved snapshot, or None if there is no usable one"""
+        try:
+            with open(self.path, 'rb') as f:
+                snapshot = Snapshot.unpack(f.read())
+            # The conversations may come from a different library now
+            for conv_id in snapshot.pool_ids + snapshot.day_ids:
+                CONVERSATIONS.get(conv_id)
+            return snapshot
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+console_session.save_file = SaveFile(os.path.join(data_dir(), 'shift.sav'))
+
+async def offer_resume():
+    """Ask whether to resume an interrupted shift - returns its snapshot or None"""
+    snapshot = save_file.load() if save_file else None
+    if snapshot is None:
+        return None
+    screen.show(lambda: panel_frame(
+        "",
+        "INTERRUPTED SHIFT FOUND".center(CONTENT_WIDTH),
+        "",
+        f"Day {snapshot.day}, conversation {snapshot.index + 1}".center(CONTENT_WIDTH),
+        "",
+    ))
+    while True:
+        prompt = center_in_terminal("\n>>> Resume your shift? (Y/N): ")
+        choice = (await ask(prompt)).strip().lower()
+        if choice in ['', 'y', 'yes']:
+            return snapshot
+        if choice in ['n', 'no']:
+            save_file.clear()
+            return None
 
 # ============================================================================
 # MAIN GAME LOOP
 # ============================================================================
 
-def main():
-    """Main game function"""
+async def run_game():
+    """The whole game, as a coroutine - returns the ending that was reached
+
+    Endings are "evaluation" (never helped the rebels), "caught" (failed the
+    day 7 interrogation), "good" (shared the truth) and "silence". The game
+    is saved after every judgment, and an interrupted shift can be resumed
+    from the main menu.
+    """
+    session = current_session()
     try:
-        # Display main menu
-        display_main_menu()
+        # One keyboard reader owns the terminal for the whole session
+        keyboard_handler.start()
 
-        # Blink eye transition
-        blink_eye()
+        # Keep terminal geometry cached, and lay screens out again on resize
+        geometry.install()
 
-        # Start ambient sound for gameplay
-        ambient_sound = create_ambient_sound()
-        if ambient_sound and SOUND_ENABLED:
-            ambient_sound.play(loops=-1)  # Loop indefinitely
+        # Start sound on worker threads, so the menu is drawn without waiting
+        # for pygame - the first keystrokes may be silent
+        if session.sound:
+            typing_sounds.prepare()
 
-        # Prepare conversations
-        all_convs = CONVERSATIONS.copy()
+        # Prepare gameplay ambience while the player is still on the menu
+        ambient_sound = BackgroundLoop(create_ambient_sound, fade_ms=1000).prepare()
 
-        # Separate special conversations from the rest
-        conv_1 = next(c for c in all_convs if c['id'] == 1)  # Day 1 rebel conv
-        conv_2 = next(c for c in all_convs if c['id'] == 2)  # Day 2 rebel conv
-        conv_3 = next(c for c in all_convs if c['id'] == 3)  # Day 3 rebel conv
-        conv_4 = next(c for c in all_convs if c['id'] == 4)  # Day 4 (if flagged correctly)
-        conv_5 = next(c for c in all_convs if c['id'] == 5)  # Day 5 (if flagged correctly)
-        conv_6 = next(c for c in all_convs if c['id'] == 6)  # Day 6 (if flagged correctly)
+        with profiler.phase("menu"):
+            # Display main menu
+            await display_main_menu()
 
-        # Day 8 truth reveal conversations
-        day8_convs = [c for c in all_convs if c['id'] in [51, 52, 53, 54, 55, 56]]
+            resume = await offer_resume()
 
-        # Remove special convs from pool and shuffle the rest
-        other_convs = [c for c in all_convs if c['id'] not in [1, 2, 3, 4, 5, 6, 50, 51, 52, 53, 54, 55, 56]]
-        random.shuffle(other_convs)
+            # Blink eye transition
+            await blink_eye()
 
-        # Track if player helped rebels (marked as loyal when they were treasonous)
-        helped_rebels = {1: False, 2: False, 3: False}
-        flagged_correctly = {1: False, 2: False, 3: False}
+        # Start ambient sound for gameplay
+        ambient_sound.play()
 
-        total_score = 0
-        conversations_per_day = 6
-        initial_days = 6
+        day8_convs = CONVERSATIONS.role(ROLE_REVEAL)
+        if resume:
+            # Pick up at the interrupted conversation
+            progress = Progress.from_snapshot(resume)
+        else:
+            # Random conversations for every slot the story doesn't script
+            progress = Progress(DayScheduler(seed=session.rng.getrandbits(64)))
+        session.progress = progress
+        scheduler = progress.scheduler
 
         # ============ DAYS 1-6: Normal surveillance work ============
-        for day in range(1, initial_days + 1):
-            day_flagged_count = 0
-            day_conversations = []
-
-            # Build day's conversation list
-            if day == 1:
-                # Day 1: conversation 1 must be shown
-                day_conversations.append(conv_1)
-                day_conversations.extend(other_convs[:5])
-                other_convs = other_convs[5:]
-            elif day == 2:
-                # Day 2: conversation 2 must be shown
-                day_conversations.append(conv_2)
-                day_conversations.extend(other_convs[:5])
-                other_convs = other_convs[5:]
-            elif day == 3:
-                # Day 3: conversation 3 must be shown
-                day_conversations.append(conv_3)
-                day_conversations.extend(other_convs[:5])
-                other_convs = other_convs[5:]
-            elif day == 4:
-                # Day 4: show conversation 4 if conversation 1 was flagged correctly
-                if flagged_correctly[1] and conv_4:
-                    day_conversations.append(conv_4)
-                    day_conversations.extend(other_convs[:5])
-                    other_convs = other_convs[5:]
-                else:
-                    day_conversations.extend(other_convs[:6])
-                    other_convs = other_convs[6:]
-            elif day == 5:
-                # Day 5: show conversation 5 if conversation 2 was flagged correctly
-                if flagged_correctly[2] and conv_5:
-                    day_conversations.append(conv_5)
-                    day_conversations.extend(other_convs[:5])
-                    other_convs = other_convs[5:]
-                else:
-                    day_conversations.extend(other_convs[:6])
-                    other_convs = other_convs[6:]
-            elif day == 6:
-                # Day 6: show conversation 6 if conversation 3 was flagged correctly
-                if flagged_correctly[3] and conv_6:
-                    day_conversations.append(conv_6)
-                    day_conversations.extend(other_convs[:5])
-                    other_convs = other_convs[5:]
-                else:
-                    day_conversations.extend(other_convs[:6])
-                    other_convs = other_convs[6:]
-
-            # Shuffle the day's conversations to randomize order within the day
-            random.shuffle(day_conversations)
-
-            # Show day intro
-            clear_screen()
-            print(center_in_terminal(BORDER_TOP))
-            print_bordered("")
-            print_bordered(f"DAY {day}".center(CONTENT_WIDTH))
-            print_bordered("Beginning surveillance shift...".center(CONTENT_WIDTH))
-            print_bordered("")
-            print(center_in_terminal(BORDER_BOTTOM))
-
-            with SkippableAnimation("day_intro") as anim:
-                if not anim.check_skip():
-                    time.sleep(2)
-
-            # Play through conversations
-            for i, conv in enumerate(day_conversations):
-                # Display conversation
-                while True:
-                    display_conversation(conv)
-                    player_judgment = get_player_judgment()
-
-                    if player_judgment == 'redisplay':
-                        continue
-                    else:
-                        break
-
-                if player_judgment:
-                    day_flagged_count += 1
-
-                correct = record_judgment(player_judgment, conv)
-                if correct:
-                    total_score += 1
-
-                # Track if special conversations were flagged correctly OR helped rebels
-                if conv['id'] in [1, 2, 3]:
-                    if correct and player_judgment:  # Correctly flagged as treasonous
-                        flagged_correctly[conv['id']] = True
-                    elif not player_judgment and conv['has_secret']:  # Incorrectly marked as loyal (helped rebels)
-                        helped_rebels[conv['id']] = True
-
-                # Continue prompt
-                if i < len(day_conversations) - 1:
-                    prompt = center_in_terminal("\n>>> Press ENTER to continue <<<")
-                    input(prompt)
-
-            # Show daily report
-            display_daily_report(day, day_flagged_count, len(day_conversations))
-
-            if day < initial_days:
-                prompt = center_in_terminal("\n>>> Press ENTER to begin next shift <<<")
-                input(prompt)
+        for day in range(progress.day, scheduler.days + 1):
+            with profiler.phase(f"day{day}"):
+                if progress.day != day or progress.day_conversations is None:
+                    progress.start_day(day)
+
+                    # Show day intro
+                    screen.show(lambda: day_intro_frame(day))
+
+                    with SkippableAnimation("day_intro") as anim:
+                        await anim.wait(2)
+                day_conversations = progress.day_conversations
+
+                # Play through conversations
+                while progress.index < len(day_conversations):
+                    conv = day_conversations[progress.index]
+                    with profiler.phase(f"conversation{conv.id}"):
+                        # Display conversation
+                        while True:
+                            await display_conversation(conv)
+                            with profiler.phase("judgment"):
+                                asked = time.monotonic()
+                                player_judgment = await get_player_judgment()
+
+                            if player_judgment == 'redisplay':
+                                continue
+                            else:
+                                break
+
+                        with profiler.phase("judgment"):
+                            correct = await record_judgment(player_judgment, conv, time.monotonic() - asked)
+
+                    # Score it, and track if rebel conversations were flagged correctly OR helped rebels
+                    progress.judged(conv, player_judgment, correct)
+
+                    if save_file:
+                        save_file.write(progress.snapshot())
+
+                    # Continue prompt
+                    if progress.index < len(day_conversations):
+                        prompt = center_in_terminal("\n>>> Press ENTER to continue <<<")
+                        await ask(prompt)
+
+                # Show daily report
+                await display_daily_report(day, progress.day_flagged_count, len(day_conversations))
+
+                if day < scheduler.days:
+                    prompt = center_in_terminal("\n>>> Press ENTER to begin next shift <<<")
+                    await ask(prompt)
 
         # ============ AFTER DAY 6: Check if player helped rebels ============
         # Player helped rebels if they didn't flag at least one of the conversations 1, 2, or 3
-        player_helped_any_rebels = any(helped_rebels.values())
+        player_helped_any_rebels = any(progress.helped_rebels.values())
 
         if player_helped_any_rebels:
             # ============ DAY 7: Agent Investigation ============
             prompt = center_in_terminal("\n>>> Press ENTER to begin next shift <<<")
-            input(prompt)
+            await ask(prompt)
 
-            passed_investigation = handle_agent_questions()
+            with profiler.phase("interrogation"):
+                passed_investigation = await handle_agent_questions()
 
             if not passed_investigation:
                 # Bad ending: Caught by Internal Affairs
-                display_bad_ending_caught()
-                return
+                with profiler.phase("ending"):
+                    await display_bad_ending_caught()
+                return "caught"
 
             # ============ DAY 8: Truth Reveal ============
             prompt = center_in_terminal("\n>>> Press ENTER for final shift <<<")
-            input(prompt)
+            await ask(prompt)
 
-            # Show day intro
-            clear_screen()
-            print(center_in_terminal(BORDER_TOP))
-            print_bordered("")
-            print_bordered("DAY 8".center(CONTENT_WIDTH))
-            print_bordered("Beginning surveillance shift...".center(CONTENT_WIDTH))
-            print_bordered("")
-            print(center_in_terminal(BORDER_BOTTOM))
-
-            with SkippableAnimation("day_intro") as anim:
-                if not anim.check_skip():
-                    time.sleep(2)
-
-            # Play through Day 8 truth reveal conversations (no judgment needed)
-            for i, conv in enumerate(day8_convs):
-                display_conversation(conv)
-
-                # Let player read the conversation before clearing
-                prompt = center_in_terminal("\n>>> Press ENTER to continue <<<")
-                input(prompt)
-
-                # No judgment for these - just revelations
+            with profiler.phase("day8"):
+                # Show day intro
+                screen.show(lambda: day_intro_frame(8))
+
+                with SkippableAnimation("day_intro") as anim:
+                    await anim.wait(2)
+
+                # Play through Day 8 truth reveal conversations (no judgment needed)
+                for i, conv in enumerate(day8_convs):
+                    with profiler.phase(f"conversation{conv.id}"):
+                        await display_conversation(conv)
+
+                    # Let player read the conversation before clearing
+                    prompt = center_in_terminal("\n>>> Press ENTER to continue <<<")
+                    await ask(prompt)
+
+                    # No judgment for these - just revelations
+                    clear_screen()
+                    terminal.print(center_in_terminal(BORDER_TOP))
+                    print_bordered("")
+                    print_bordered(">>> RECORDING CONVERSATION <<<".center(CONTENT_WIDTH))
+                    print_bordered("")
+                    terminal.print(center_in_terminal(BORDER_BOTTOM))
+
+                    with SkippableAnimation("record_wait") as anim:
+                        await anim.wait(1.5)
+
+                # Show daily report for day 8
+                await blink_eye()
                 clear_screen()
-                print(center_in_terminal(BORDER_TOP))
+                terminal.print(center_in_terminal(BORDER_TOP))
                 print_bordered("")
-                print_bordered(">>> RECORDING CONVERSATION <<<".center(CONTENT_WIDTH))
+                print_bordered("DAY 8 - SHIFT COMPLETE".center(CONTENT_WIDTH))
                 print_bordered("")
-                print(center_in_terminal(BORDER_BOTTOM))
-
-                with SkippableAnimation("record_wait") as anim:
-                    if not anim.check_skip():
-                        time.sleep(1.5)
+                print_bordered("You now know the truth.".center(CONTENT_WIDTH))
+                print_bordered("The U.P Department doesn't exist.".center(CONTENT_WIDTH))
+                print_bordered("It never did.".center(CONTENT_WIDTH))
+                print_bordered("")
+                terminal.print(center_in_terminal(BORDER_BOTTOM))
 
-            # Show daily report for day 8
-            blink_eye()
-            clear_screen()
-            print(center_in_terminal(BORDER_TOP))
-            print_bordered("")
-            print_bordered("DAY 8 - SHIFT COMPLETE".center(CONTENT_WIDTH))
-            print_bordered("")
-            print_bordered("You now know the truth.".center(CONTENT_WIDTH))
-            print_bordered("The U.P Department doesn't exist.".center(CONTENT_WIDTH))
-            print_bordered("It never did.".center(CONTENT_WIDTH))
-            print_bordered("")
-            print(center_in_terminal(BORDER_BOTTOM))
-
-            with SkippableAnimation("truth_pause") as anim:
-                if not anim.check_skip():
-                    time.sleep(3)
+                with SkippableAnimation("truth_pause") as anim:
+                    await anim.wait(3)
 
             prompt = center_in_terminal("\n>>> Press ENTER to continue <<<")
-            input(prompt)
+            await ask(prompt)
 
             # ============ FINAL CHOICE ============
-            share_truth = display_final_choice()
+            share_truth = await display_final_choice()
 
-            if share_truth:
-                # Good ending
-                display_good_ending()
-            else:
-                # Bad ending: Stayed silent
-                display_bad_ending_silence()
+            with profiler.phase("ending"):
+                if share_truth:
+                    # Good ending
+                    await display_good_ending()
+                    return "good"
+                else:
+                    # Bad ending: Stayed silent
+                    await display_bad_ending_silence()
+                    return "silence"
 
         else:
             # Player didn't help rebels - normal ending after day 6
-            display_final_evaluation(total_score, initial_days)
+            with profiler.phase("ending"):
+                await display_final_evaluation(progress.total_score, scheduler.days, scheduler.shown)
+            return "evaluation"
+
+    finally:
+        # Ensure keyboard handler and cursor are properly restored
+        keyboard_handler.stop()
+        terminal.show_cursor()
 
+async def play_game():
+    """Play one game and forget the save once an ending has been reached"""
+    ending = await run_game()
+    if save_file:
+        save_file.clear()
+    return ending
+
+# ============================================================================
+# HEADLESS MODE
+# ============================================================================
+
+def headless_game(answers=(), skip=True, seed=None, judgment_log=None):
+    """A GameSession with a ScriptedInput, a NullTerminal, no sound and no saves"""
+    return GameSession(ScriptedInput(answers, skip), NullTerminal(), FixedGeometry(), seed=seed,
+                       judgment_log=judgment_log)
+
+@contextlib.contextmanager
+def headless_session(answers=(), skip=True, seed=None):
+    """Make a headless game the current session for the duration"""
+    with session_scope(headless_game(answers, skip, seed)) as session:
+        yield session
+
+def play_headless(answers, seed=None, judgment_log=None):
+    """Play one whole game with no terminal, sound or delays - returns the ending
+
+    Input comes from a ScriptedInput built from `answers`, output goes to a
+    NullTerminal, sound is switched off and every animation is skipped, so a
+    playthrough takes milliseconds. `seed` makes the conversation order
+    repeatable. Raises EOFError if the script runs out of answers - its
+    message is the prompt left unanswered. Judgments are appended to
+    `judgment_log` if one is given.
+    """
+    return headless_game(answers, seed=seed, judgment_log=judgment_log).run()
+
+def parse_args(argv=None):
+    """Command line options - prints usage and exits on a bad one"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Nothing is U.P - State surveillance simulator")
+    parser.add_argument("--profile", nargs='?', const="profiles", default=None, metavar="DIR",
+                        help=f"write per-phase pstats files to DIR (default: profiles) - or set {PROFILE_ENV}")
+    parser.add_argument("--pack", default=None, metavar="FILE",
+                        help=f"play with a conversation pack - or set {PACK_ENV}")
+    parser.add_argument("--log", default=None, metavar="FILE",
+                        help=f"append every judgment to a judgment log - or set {LOG_ENV}")
+    parser.add_argument("--headless", action="store_true",
+                        help="scripted run for QA: one answer per line on stdin, prints the ending")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Main game function"""
+    args = parse_args(argv)
+
+    # --profile [DIR] or NOTHINGISUP_PROFILE=DIR writes per-phase pstats files
+    profile_dir = args.profile or os.environ.get(PROFILE_ENV)
+    if profile_dir:
+        profiler.enable(profile_dir)
+
+    # --pack FILE or NOTHINGISUP_PACK=FILE plays with a conversation pack
+    pack_path = args.pack or os.environ.get(PACK_ENV)
+    if pack_path:
+        try:
+            use_conversation_pack(pack_path)
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] Could not load conversation pack: {e}")
+
+    # --log FILE or NOTHINGISUP_LOG=FILE appends every judgment to a judgment log
+    log_path = args.log or os.environ.get(LOG_ENV)
+    if log_path:
+        try:
+            import judgment_log
+            console_session.judgment_log = judgment_log.JudgmentLog(log_path)
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] Could not open judgment log: {e}")
+
+    try:
+        if args.headless:
+            # Scripted run for QA: one answer per line on stdin, prints the ending
+            answers = [line.rstrip('\r\n') for line in sys.stdin]
+            try:
+                ending = play_headless(answers, judgment_log=console_session.judgment_log)
+            except EOFError as e:
+                print(f"[ERROR] Input script ended at prompt: {e}", file=sys.stderr)
+                sys.exit(1)
+            print(ending)
+            return
+        if not SOUND_ENABLED:
+            print("[WARNING] Pygame not found. Game will run without sound.")
+            print("Install with: pip install pygame or sudo apt install python3-pygame\n")
+        console_session.run()
     finally:
-        # Ensure keyboard handler is properly cleaned up
-        keyboard_handler.stop_monitoring()
+        # Warnings from sound threads that came in after the menu was drawn
+        print_pending_warnings()
+        if console_session.judgment_log:
+            console_session.judgment_log.close()
+        profiler.report()
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        keyboard_handler.stop_monitoring()
+        keyboard_handler.stop()
         print("\n\n[SYSTEM] Connection terminated.")
     except Exception as e:
-        keyboard_handler.stop_monitoring()
+        keyboard_handler.stop()
         print(f"\n[ERROR] {e}")
         raise
\ No newline at end of file
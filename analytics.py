@@ -0,0 +1,240 @@
+"""Offline analytics over judgment logs
+
+Reads any number of judgment logs (see judgment_log.py) - the shared log of
+a server, the logs of single players, or a directory of them - and prints:
+
+    conversations  judgments, flag rate, accuracy and false positive rate
+                   of every conversation
+    ambiguity      the "what's up" conversations, which are all innocent
+    rebel arc      how often players spare each rebel instead of flagging them
+
+Every log is memory-mapped and cut into fixed-size runs of whole records.
+Each run goes to a worker in a multiprocessing pool, which counts its
+verdicts and returns only the counts, merged in the parent. Records are
+not unpacked one by one: the fields a worker needs are sliced out of the
+map as whole columns and combined into one byte per record, and the bytes
+are counted in C.
+
+    python analytics.py [--workers N] LOG_OR_DIR [LOG_OR_DIR ...]
+"""
+
+import argparse
+import collections
+import mmap
+import multiprocessing
+import os
+import time
+
+import judgment_log
+from judgment_log import HEADER, RECORD
+
+CHUNK_RECORDS = 1 << 22  # Records per task - 128 MB of log
+REBEL_IDS = (1, 2, 3)  # As in Nothing_to_hide - rebel conversations of days 1-3
+AMBIGUOUS_IDS = tuple(range(43, 50))  # Innocent talk of "what's up" - bait for careless censors
+
+# Byte offsets of the fields counted, from the RECORD layout
+CONV_ID = 16  # 4 bytes
+FLAGGED = 25
+CORRECT = 26
+
+# ============================================================================
+# MAP - COUNT ONE RUN OF RECORDS
+# ============================================================================
+
+class Stats:
+    """Verdict counts for a run of records - small enough to send between processes"""
+    def __init__(self):
+        self.records = 0
+        self.verdicts = collections.Counter()  # (conv_id, flagged, correct) -> judgments
+
+    def merge(self, other):
+        self.records += other.records
+        self.verdicts.update(other.verdicts)
+        return self
+
+    def conversations(self):
+        """{conv_id: Verdicts} for every conversation judged"""
+        table = {}
+        for (conv_id, flagged, correct), count in self.verdicts.items():
+            table.setdefault(conv_id, Verdicts()).add(flagged, correct, count)
+        return table
+
+class Verdicts:
+    """Judgments of one conversation, split by verdict and correctness"""
+    def __init__(self):
+        self.flagged_correctly = 0  # Hid something and was flagged
+        self.flagged_wrongly = 0  # False positive
+        self.cleared_correctly = 0
+        self.cleared_wrongly = 0  # Hid something and was let go
+
+    def add(self, flagged, correct, count):
+        if flagged:
+            if correct:
+                self.flagged_correctly += count
+            else:
+                self.flagged_wrongly += count
+        elif correct:
+            self.cleared_correctly += count
+        else:
+            self.cleared_wrongly += count
+        return self
+
+    def merge(self, other):
+        self.flagged_correctly += other.flagged_correctly
+        self.flagged_wrongly += other.flagged_wrongly
+        self.cleared_correctly += other.cleared_correctly
+        self.cleared_wrongly += other.cleared_wrongly
+        return self
+
+    @property
+    def judgments(self):
+        return self.flagged_correctly + self.flagged_wrongly + self.cleared_correctly + self.cleared_wrongly
+
+    @property
+    def flagged(self):
+        return self.flagged_correctly + self.flagged_wrongly
+
+    @property
+    def correct(self):
+        return self.flagged_correctly + self.cleared_correctly
+
+    def false_positive_rate(self):
+        """Share of judgments of an innocent conversation that flagged it - None if it never was innocent"""
+        innocent = self.flagged_wrongly + self.cleared_correctly
+        return self.flagged_wrongly / innocent if innocent else None
+
+def count_verdicts(view):
+    """Stats for a memoryview of whole records"""
+    stats = Stats()
+    stats.records = len(view) // RECORD.size
+    if not stats.records:
+        return stats
+    with view.cast('I') as words:
+        # Native byte order - on a big-endian machine this is never small
+        small_ids = max(words[CONV_ID // 4::RECORD.size // 4]) < 64
+    if not small_ids:
+        # Large ids from a conversation pack - unpack every record
+        for _, _, conv_id, _, _, flagged, correct in RECORD.iter_unpack(view):
+            stats.verdicts[conv_id, flagged, correct] += 1
+        return stats
+    # One byte per record - conversation id, flagged, correct - built by
+    # shifting whole columns at once as big integers, then counted in C
+    conv_ids = int.from_bytes(view[CONV_ID::RECORD.size], 'little')
+    flagged = int.from_bytes(view[FLAGGED::RECORD.size], 'little')
+    correct = int.from_bytes(view[CORRECT::RECORD.size], 'little')
+    keys = (conv_ids << 2 | flagged << 1 | correct).to_bytes(stats.records, 'little')
+    for key, count in collections.Counter(keys).items():
+        stats.verdicts[key >> 2, key >> 1 & 1, key & 1] = count
+    return stats
+
+def _count_chunk(task):
+    """Worker: map one run of records of a log and count it"""
+    path, start, stop = task
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        with memoryview(data) as view, view[start:stop] as chunk:
+            return count_verdicts(chunk)
+
+# ============================================================================
+# REDUCE - ACROSS LOGS AND WORKERS
+# ============================================================================
+
+def log_paths(paths):
+    """Log files named directly, and every *.log file in named directories"""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            found.extend(os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith('.log'))
+        else:
+            found.append(path)
+    return found
+
+def plan_tasks(paths, chunk_records=CHUNK_RECORDS):
+    """(path, start, stop) byte ranges of whole records covering every log
+
+    Logs that can't be read are skipped with a warning, and a torn last
+    record is left out.
+    """
+    tasks = []
+    for path in paths:
+        try:
+            records = judgment_log.record_count(path)
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] Skipping log - {e}")
+            continue
+        for first in range(0, records, chunk_records):
+            last = min(first + chunk_records, records)
+            tasks.append((path, HEADER.size + first * RECORD.size, HEADER.size + last * RECORD.size))
+    return tasks
+
+def analyze(paths, workers=None, chunk_records=CHUNK_RECORDS):
+    """Count the verdicts in every log across `workers` processes - returns the merged Stats"""
+    tasks = plan_tasks(log_paths(paths), chunk_records)
+    workers = workers or os.cpu_count() or 1
+    total = Stats()
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            total.merge(_count_chunk(task))
+        return total
+    with multiprocessing.Pool(min(workers, len(tasks))) as pool:
+        for stats in pool.imap_unordered(_count_chunk, tasks):
+            total.merge(stats)
+    return total
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def _rate(part, whole):
+    return f"{part / whole:.1%}" if whole else "-"
+
+def _row(label, verdicts):
+    fp_rate = verdicts.false_positive_rate()
+    print(f"{label:>4}{verdicts.judgments:>14,}{_rate(verdicts.flagged, verdicts.judgments):>10}"
+          f"{_rate(verdicts.correct, verdicts.judgments):>10}{'-' if fp_rate is None else f'{fp_rate:.1%}':>11}")
+
+def print_conversations(title, table, conv_ids):
+    print(title)
+    print(f"{'id':>4}{'judgments':>14}{'flagged':>10}{'accuracy':>10}{'false pos':>11}")
+    total = Verdicts()
+    for conv_id in conv_ids:
+        verdicts = table.get(conv_id, Verdicts())
+        _row(conv_id, verdicts)
+        total.merge(verdicts)
+    _row("all", total)
+    print()
+
+def print_rebels(table):
+    print("Rebel arc - rebels spared (cleared instead of flagged)")
+    print(f"{'id':>4}{'judgments':>14}{'spared':>14}{'share':>10}")
+    total = Verdicts()
+    for conv_id in REBEL_IDS + ("all",):
+        verdicts = total if conv_id == "all" else table.get(conv_id, Verdicts())
+        spared = verdicts.judgments - verdicts.flagged
+        print(f"{conv_id:>4}{verdicts.judgments:>14,}{spared:>14,}{_rate(spared, verdicts.judgments):>10}")
+        if verdicts is not total:
+            total.merge(verdicts)
+    print()
+
+def print_report(stats, elapsed):
+    """Per-conversation, ambiguity and rebel arc tables"""
+    print(f"Judgments: {stats.records:,}  time: {elapsed:.1f}s  "
+          f"({stats.records / max(elapsed, 1e-9):,.0f} judgments/s)")
+    print()
+    table = stats.conversations()
+    print_conversations("Conversations", table, sorted(table))
+    print_conversations('Ambiguity - the "what\'s up" conversations', table, AMBIGUOUS_IDS)
+    print_rebels(table)
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate Nothing is U.P judgment logs")
+    parser.add_argument("logs", nargs='+', metavar="LOG_OR_DIR",
+                        help="judgment log, or a directory of *.log files")
+    parser.add_argument("--workers", type=int, default=None, help="default: one per core")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = analyze(args.logs, args.workers)
+    print_report(stats, time.perf_counter() - start)
+
+if __name__ == "__main__":
+    main()
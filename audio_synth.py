@@ -0,0 +1,389 @@
+"""Audio synthesis for the menu and ambient loops
+
+Every layer of the loops (bass pulses, square pulses, drone, pings, hum, beeps
+and static) is built as a whole-buffer operation. NumPy is used when it is
+installed. Without it, each repeated shape is rendered once and stamped into
+the buffer with slice arithmetic, and periodic layers are rendered for a
+single period and tiled.
+
+The result is raw signed 16-bit mono PCM, ready for
+pygame.mixer.Sound(buffer=...). The cached_* functions keep rendered loops in
+the user cache directory, keyed by their parameters and SYNTH_VERSION, so warm
+starts memory-map the file instead of synthesizing.
+
+Run this file directly to benchmark against the original per-sample loops:
+    python audio_synth.py [--repeat N]
+"""
+
+import array
+import hashlib
+import math
+import mmap
+import os
+import random
+import sys
+import tempfile
+import time
+from operator import add
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bump whenever the synthesis code changes, so stale cache files are ignored
+SYNTH_VERSION = 1
+
+SAMPLE_RATE = 22050
+PCM_MIN = -32767
+PCM_MAX = 32767
+
+# ============================================================================
+# LOOP DEFINITIONS
+# ============================================================================
+
+MENU_DURATION = 8.0  # 8 second loop for more complex rhythm
+MENU_BASS_TIMES = (0.0, 0.5, 1.0, 2.0, 2.5, 3.0, 4.0, 4.5, 5.0, 6.0, 6.5, 7.0)
+MENU_PULSE_TIMES = (0.25, 1.25, 2.25, 3.25, 4.25, 5.25, 6.25, 7.25)
+MENU_PING_TIMES = (1.5, 5.5)
+
+AMBIENT_DURATION = 6.0  # 6 second loop
+AMBIENT_BEEP_TIMES = (1.0, 2.5, 4.0, 5.5)
+AMBIENT_STATIC_LEVEL = 800
+AMBIENT_CACHE_SEED = 1984  # Fixed static pattern so the ambient loop can be cached
+
+# ============================================================================
+# NUMPY BACKEND
+# ============================================================================
+
+def _np_time(n, sample_rate):
+    return np.arange(n) / sample_rate
+
+def _np_bass_pulse(sample_rate):
+    """Deep bass heartbeat: 80-120 Hz sweep with exponential decay for punch"""
+    t = _np_time(int(0.3 * sample_rate), sample_rate)
+    freq = 90 + 30 * np.sin(t * 10)
+    amplitude = np.trunc(20000 * np.exp(-t * 8))
+    return np.trunc(amplitude * np.sin(2 * math.pi * freq * t)).astype(np.int32)
+
+def _np_square_pulse(sample_rate):
+    """Industrial machinery pulse: 200 Hz square wave with linear decay"""
+    n = int(0.15 * sample_rate)
+    t = _np_time(n, sample_rate)
+    amplitude = np.trunc(12000 * (1 - np.arange(n) / n))
+    sign = np.where(np.sin(2 * math.pi * 200 * t) > 0, 1, -1)
+    return (amplitude * sign).astype(np.int32)
+
+def _np_chirp(sample_rate, duration, freq, peak):
+    """Sine blip with linear decay - surveillance pings and beeps"""
+    n = int(duration * sample_rate)
+    t = _np_time(n, sample_rate)
+    amplitude = np.trunc(peak * (1 - np.arange(n) / n))
+    return np.trunc(amplitude * np.sin(2 * math.pi * freq * t)).astype(np.int32)
+
+def _np_sine(samples, sample_rate, freq, peak):
+    t = _np_time(samples, sample_rate)
+    return np.trunc(peak * np.sin(2 * math.pi * freq * t)).astype(np.int32)
+
+def _np_stamp(wave, shape, times, sample_rate):
+    """Add a shape into the buffer at each start time, cut at the loop end"""
+    for start_time in times:
+        start = int(start_time * sample_rate)
+        length = min(len(shape), len(wave) - start)
+        if length > 0:
+            wave[start:start + length] += shape[:length]
+
+def _np_menu_loop(sample_rate):
+    samples = int(sample_rate * MENU_DURATION)
+    wave = np.zeros(samples, dtype=np.int32)
+    _np_stamp(wave, _np_bass_pulse(sample_rate), MENU_BASS_TIMES, sample_rate)
+    _np_stamp(wave, _np_square_pulse(sample_rate), MENU_PULSE_TIMES, sample_rate)
+    # Atmospheric drone (constant 40 Hz rumble), clipped together with the pulses
+    wave += _np_sine(samples, sample_rate, 40, 3000)
+    np.clip(wave, PCM_MIN, PCM_MAX, out=wave)
+    _np_stamp(wave, _np_chirp(sample_rate, 0.08, 1200, 8000), MENU_PING_TIMES, sample_rate)
+    return wave.astype(np.int16).tobytes()
+
+def _np_ambient_loop(sample_rate, seed, static_level):
+    samples = int(sample_rate * AMBIENT_DURATION)
+    # Electrical hum (60 Hz, like old monitors/equipment)
+    wave = _np_sine(samples, sample_rate, 60, 2000)
+    _np_stamp(wave, _np_chirp(sample_rate, 0.05, 1000, 6000), AMBIENT_BEEP_TIMES, sample_rate)
+    if static_level:
+        rng = np.random.default_rng(seed)
+        wave += rng.integers(-static_level, static_level + 1, samples, dtype=np.int32)
+    np.clip(wave, PCM_MIN, PCM_MAX, out=wave)
+    return wave.astype(np.int16).tobytes()
+
+# ============================================================================
+# PURE PYTHON BACKEND
+# ============================================================================
+
+def _py_bass_pulse(sample_rate):
+    sin, exp = math.sin, math.exp
+    shape = []
+    for i in range(int(0.3 * sample_rate)):
+        t = i / sample_rate
+        freq = 90 + 30 * sin(t * 10)
+        amplitude = int(20000 * exp(-t * 8))
+        shape.append(int(amplitude * sin(2 * math.pi * freq * t)))
+    return shape
+
+def _py_square_pulse(sample_rate):
+    sin = math.sin
+    n = int(0.15 * sample_rate)
+    return [int(int(12000 * (1 - i / n)) * (1 if sin(2 * math.pi * 200 * (i / sample_rate)) > 0 else -1))
+            for i in range(n)]
+
+def _py_chirp(sample_rate, duration, freq, peak):
+    sin = math.sin
+    n = int(duration * sample_rate)
+    return [int(int(peak * (1 - i / n)) * sin(2 * math.pi * freq * (i / sample_rate))) for i in range(n)]
+
+def _py_sine(samples, sample_rate, freq, peak):
+    """Render one exact period of an integer-frequency sine and tile it"""
+    sin = math.sin
+    period = sample_rate // math.gcd(sample_rate, freq)
+    cycle = [int(peak * sin(2 * math.pi * freq * (i / sample_rate))) for i in range(min(period, samples))]
+    repeats = -(-samples // len(cycle))
+    return (cycle * repeats)[:samples]
+
+def _py_stamp(wave, shape, times, sample_rate):
+    for start_time in times:
+        start = int(start_time * sample_rate)
+        end = min(start + len(shape), len(wave))
+        if end > start:
+            wave[start:end] = map(add, wave[start:end], shape)
+
+def _py_clip(values):
+    return [PCM_MIN if v < PCM_MIN else PCM_MAX if v > PCM_MAX else v for v in values]
+
+def _py_menu_loop(sample_rate):
+    samples = int(sample_rate * MENU_DURATION)
+    wave = [0] * samples
+    _py_stamp(wave, _py_bass_pulse(sample_rate), MENU_BASS_TIMES, sample_rate)
+    _py_stamp(wave, _py_square_pulse(sample_rate), MENU_PULSE_TIMES, sample_rate)
+    wave = _py_clip(map(add, wave, _py_sine(samples, sample_rate, 40, 3000)))
+    _py_stamp(wave, _py_chirp(sample_rate, 0.08, 1200, 8000), MENU_PING_TIMES, sample_rate)
+    return array.array('h', wave).tobytes()
+
+def _py_ambient_loop(sample_rate, seed, static_level):
+    samples = int(sample_rate * AMBIENT_DURATION)
+    wave = _py_sine(samples, sample_rate, 60, 2000)
+    _py_stamp(wave, _py_chirp(sample_rate, 0.05, 1000, 6000), AMBIENT_BEEP_TIMES, sample_rate)
+    if static_level:
+        noise = random.Random(seed).choices(range(-static_level, static_level + 1), k=samples)
+        wave = map(add, wave, noise)
+    return array.array('h', _py_clip(wave)).tobytes()
+
+# ============================================================================
+# PUBLIC API
+# ============================================================================
+
+def backend_name():
+    """Name of the backend the render functions will use"""
+    return "numpy" if np is not None else "python"
+
+def render_menu_loop(sample_rate=SAMPLE_RATE):
+    """Eerie beeping menu loop as raw 16-bit PCM bytes"""
+    if np is not None:
+        return _np_menu_loop(sample_rate)
+    return _py_menu_loop(sample_rate)
+
+def render_ambient_loop(sample_rate=SAMPLE_RATE, seed=None, static_level=AMBIENT_STATIC_LEVEL):
+    """Surveillance station hum, beeps and static as raw 16-bit PCM bytes"""
+    if np is not None:
+        return _np_ambient_loop(sample_rate, seed, static_level)
+    return _py_ambient_loop(sample_rate, seed, static_level)
+
+# ============================================================================
+# DISK CACHE
+# ============================================================================
+
+def cache_dir():
+    """Per-user cache directory for rendered loops"""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'NothingIsUP', 'audio')
+
+def _cache_key(name, params):
+    """Content address for a loop: its name, parameters and the synthesis version"""
+    description = repr((SYNTH_VERSION, name, sorted(params.items())))
+    return hashlib.sha256(description.encode()).hexdigest()[:32]
+
+def _read_cached(path, expected_size):
+    """Memory-map a cached loop, or None if it is missing or the wrong size"""
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size != expected_size:
+                return None
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+def _write_cached(path, data):
+    """Write through a temp file and rename, so readers never see a partial loop"""
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def _cached(name, params, duration, render):
+    """Return a cached loop, calling render() and filling the cache on a miss"""
+    path = os.path.join(cache_dir(), f"{name}-{_cache_key(name, params)}.pcm")
+    expected_size = int(params['sample_rate'] * duration) * 2
+    data = _read_cached(path, expected_size)
+    if data is None:
+        data = render()
+        _write_cached(path, data)
+    return data
+
+def cached_menu_loop(sample_rate=SAMPLE_RATE):
+    """render_menu_loop(), served from the disk cache when possible"""
+    params = {
+        'sample_rate': sample_rate,
+        'bass': MENU_BASS_TIMES,
+        'pulses': MENU_PULSE_TIMES,
+        'pings': MENU_PING_TIMES,
+    }
+    return _cached('menu', params, MENU_DURATION, lambda: render_menu_loop(sample_rate))
+
+def cached_ambient_loop(sample_rate=SAMPLE_RATE):
+    """render_ambient_loop() with a fixed static seed, served from the disk cache"""
+    params = {
+        'sample_rate': sample_rate,
+        'beeps': AMBIENT_BEEP_TIMES,
+        'static': AMBIENT_STATIC_LEVEL,
+        'seed': AMBIENT_CACHE_SEED,
+    }
+    return _cached('ambient', params, AMBIENT_DURATION,
+                   lambda: render_ambient_loop(sample_rate, AMBIENT_CACHE_SEED))
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def _legacy_menu_loop(sample_rate=SAMPLE_RATE):
+    """The original per-sample create_menu_music() loop, minus pygame"""
+    samples = int(sample_rate * MENU_DURATION)
+    wave = array.array('h', [0] * samples)
+    for bass_time in MENU_BASS_TIMES:
+        bass_start = int(bass_time * sample_rate)
+        bass_duration = int(0.3 * sample_rate)
+        for i in range(bass_duration):
+            if bass_start + i < samples:
+                t = i / sample_rate
+                freq = 90 + 30 * math.sin(t * 10)
+                amplitude = int(20000 * math.exp(-t * 8))
+                wave[bass_start + i] += int(amplitude * math.sin(2 * math.pi * freq * t))
+    for pulse_time in MENU_PULSE_TIMES:
+        pulse_start = int(pulse_time * sample_rate)
+        pulse_duration = int(0.15 * sample_rate)
+        for i in range(pulse_duration):
+            if pulse_start + i < samples:
+                t = i / sample_rate
+                amplitude = int(12000 * (1 - i/pulse_duration))
+                wave[pulse_start + i] += int(amplitude * (1 if math.sin(2 * math.pi * 200 * t) > 0 else -1))
+    for i in range(samples):
+        t = i / sample_rate
+        wave[i] = max(-32767, min(32767, wave[i] + int(3000 * math.sin(2 * math.pi * 40 * t))))
+    for ping_time in MENU_PING_TIMES:
+        ping_start = int(ping_time * sample_rate)
+        ping_duration = int(0.08 * sample_rate)
+        for i in range(ping_duration):
+            if ping_start + i < samples:
+                t = i / sample_rate
+                amplitude = int(8000 * (1 - i/ping_duration))
+                wave[ping_start + i] += int(amplitude * math.sin(2 * math.pi * 1200 * t))
+    return wave.tobytes()
+
+def _legacy_ambient_loop(sample_rate=SAMPLE_RATE, static_level=AMBIENT_STATIC_LEVEL):
+    """The original per-sample create_ambient_sound() loop, minus pygame"""
+    samples = int(sample_rate * AMBIENT_DURATION)
+    wave = array.array('h', [0] * samples)
+    for i in range(samples):
+        t = i / sample_rate
+        wave[i] += int(2000 * math.sin(2 * math.pi * 60 * t))
+    for beep_time in AMBIENT_BEEP_TIMES:
+        beep_start = int(beep_time * sample_rate)
+        beep_duration = int(0.05 * sample_rate)
+        for i in range(beep_duration):
+            if beep_start + i < samples:
+                t = i / sample_rate
+                amplitude = int(6000 * (1 - i/beep_duration))
+                wave[beep_start + i] += int(amplitude * math.sin(2 * math.pi * 1000 * t))
+    if static_level:
+        for i in range(samples):
+            static = random.randint(-static_level, static_level)
+            wave[i] = max(-32767, min(32767, wave[i] + static))
+    return wave.tobytes()
+
+def _max_sample_difference(a, b):
+    left, right = array.array('h'), array.array('h')
+    left.frombytes(a)
+    right.frombytes(b)
+    if len(left) != len(right):
+        return None
+    return max((abs(x - y) for x, y in zip(left, right)), default=0)
+
+def _best_time(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark(repeat=3):
+    """Time every backend against the legacy loops and check their output"""
+    global np
+    numpy_module = np
+    backends = [("python", None)]
+    if numpy_module is not None:
+        backends.append(("numpy", numpy_module))
+
+    cases = [
+        ("menu loop", _legacy_menu_loop, render_menu_loop),
+        ("ambient loop", _legacy_ambient_loop, render_ambient_loop),
+    ]
+    print(f"{'loop':<14}{'backend':<10}{'best (ms)':>12}{'speedup':>10}{'max diff':>10}")
+    try:
+        for name, legacy, render in cases:
+            legacy_time = _best_time(legacy, repeat)
+            print(f"{name:<14}{'legacy':<10}{legacy_time * 1000:>12.1f}{'1.0x':>10}{'-':>10}")
+            for backend, module in backends:
+                np = module
+                render_time = _best_time(render, repeat)
+                # Static is random, so compare the deterministic layers only
+                if render is render_ambient_loop:
+                    diff = _max_sample_difference(_legacy_ambient_loop(static_level=0),
+                                                  render_ambient_loop(static_level=0))
+                else:
+                    diff = _max_sample_difference(legacy(), render())
+                print(f"{name:<14}{backend:<10}{render_time * 1000:>12.1f}"
+                      f"{legacy_time / render_time:>9.1f}x{diff:>10}")
+    finally:
+        np = numpy_module
+
+if __name__ == "__main__":
+    repeat = 3
+    if "--repeat" in sys.argv:
+        repeat = int(sys.argv[sys.argv.index("--repeat") + 1])
+    benchmark(repeat)
@@ -0,0 +1,262 @@
+"""Benchmarks for the render, audio and full-session hot paths
+
+Render cases run inside a headless session, so output goes to a
+NullTerminal and never reaches the real terminal. Sound cases need pygame
+and are skipped without it. Every case reports its best time per call.
+
+    python benchmarks.py                  # run and print the results
+    python benchmarks.py --save           # store them as the new baseline
+    python benchmarks.py --compare        # fail on regressions against the baseline
+    python benchmarks.py --compare --threshold 0.1 --filter render
+    python benchmarks.py --imports        # cold start: import times and first menu frame
+
+Cold start target: the first menu frame is drawn within FIRST_FRAME_TARGET
+of launching the game (0.25 s), measured by the first_menu_frame case from
+a fresh interpreter. Importing the game must not load pygame, the audio
+synthesizer or anything else only some runs need - --imports lists every
+module an import loads, in the style of `python -X importtime`.
+
+Baselines in benchmarks_baseline.json are only comparable on the machine
+that recorded them - re-run --save after changing machines.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+
+import audio_synth
+import Nothing_to_hide as game
+
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(GAME_DIR, "benchmarks_baseline.json")
+DEFAULT_THRESHOLD = 0.25  # Slowdown (as a fraction of the baseline) that counts as a regression
+FIRST_FRAME_TARGET = 0.25  # Seconds from launch to the first menu frame
+IMPORT_REPORT_TOP = 20  # Slowest imports listed by --imports
+
+SAMPLE_LINE = "Dr. Chen: Records about what's really up. What's actually up."
+SAMPLE_TEXT = "\n".join([SAMPLE_LINE] * 8)
+SESSION_SEED = 1984
+
+# Event loop for the coroutine cases, so each call doesn't pay for asyncio.run()
+loop = asyncio.new_event_loop()
+
+# Run in a fresh interpreter: play headless until the menu prompt, which has
+# no scripted answer, then signal that the first frame is on screen
+FIRST_FRAME_SCRIPT = """
+import sys
+import Nothing_to_hide as game
+try:
+    game.play_headless([])
+except EOFError:
+    pass
+sys.stdout.write("drawn")
+sys.stdout.flush()
+"""
+
+def good_ending_answers(prompt):
+    """Script for the longest playthrough: spare the rebels, pass, share the truth"""
+    if "judgment" in prompt:
+        return "2"
+    if "your answer" in prompt:
+        return "2"
+    if "your choice" in prompt:
+        return "1"
+    return ""
+
+# ============================================================================
+# CASES
+# ============================================================================
+
+def bench_center_in_terminal():
+    game.center_in_terminal(SAMPLE_LINE)
+
+def bench_print_bordered():
+    game.print_bordered(SAMPLE_TEXT)
+
+def bench_slow_print():
+    loop.run_until_complete(game.slow_print(SAMPLE_TEXT, delay=0))
+
+def bench_display_conversation():
+    loop.run_until_complete(game.display_conversation(game.CONVERSATIONS.get(1)))
+
+def bench_play_typing_sound():
+    game.play_typing_sound()
+
+def bench_create_menu_music():
+    game.create_menu_music()
+
+def bench_create_ambient_sound():
+    game.create_ambient_sound()
+
+def bench_render_menu_loop():
+    audio_synth.render_menu_loop()
+
+def bench_render_ambient_loop():
+    audio_synth.render_ambient_loop()
+
+def bench_headless_session():
+    game.play_headless(good_ending_answers, seed=SESSION_SEED)
+
+def bench_first_menu_frame():
+    with subprocess.Popen([sys.executable, "-c", FIRST_FRAME_SCRIPT], cwd=GAME_DIR,
+                          stdout=subprocess.PIPE) as process:
+        process.stdout.read(1)  # Timed until the first frame, not interpreter shutdown
+
+# (name, function, mode) - modes:
+#   headless  inside a headless session, animations skipped
+#   animated  inside a headless session, animations play (with zero delay)
+#   sound     real audio, skipped when pygame is unavailable
+#   plain     no setup
+CASES = [
+    ("center_in_terminal", bench_center_in_terminal, "headless"),
+    ("print_bordered", bench_print_bordered, "headless"),
+    ("slow_print", bench_slow_print, "animated"),
+    ("display_conversation", bench_display_conversation, "headless"),
+    ("play_typing_sound", bench_play_typing_sound, "sound"),
+    ("create_menu_music", bench_create_menu_music, "sound"),
+    ("create_ambient_sound", bench_create_ambient_sound, "sound"),
+    ("render_menu_loop", bench_render_menu_loop, "plain"),
+    ("render_ambient_loop", bench_render_ambient_loop, "plain"),
+    ("headless_session", bench_headless_session, "plain"),
+    ("first_menu_frame", bench_first_menu_frame, "plain"),
+]
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def measure(func, repeat):
+    """Best time per call, in seconds"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+def run_case(func, mode, repeat):
+    """Time one case - None if it can't run here"""
+    if mode == "sound":
+        if not game.get_mixer():
+            return None
+        game.typing_sounds.load()
+        return measure(func, repeat)
+    if mode in ("headless", "animated"):
+        with game.headless_session(skip=(mode == "headless")):
+            return measure(func, repeat)
+    return measure(func, repeat)
+
+def run(names, repeat):
+    """Run the selected cases - returns {name: seconds per call or None}"""
+    results = {}
+    for name, func, mode in CASES:
+        if name in names:
+            results[name] = run_case(func, mode, repeat)
+    return results
+
+def import_times(module="Nothing_to_hide"):
+    """[(self us, cumulative us, name)] for every module a fresh import loads, from -X importtime
+
+    Names keep their indentation, which shows what imported them.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=GAME_DIR, capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[0].strip().isdigit():
+            rows.append((int(fields[0]), int(fields[1]), fields[2].rstrip()))
+    return rows
+
+def print_import_report(repeat, top=IMPORT_REPORT_TOP):
+    """Slowest imports of the game and the time to its first menu frame, against the target"""
+    rows = import_times()
+    total = rows[-1][1] if rows else 0  # The game module itself comes last
+    print(f"Importing the game: {format_time(total / 1e6)}")
+    print(f"import time: {'self [us]':>9} | {'cumulative':>10} | imported package")
+    for self_us, cumulative, name in sorted(rows, key=lambda row: row[1], reverse=True)[:top]:
+        print(f"import time: {self_us:>9} | {cumulative:>10} | {name}")
+    print()
+    first_frame = measure(bench_first_menu_frame, repeat)
+    verdict = "within" if first_frame <= FIRST_FRAME_TARGET else "OVER"
+    print(f"First menu frame: {format_time(first_frame)} from launch "
+          f"({verdict} the {format_time(FIRST_FRAME_TARGET)} target)")
+    return first_frame <= FIRST_FRAME_TARGET
+
+def format_time(seconds):
+    if seconds is None:
+        return "skipped"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)
+
+def save_baseline(path, results):
+    baseline = {
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "backend": audio_synth.backend_name(),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+def compare(results, baseline, threshold):
+    """Print current results against the baseline - returns the regressed case names"""
+    regressions = []
+    print(f"{'case':<24}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name, current in results.items():
+        before = baseline["results"].get(name)
+        change, flag = "-", ""
+        if current is not None and before is not None:
+            ratio = current / before
+            change = f"{ratio - 1:+.0%}"
+            if ratio > 1 + threshold:
+                regressions.append(name)
+                flag = "  REGRESSION"
+        print(f"{name:<24}{format_time(before):>12}{format_time(current):>12}{change:>10}{flag}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks for Nothing is U.P")
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="compare against the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"slowdown that fails --compare (default {DEFAULT_THRESHOLD:.0%})")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--imports", action="store_true",
+                        help="report import times and time to the first menu frame, then exit")
+    args = parser.parse_args()
+
+    if args.imports:
+        sys.exit(0 if print_import_report(args.repeat) else 1)
+
+    names = [name for name, _, _ in CASES if args.filter in name]
+    results = run(names, args.repeat)
+
+    if args.compare:
+        regressions = compare(results, load_baseline(args.baseline), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+    else:
+        print(f"{'case':<24}{'best':>12}")
+        for name, seconds in results.items():
+            print(f"{name:<24}{format_time(seconds):>12}")
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"\nBaseline written to {args.baseline}")
+
+if __name__ == "__main__":
+    main()
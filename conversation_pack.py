@@ -0,0 +1,339 @@
+"""Conversation pack files - large conversation libraries read through mmap
+
+A pack is one binary file:
+
+    header      magic, version, role count, conversation count, records offset
+    role table  per role: name, start and count of its slice of the positions
+    secret table  the same for has_secret False and True
+    index       per conversation, sorted by id: id, role, has_secret and the
+                offset and length of its record
+    positions   index positions grouped by role, then by has_secret
+    records     one compact JSON record per conversation: participants,
+                messages and secret
+
+Opening a pack maps the file and reads only the header and the small role
+table. Lookups binary-search the index in place, and a conversation's
+participants and messages are decoded only when something reads them, so
+resident memory stays flat however many conversations a pack holds.
+
+    python conversation_pack.py build OUT.pack [SOURCE.json]
+    python conversation_pack.py info PACK
+
+build without a source exports the game's built-in conversations. A JSON
+source is a list of conversation objects shaped like the built-in ones
+(assets/conversations.json is one), each with an optional "role". Without
+it, an entry gets the role the game gives its id - rebels 1-3, follow-ups
+4-6 and so on.
+"""
+
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from collections.abc import Sequence
+
+MAGIC = b"NUPCONV\0"
+VERSION = 1
+
+HEADER = struct.Struct("<8sHHIQ")  # magic, version, role count, conversation count, records offset
+GROUP = struct.Struct("<II")  # start, count in the positions array
+ROLE = struct.Struct("<16sII")  # name, then a GROUP
+INDEX_ENTRY = struct.Struct("<IBBHQI")  # id, role number, has_secret, reserved, record offset, record length
+POSITION = struct.Struct("<I")
+
+USAGE = """usage: python conversation_pack.py build OUT.pack [SOURCE.json]
+       python conversation_pack.py info PACK"""
+
+class PackError(ValueError):
+    """The file is not a conversation pack this version can read"""
+
+class PackedConversation:
+    """A conversation in a pack - id, role and has_secret come from the index,
+    the rest is decoded from the record on first use"""
+    __slots__ = ('id', 'role', 'has_secret', '_pack', '_offset', '_length', '_record')
+
+    def __init__(self, pack, conv_id, role, has_secret, offset, length):
+        self.id = conv_id
+        self.role = role
+        self.has_secret = has_secret
+        self._pack = pack
+        self._offset = offset
+        self._length = length
+        self._record = None
+
+    def _decode(self):
+        if self._record is None:
+            self._record = self._pack.read_record(self._offset, self._length)
+        return self._record
+
+    @property
+    def participants(self):
+        return tuple(self._decode()["participants"])
+
+    @property
+    def messages(self):
+        return tuple(tuple(message) for message in self._decode()["messages"])
+
+    @property
+    def secret(self):
+        return self._decode().get("secret")
+
+    def __repr__(self):
+        return f"PackedConversation(id={self.id}, role={self.role!r}, has_secret={self.has_secret})"
+
+class PackView(Sequence):
+    """A role's or has_secret's conversations, read from the positions array on demand"""
+    __slots__ = ('pack', 'start', 'count')
+
+    def __init__(self, pack, start, count):
+        self.pack = pack
+        self.start = start
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.count))]
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("pack view index out of range")
+        return self.pack.conversation_at(self.pack.position(self.start + i))
+
+class PackStore:
+    """Read-only conversation store backed by a memory-mapped pack file
+
+    Has the same lookups as the game's ConversationStore: get(), role(),
+    with_secret(), len(), iteration and `in`.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            try:
+                self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise PackError(f"{path} is empty") from None
+        if hasattr(self.map, 'madvise'):
+            # Lookups jump around the file - don't read ahead of them
+            self.map.madvise(mmap.MADV_RANDOM)
+        try:
+            self._read_header()
+        except (PackError, struct.error) as e:
+            self.map.close()
+            raise PackError(f"{path}: {e}") from None
+
+    def _read_header(self):
+        if len(self.map) < HEADER.size:
+            raise PackError("file is too short")
+        magic, version, role_count, self.count, self.records_offset = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            raise PackError("not a conversation pack")
+        if version != VERSION:
+            raise PackError(f"pack version {version}, expected {VERSION}")
+
+        offset = HEADER.size
+        self.role_names = []
+        self.roles = {}
+        for _ in range(role_count):
+            name, start, count = ROLE.unpack_from(self.map, offset)
+            name = name.rstrip(b"\0").decode()
+            self.role_names.append(name)
+            self.roles[name] = (start, count)
+            offset += ROLE.size
+        self.secret_groups = {}
+        for flag in (False, True):
+            self.secret_groups[flag] = GROUP.unpack_from(self.map, offset)
+            offset += GROUP.size
+        self.index_offset = offset
+        self.positions_offset = offset + self.count * INDEX_ENTRY.size
+        if self.positions_offset + 2 * self.count * POSITION.size > self.records_offset:
+            raise PackError("index overlaps the records")
+
+    def close(self):
+        self.map.close()
+
+    # Index access
+
+    def _entry(self, position):
+        return INDEX_ENTRY.unpack_from(self.map, self.index_offset + position * INDEX_ENTRY.size)
+
+    def _id_at(self, position):
+        return self._entry(position)[0]
+
+    def position(self, i):
+        """Index position stored at slot i of the positions array"""
+        return POSITION.unpack_from(self.map, self.positions_offset + i * POSITION.size)[0]
+
+    def conversation_at(self, position):
+        conv_id, role, has_secret, _, offset, length = self._entry(position)
+        return PackedConversation(self, conv_id, self.role_names[role], bool(has_secret), offset, length)
+
+    def read_record(self, offset, length):
+        return json.loads(self.map[offset:offset + length])
+
+    # ConversationStore interface
+
+    def _find(self, conv_id):
+        position = bisect.bisect_left(_IdIndex(self), conv_id)
+        if position < self.count and self._id_at(position) == conv_id:
+            return position
+        return None
+
+    def get(self, conv_id):
+        """Conversation by id - KeyError if there is none"""
+        position = self._find(conv_id)
+        if position is None:
+            raise KeyError(conv_id)
+        return self.conversation_at(position)
+
+    def role(self, role):
+        """Every conversation with the given role, in id order"""
+        start, count = self.roles.get(role, (0, 0))
+        return PackView(self, start, count)
+
+    def with_secret(self, has_secret=True):
+        """Every conversation that does (or doesn't) hide something"""
+        start, count = self.secret_groups[bool(has_secret)]
+        return PackView(self, start, count)
+
+    def __contains__(self, conv_id):
+        return self._find(conv_id) is not None
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for position in range(self.count):
+            yield self.conversation_at(position)
+
+class _IdIndex:
+    """The index's ids as a sequence, for bisect"""
+    __slots__ = ('pack',)
+
+    def __init__(self, pack):
+        self.pack = pack
+
+    def __len__(self):
+        return self.pack.count
+
+    def __getitem__(self, position):
+        return self.pack._id_at(position)
+
+# ============================================================================
+# WRITING PACKS
+# ============================================================================
+
+def _encode_record(conv):
+    record = {
+        "participants": list(conv.participants),
+        "messages": [list(message) for message in conv.messages],
+        "secret": conv.secret,
+    }
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode()
+
+def write_pack(path, conversations):
+    """Write conversations (anything with the Conversation attributes) as a pack
+
+    Written through a temp file and renamed, so readers never see a partial pack.
+    """
+    conversations = sorted(conversations, key=lambda conv: conv.id)
+    for previous, conv in zip(conversations, conversations[1:]):
+        if previous.id == conv.id:
+            raise ValueError(f"Duplicate conversation id {conv.id}")
+
+    role_names = []
+    for conv in conversations:
+        if conv.role not in role_names:
+            role_names.append(conv.role)
+    role_numbers = {name: number for number, name in enumerate(role_names)}
+    if len(role_names) > 255:
+        raise ValueError("A pack holds at most 255 roles")
+
+    # Positions grouped by role, then by has_secret
+    by_role = [[] for _ in role_names]
+    by_secret = {False: [], True: []}
+    for position, conv in enumerate(conversations):
+        by_role[role_numbers[conv.role]].append(position)
+        by_secret[bool(conv.has_secret)].append(position)
+
+    count = len(conversations)
+    index_offset = HEADER.size + len(role_names) * ROLE.size + 2 * GROUP.size
+    positions_offset = index_offset + count * INDEX_ENTRY.size
+    records_offset = positions_offset + 2 * count * POSITION.size
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            # Records first, streamed, so large libraries are never held encoded in memory
+            f.seek(records_offset)
+            entries = []
+            offset = records_offset
+            for conv in conversations:
+                record = _encode_record(conv)
+                f.write(record)
+                entries.append(INDEX_ENTRY.pack(conv.id, role_numbers[conv.role], bool(conv.has_secret),
+                                                0, offset, len(record)))
+                offset += len(record)
+
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, len(role_names), count, records_offset))
+            start = 0
+            for name, positions in zip(role_names, by_role):
+                f.write(ROLE.pack(name.encode(), start, len(positions)))
+                start += len(positions)
+            for flag in (False, True):
+                f.write(GROUP.pack(start, len(by_secret[flag])))
+                start += len(by_secret[flag])
+            f.write(b"".join(entries))
+            for positions in by_role + [by_secret[False], by_secret[True]]:
+                f.write(b"".join(POSITION.pack(position) for position in positions))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def _load_json_source(path, record_type, default_role):
+    """Conversations from a JSON source - entries without a role get default_role(entry)"""
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)
+    return [record_type(entry["id"], entry["participants"], entry["messages"], entry["has_secret"],
+                        entry.get("secret"), entry.get("role") or default_role(entry))
+            for entry in entries]
+
+def main(argv):
+    if len(argv) >= 2 and argv[0] == "build":
+        import Nothing_to_hide as game
+        if len(argv) > 2:
+            conversations = _load_json_source(argv[2], game.Conversation, game.conversation_role)
+        else:
+            conversations = list(game.CONVERSATIONS)
+        write_pack(argv[1], conversations)
+        print(f"Wrote {len(conversations)} conversations to {argv[1]} ({os.path.getsize(argv[1]):,} bytes)")
+    elif len(argv) == 2 and argv[0] == "info":
+        pack = PackStore(argv[1])
+        print(f"{argv[1]}: {len(pack)} conversations, version {VERSION}")
+        for name in pack.role_names:
+            print(f"  {name:<12}{len(pack.role(name)):>10}")
+        print(f"  {'has_secret':<12}{len(pack.with_secret()):>10}")
+        pack.close()
+    else:
+        print(USAGE)
+        sys.exit(2)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,188 @@
+"""Judgment logs - every judgment a player makes, as fixed-width binary records
+
+A log is one append-only file:
+
+    header   magic, version and record size
+    records  one per judgment: session id, time, conversation id, decision
+             latency, day, verdict and whether it was correct
+
+Records are packed into an in-memory buffer and a writer thread appends
+the buffer every LOG_FLUSH_INTERVAL seconds, or sooner once it holds
+LOG_FLUSH_RECORDS records. fsync runs at most every LOG_FSYNC_INTERVAL
+seconds, and on close. A judgment therefore costs the game one struct
+pack under a lock - no system call - however many sessions share the log.
+Logs are opened in append mode, so several processes can share one file.
+Each flush is a single write of whole records, made under an exclusive
+file lock where the platform has one. A crash can still leave a torn last
+record. Readers ignore it, and the next JudgmentLog to open the file cuts
+it off before appending, so later records stay aligned.
+
+analytics.py aggregates any number of logs into per-conversation tables.
+"""
+
+import contextlib
+import os
+import struct
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows - no advisory locks, appends are still whole records
+    fcntl = None
+
+MAGIC = b"NUPJLOG\0"
+VERSION = 1
+
+HEADER = struct.Struct("<8sHH4x")  # magic, version, record size
+# session id, unix time in ms, conversation id, latency in ms, day, flagged, correct
+RECORD = struct.Struct("<QQIIBBB5x")
+
+LOG_FLUSH_RECORDS = 256  # Buffered records that trigger an early flush
+LOG_FLUSH_INTERVAL = 1.0  # Seconds between flushes
+LOG_FSYNC_INTERVAL = 5.0  # Seconds between fsyncs
+
+class LogError(ValueError):
+    """The file is not a judgment log this version can read"""
+
+def _check_header(data, path):
+    if len(data) < HEADER.size:
+        raise LogError(f"{path}: file is too short")
+    magic, version, record_size = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise LogError(f"{path}: not a judgment log")
+    if version != VERSION or record_size != RECORD.size:
+        raise LogError(f"{path}: log version {version}, expected {VERSION}")
+
+@contextlib.contextmanager
+def _locked(fd):
+    """Hold an exclusive lock on the whole file, where the platform has one"""
+    if fcntl is None:
+        yield
+        return
+    fcntl.lockf(fd, fcntl.LOCK_EX, 0, 0, os.SEEK_SET)
+    try:
+        yield
+    finally:
+        fcntl.lockf(fd, fcntl.LOCK_UN, 0, 0, os.SEEK_SET)
+
+def _whole_records(size):
+    """File size with any torn last record cut off"""
+    return HEADER.size + max(size - HEADER.size, 0) // RECORD.size * RECORD.size
+
+def _create(path):
+    """Create the log with its header, unless it already exists
+
+    The header is written to a temp file that is then linked into place, so
+    a log never appears without its header, even with several processes
+    starting at once.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.link(tmp_path, path)
+        except FileExistsError:
+            pass
+    finally:
+        os.remove(tmp_path)
+
+class JudgmentLog:
+    """Appends judgment records to a log file from a background thread"""
+    def __init__(self, path, flush_records=LOG_FLUSH_RECORDS, flush_interval=LOG_FLUSH_INTERVAL,
+                 fsync_interval=LOG_FSYNC_INTERVAL):
+        self.path = path
+        self.flush_records = flush_records
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        if not os.path.exists(path):
+            _create(path)
+        with open(path, 'rb') as f:
+            _check_header(f.read(HEADER.size), path)
+        self.fd = os.open(path, os.O_WRONLY | os.O_APPEND | getattr(os, 'O_BINARY', 0))
+        try:
+            with _locked(self.fd):
+                size = os.fstat(self.fd).st_size
+                if size != _whole_records(size):
+                    os.ftruncate(self.fd, _whole_records(size))  # Torn by a crash
+        except OSError:
+            os.close(self.fd)
+            raise
+        self.buffer = bytearray()
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.closed = False
+        self.unsynced = False
+        self.synced_at = time.monotonic()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def record(self, session_id, conv_id, day, flagged, correct, latency):
+        """Log one judgment - latency in seconds. Never blocks on the disk."""
+        record = RECORD.pack(session_id, int(time.time() * 1000), conv_id,
+                             min(int(latency * 1000), 0xFFFFFFFF), day, bool(flagged), bool(correct))
+        with self.lock:
+            self.buffer += record
+            full = len(self.buffer) >= self.flush_records * RECORD.size
+        if full:
+            self.wakeup.set()
+
+    def _run(self):
+        while not self.closed:
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            try:
+                self.flush()
+            except OSError as e:
+                print(f"[WARNING] Could not write judgment log: {e}")
+
+    def flush(self, sync=False):
+        """Append the buffered records, and fsync if it is time to (or `sync`)"""
+        with self.lock:
+            data, self.buffer = self.buffer, bytearray()
+        if data:
+            with _locked(self.fd):
+                size = os.fstat(self.fd).st_size
+                written = os.write(self.fd, data)
+                if written != len(data):
+                    # Never leave part of a record for the next append to land after
+                    os.ftruncate(self.fd, size)
+                    raise OSError(f"short write to {self.path}: {written} of {len(data)} bytes")
+            self.unsynced = True
+        if self.unsynced and (sync or time.monotonic() - self.synced_at >= self.fsync_interval):
+            os.fsync(self.fd)
+            self.unsynced = False
+            self.synced_at = time.monotonic()
+
+    def close(self):
+        """Write and fsync everything logged so far"""
+        if self.closed:
+            return
+        self.closed = True
+        self.wakeup.set()
+        self.thread.join()
+        try:
+            self.flush(sync=True)
+        finally:
+            os.close(self.fd)
+
+def record_count(path):
+    """Number of complete records in a log - LogError if it isn't one"""
+    with open(path, 'rb') as f:
+        _check_header(f.read(HEADER.size), path)
+        size = os.fstat(f.fileno()).st_size
+    return (size - HEADER.size) // RECORD.size
+
+def read_records(path):
+    """Every complete record in a log, as tuples in RECORD field order"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    _check_header(data, path)
+    end = _whole_records(len(data))
+    return list(RECORD.iter_unpack(memoryview(data)[HEADER.size:end]))
@@ -0,0 +1,273 @@
+"""Host Nothing is U.P for many players from one process
+
+Every connection - TCP or a Unix socket, telnet or a raw client - plays its
+own game on a single asyncio event loop. A session is two tasks and a
+GameSession: a RemoteKeyboard fed from the socket, a Terminal writing to it
+and a FixedGeometry sized by the client. It is the current session for that
+connection's tasks only, so hosted games never see each other's screen or
+keys. Nothing is played through the server's speakers and nothing is saved,
+but every judgment goes to a shared judgment log (see judgment_log.py).
+
+    python server.py [--host HOST] [--port N] [--unix PATH] [--max-sessions N]
+                     [--pack FILE] [--log FILE | --no-log]
+
+Connect with `telnet HOST 2323`. For a Unix socket, use a client that sends
+keys as they are typed, such as `socat -,rawer UNIX-CONNECT:PATH`.
+"""
+
+import argparse
+import asyncio
+import codecs
+import os
+import socket
+
+import judgment_log
+import Nothing_to_hide as game
+
+DEFAULT_PORT = 2323
+MAX_SESSIONS = 500
+READ_SIZE = 256  # Bytes read from a connection at a time - players type slowly
+DEFAULT_LOG = os.path.join(game.data_dir(), 'judgments.log')
+
+# Telnet commands and options
+IAC, DONT, DO, WONT, WILL, SB, SE = 255, 254, 253, 252, 251, 250, 240
+ECHO, SGA, NAWS = 1, 3, 31
+
+# We echo, take keys one at a time and want to hear about the window size
+NEGOTIATION = bytes([IAC, WILL, ECHO, IAC, WILL, SGA, IAC, DO, NAWS])
+
+# ============================================================================
+# CONNECTION I/O
+# ============================================================================
+
+class TelnetParser:
+    """Splits a telnet byte stream into typed text and window sizes
+
+    Commands and option negotiation are dropped, except the NAWS
+    subnegotiation reporting the client's window size. Enter arrives as
+    CR LF or CR NUL and is passed on as a single CR. Raw clients never send
+    IAC, so their bytes go straight through.
+    """
+    def __init__(self):
+        self.state = 'data'
+        self.sub = bytearray()  # Subnegotiation being read
+        self.after_cr = False
+        self.decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+
+    def feed(self, data):
+        """Returns (typed text, (columns, lines) or None)"""
+        text = bytearray()
+        size = None
+        for byte in data:
+            if self.state == 'data':
+                if byte == IAC:
+                    self.state = 'iac'
+                elif self.after_cr and byte in (0, 10):
+                    self.after_cr = False
+                else:
+                    self.after_cr = byte == 13
+                    text.append(byte)
+            elif self.state == 'iac':
+                if byte == IAC:  # Escaped 255
+                    text.append(byte)
+                    self.state = 'data'
+                elif byte in (WILL, WONT, DO, DONT):
+                    self.state = 'option'
+                elif byte == SB:
+                    self.sub.clear()
+                    self.state = 'sub'
+                else:
+                    self.state = 'data'
+            elif self.state == 'option':
+                self.state = 'data'
+            elif self.state == 'sub':
+                if byte == IAC:
+                    self.state = 'sub_iac'
+                else:
+                    self.sub.append(byte)
+            elif self.state == 'sub_iac':
+                if byte == SE:
+                    size = self._window_size() or size
+                    self.state = 'data'
+                else:
+                    self.sub.append(byte)
+                    self.state = 'sub'
+        return self.decoder.decode(bytes(text)), size
+
+    def _window_size(self):
+        if len(self.sub) >= 5 and self.sub[0] == NAWS:
+            columns = self.sub[1] << 8 | self.sub[2]
+            lines = self.sub[3] << 8 | self.sub[4]
+            if columns and lines:
+                return columns, lines
+        return None
+
+class SocketStream:
+    """Text stream onto a connection, for game.Terminal to write to"""
+    def __init__(self, writer):
+        self.writer = writer
+
+    def write(self, text):
+        if not self.writer.is_closing():
+            # No terminal driver on the other end to turn LF into CR LF
+            self.writer.write(text.replace('\n', '\r\n').encode('utf-8'))
+
+    def flush(self):
+        pass  # The transport sends as soon as the socket takes it
+
+class RemoteKeyboard(game.KeyboardHandler):
+    """KeyboardHandler fed by a connection instead of a reader thread
+
+    Line editing, echo and the S skip key all work as they do locally.
+    Before every prompt and animation sleep it waits for the client to
+    drain its output, so a slow client never piles up screens in memory.
+    """
+    def __init__(self, writer):
+        super().__init__()
+        self.writer = writer
+        self.interactive = True
+        # Ready before the game starts, for keys typed while it loads
+        self.skip_wakeup = asyncio.Event()
+        self.lines = asyncio.Queue()
+
+    def start(self):
+        self.loop = asyncio.get_running_loop()
+
+    def stop(self):
+        pass
+
+    def feed(self, text):
+        """Handle typed text - returns False if the player pressed Ctrl+C to leave"""
+        for key in text:
+            if key == '\x03':
+                return False
+            self._handle_key(key)
+        return True
+
+    def _post(self, callback, *args):
+        callback(*args)  # Keys are fed on the event loop already
+
+    async def read_line(self, prompt=""):
+        await self.writer.drain()
+        return await super().read_line(prompt)
+
+    async def wait_for_skip(self, timeout):
+        await self.writer.drain()
+        await super().wait_for_skip(timeout)
+
+# ============================================================================
+# SESSIONS
+# ============================================================================
+
+async def run_session(reader, writer, log=None):
+    """Play one game over a connection - returns the ending, or None if the player left"""
+    # TERM_WIDTH x 24 until the client reports its window size
+    session = game.GameSession(RemoteKeyboard(writer), game.Terminal(SocketStream(writer)),
+                               game.FixedGeometry(), judgment_log=log)
+    telnet = TelnetParser()
+    writer.write(NEGOTIATION)
+
+    # Both tasks run in the session - the game draws through it, and the
+    # pump echoes keys and redraws on resize through it
+    with game.session_scope(session):
+        play = asyncio.create_task(game.play_game())
+
+        async def pump():
+            try:
+                while True:
+                    data = await reader.read(READ_SIZE)
+                    text, size = telnet.feed(data)
+                    if size:
+                        session.geometry.resize(*size)
+                    if not data or not session.keyboard.feed(text):
+                        break
+            except ConnectionError:
+                pass
+            play.cancel()  # The player hung up
+
+        pumping = asyncio.create_task(pump())
+    try:
+        await asyncio.wait({play})
+    finally:
+        pumping.cancel()
+        play.cancel()
+    if play.cancelled():
+        return None
+    error = play.exception()
+    if error is None:
+        return play.result()
+    if not isinstance(error, (EOFError, ConnectionError)):
+        raise error
+    return None
+
+class Server:
+    """Accepts players up to max_sessions and runs a session for each"""
+    def __init__(self, max_sessions=MAX_SESSIONS, log=None):
+        self.max_sessions = max_sessions
+        self.log = log  # JudgmentLog every session writes to
+        self.sessions = 0
+
+    async def handle(self, reader, writer):
+        if self.sessions >= self.max_sessions:
+            writer.write(b"Every terminal is taken. Try again later.\r\n")
+            writer.close()
+            return
+        self.sessions += 1
+        try:
+            await run_session(reader, writer, self.log)
+        except asyncio.CancelledError:
+            pass  # Server shutting down - asyncio would report every open session as an error
+        except Exception as e:
+            print(f"[WARNING] Session from {writer.get_extra_info('peername')} failed: {e!r}")
+        finally:
+            self.sessions -= 1
+            writer.close()
+
+async def serve(host="127.0.0.1", port=DEFAULT_PORT, unix_path=None, max_sessions=MAX_SESSIONS, log=None):
+    """Accept players until cancelled"""
+    server = Server(max_sessions, log)
+    backlog = min(max_sessions, socket.SOMAXCONN)
+    if unix_path:
+        listener = await asyncio.start_unix_server(server.handle, unix_path, backlog=backlog)
+        where = unix_path
+    else:
+        listener = await asyncio.start_server(server.handle, host, port, backlog=backlog)
+        where = ", ".join(f"{sock.getsockname()[0]}:{sock.getsockname()[1]}" for sock in listener.sockets)
+    print(f"Serving Nothing is U.P on {where} (up to {max_sessions} players)")
+    async with listener:
+        await listener.serve_forever()
+
+def main():
+    parser = argparse.ArgumentParser(description="Host Nothing is U.P for many players")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", default=None, metavar="PATH", help="listen on a Unix socket instead")
+    parser.add_argument("--max-sessions", type=int, default=MAX_SESSIONS)
+    parser.add_argument("--pack", default=os.environ.get(game.PACK_ENV),
+                        help="play with a conversation pack file")
+    parser.add_argument("--log", default=os.environ.get(game.LOG_ENV) or DEFAULT_LOG,
+                        help=f"judgment log to append to (default: {DEFAULT_LOG})")
+    parser.add_argument("--no-log", action="store_true", help="don't log judgments")
+    args = parser.parse_args()
+
+    if args.pack:
+        try:
+            game.use_conversation_pack(args.pack)
+        except (OSError, ValueError) as e:
+            parser.error(f"Could not load conversation pack: {e}")
+    log = None
+    if not args.no_log:
+        try:
+            log = judgment_log.JudgmentLog(args.log)
+        except (OSError, ValueError) as e:
+            parser.error(f"Could not open judgment log: {e}")
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.max_sessions, log))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if log:
+            log.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""Monte Carlo playthroughs of Nothing is U.P
+
+Plays the branching logic of the game - days 1-6, the rebel follow-ups,
+the day 7 interrogation and the endings - with no terminal, sound or
+delays, using the same dealing and day planning as the real game. Games
+are split into fixed-size chunks and spread over a multiprocessing pool.
+Each worker returns only its histograms, which are merged in the parent.
+
+A player policy decides every judgment, interrogation answer and the final
+choice. Built-in policies are listed in POLICIES. Others can be given as
+module:Class, naming a Policy subclass.
+
+    python simulator.py [--policy NAME] [--games N] [--workers N] [--seed N] [--pack FILE]
+"""
+
+import argparse
+import importlib
+import multiprocessing
+import os
+import random
+import time
+
+import Nothing_to_hide as game
+
+MAX_SCORE = game.WORK_DAYS * game.CONVERSATIONS_PER_DAY
+ENDINGS = ("evaluation", "caught", "good", "silence")
+CHUNK_SIZE = 10000  # Games per task - fixed so results don't depend on worker count
+
+# ============================================================================
+# PLAYER POLICIES
+# ============================================================================
+
+class Policy:
+    """A simulated player - subclasses decide judge(), the rest defaults to chance"""
+    name = "policy"
+
+    def judge(self, conv, rng):
+        """True to flag the conversation as treasonous"""
+        raise NotImplementedError
+
+    def answer(self, question, rng):
+        """Option number picked for a day 7 interrogation question"""
+        return rng.randint(1, len(question["options"]))
+
+    def share_truth(self, rng):
+        """True to tell the rebels the truth at the final choice"""
+        return rng.random() < 0.5
+
+class AlwaysFlag(Policy):
+    """Reports every conversation"""
+    name = "always-flag"
+
+    def judge(self, conv, rng):
+        return True
+
+class RandomPlayer(Policy):
+    """Flips a coin for every judgment"""
+    name = "random"
+
+    def judge(self, conv, rng):
+        return rng.random() < 0.5
+
+class FlagSecrets(Policy):
+    """Flags exactly the conversations that hide something"""
+    name = "flag-secrets"
+
+    def judge(self, conv, rng):
+        return conv.has_secret
+
+class SpareRebels(Policy):
+    """Judges perfectly, except that rebel conversations 1-3 are always cleared"""
+    name = "spare-rebels"
+
+    def judge(self, conv, rng):
+        if conv.role == game.ROLE_REBEL:
+            return False
+        return conv.has_secret
+
+POLICIES = {cls.name: cls for cls in (AlwaysFlag, RandomPlayer, FlagSecrets, SpareRebels)}
+
+def load_policy(spec):
+    """Policy from a built-in name or a module:Class path"""
+    if spec in POLICIES:
+        return POLICIES[spec]()
+    if ':' not in spec:
+        raise ValueError(f"Unknown policy {spec!r} - choose from {', '.join(POLICIES)} or use module:Class")
+    module_name, class_name = spec.split(':', 1)
+    return getattr(importlib.import_module(module_name), class_name)()
+
+# ============================================================================
+# SIMULATION
+# ============================================================================
+
+def play_game(policy, rng):
+    """Play one game - returns (ending, total_score, passed_interrogation or None)
+
+    Days are dealt, scored and tracked by the game's own Progress and
+    DayScheduler, exactly as run_game() drives them.
+    """
+    progress = game.Progress(game.DayScheduler(seed=rng.getrandbits(64)))
+    for day in range(progress.day, progress.scheduler.days + 1):
+        progress.start_day(day)
+        while progress.index < len(progress.day_conversations):
+            conv = progress.day_conversations[progress.index]
+            player_judgment = policy.judge(conv, rng)
+            progress.judged(conv, player_judgment, player_judgment == conv.has_secret)
+
+    if not any(progress.helped_rebels.values()):
+        return "evaluation", progress.total_score, None
+
+    score = 0
+    for q in game.AGENT_QUESTIONS:
+        if policy.answer(q, rng) == q["correct"]:
+            score += 1
+    if score < game.INTERROGATION_PASS_SCORE:
+        return "caught", progress.total_score, False
+
+    ending = "good" if policy.share_truth(rng) else "silence"
+    return ending, progress.total_score, True
+
+class Tally:
+    """Histograms for a batch of games - small enough to send between processes"""
+    def __init__(self):
+        self.games = 0
+        self.endings = dict.fromkeys(ENDINGS, 0)
+        self.scores = [0] * (MAX_SCORE + 1)  # Games per total_score
+        self.interrogations = 0
+        self.passed = 0
+
+    def add(self, ending, total_score, passed):
+        self.games += 1
+        self.endings[ending] += 1
+        self.scores[total_score] += 1
+        if passed is not None:
+            self.interrogations += 1
+            if passed:
+                self.passed += 1
+
+    def merge(self, other):
+        self.games += other.games
+        for ending, count in other.endings.items():
+            self.endings[ending] += count
+        self.scores = [a + b for a, b in zip(self.scores, other.scores)]
+        self.interrogations += other.interrogations
+        self.passed += other.passed
+        return self
+
+    def mean_score(self):
+        return sum(score * count for score, count in enumerate(self.scores)) / max(self.games, 1)
+
+def _run_chunk(task):
+    """Worker: play one chunk of games with its own seeded generator"""
+    policy, seed, games = task
+    rng = random.Random(seed)
+    tally = Tally()
+    for _ in range(games):
+        tally.add(*play_game(policy, rng))
+    return tally
+
+def simulate(policy, games, workers=None, seed=None, chunk_size=CHUNK_SIZE, pack=None):
+    """Play `games` games across `workers` processes - returns the merged Tally
+
+    Every chunk gets a seed derived from `seed`, so a seeded run gives the
+    same histograms whatever the number of workers. `pack` plays with the
+    conversations of a conversation pack file - each worker maps it itself.
+    """
+    if isinstance(policy, str):
+        policy = load_policy(policy)
+    workers = workers or os.cpu_count() or 1
+    if seed is None:
+        seed = random.randrange(2**63)
+
+    tasks = []
+    for index, start in enumerate(range(0, games, chunk_size)):
+        tasks.append((policy, f"{seed}:{index}", min(chunk_size, games - start)))
+
+    total = Tally()
+    if workers == 1 or len(tasks) == 1:
+        if pack:
+            game.use_conversation_pack(pack)
+        for task in tasks:
+            total.merge(_run_chunk(task))
+        return total
+    initializer = game.use_conversation_pack if pack else None
+    with multiprocessing.Pool(min(workers, len(tasks)), initializer, (pack,) if pack else ()) as pool:
+        for tally in pool.imap_unordered(_run_chunk, tasks):
+            total.merge(tally)
+    return total
+
+def print_report(policy_name, tally, elapsed):
+    """Ending distribution, score histogram and interrogation pass rate"""
+    games = max(tally.games, 1)
+    print(f"Policy: {policy_name}  games: {tally.games:,}  "
+          f"time: {elapsed:.1f}s  ({tally.games / max(elapsed, 1e-9):,.0f} games/s)")
+    print()
+    print(f"{'ending':<12}{'games':>14}{'share':>10}")
+    for ending in ENDINGS:
+        count = tally.endings[ending]
+        print(f"{ending:<12}{count:>14,}{count / games:>9.1%}")
+    print()
+    if tally.interrogations:
+        print(f"Interrogation pass rate: {tally.passed / tally.interrogations:.1%} "
+              f"({tally.passed:,} of {tally.interrogations:,})")
+    else:
+        print("Interrogation pass rate: - (no game reached day 7)")
+    print()
+    print(f"total_score (mean {tally.mean_score():.2f} of {MAX_SCORE})")
+    peak = max(tally.scores) or 1
+    for score, count in enumerate(tally.scores):
+        if count:
+            print(f"{score:>4} {count:>12,} {'#' * max(1, round(40 * count / peak))}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo playthroughs of Nothing is U.P")
+    parser.add_argument("--policy", default="random",
+                        help=f"{', '.join(POLICIES)} or module:Class (default: random)")
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--workers", type=int, default=None, help="default: one per core")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--pack", default=None, help="play with a conversation pack file")
+    args = parser.parse_args()
+
+    policy = load_policy(args.policy)
+    start = time.perf_counter()
+    tally = simulate(policy, args.games, args.workers, args.seed, pack=args.pack)
+    print_report(args.policy, tally, time.perf_counter() - start)
+
+if __name__ == "__main__":
+    main()